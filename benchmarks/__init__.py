@@ -0,0 +1 @@
+# Benchmark suite of mininumpy, run with `python -m benchmarks` (see benchmarks/runner.py).
@@ -0,0 +1,169 @@
+# File with the benchmarked cases, each comparing a mininumpy operation against numpy's.
+from __future__ import annotations  # for typehinting within the module
+
+from math import isqrt
+
+import mininumpy as mnp
+
+try:
+	import numpy as np
+except ImportError:  # numpy is optional, only used for comparisons
+	np = None
+
+# registered cases, by name. Each one is a setup function receiving the number of elements, and
+# returning the benchmarked mininumpy function and its numpy counterpart (or None).
+CASES = {}
+
+
+def case(name: str):
+	"""
+	Decorator registering a setup function as the benchmark case name.
+	"""
+
+	def register(setup):
+		CASES[name] = setup
+		return setup
+
+	return register
+
+
+def _square_list(size: int) -> list[list[int]]:
+	"""
+	Returns a nested list of (about) size elements, with (about) as many rows as columns.
+	"""
+	side = max(isqrt(size), 1)
+	return [[row * side + column for column in range(side)] for row in range(size // side)]
+
+
+def _arrays(size: int, square: bool = False):
+	"""
+	Returns a 1-dimensional (or square 2-dimensional) array of size elements, for both
+	mininumpy and numpy (None if not installed).
+	"""
+	values = _square_list(size) if square else list(range(size))
+	return mnp.array(values), None if np is None else np.array(values)
+
+
+def _numpy(function):
+	"""
+	Returns function, unless numpy is not installed.
+	"""
+	return None if np is None else function
+
+
+# construction
+@case("construction.array")
+def _(size: int):
+	values = _square_list(size)
+	return lambda: mnp.array(values), _numpy(lambda: np.array(values))
+
+
+@case("construction.zeros")
+def _(size: int):
+	shape = (len(_square_list(size)), max(isqrt(size), 1))
+	return lambda: mnp.zeros(shape), _numpy(lambda: np.zeros(shape, dtype=int))
+
+
+@case("construction.arange")
+def _(size: int):
+	return lambda: mnp.arange(0, size, 1), _numpy(lambda: np.arange(0, size, 1))
+
+
+# elementwise operations
+@case("elementwise.add")
+def _(size: int):
+	a_mnp, a_np = _arrays(size)
+	return lambda: a_mnp + a_mnp, _numpy(lambda: a_np + a_np)
+
+
+@case("elementwise.multiply_scalar")
+def _(size: int):
+	a_mnp, a_np = _arrays(size)
+	return lambda: a_mnp * 2.5, _numpy(lambda: a_np * 2.5)
+
+
+@case("elementwise.exp")
+def _(size: int):
+	a_mnp, a_np = _arrays(size)
+	a_mnp, a_np = a_mnp / size, None if np is None else a_np / size
+	return lambda: mnp.exp(a_mnp), _numpy(lambda: np.exp(a_np))
+
+
+# broadcasting patterns
+@case("broadcast.row")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	row_mnp, row_np = a_mnp[0], None if np is None else a_np[0]
+	return lambda: a_mnp + row_mnp, _numpy(lambda: a_np + row_np)
+
+
+@case("broadcast.column")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	column_mnp, column_np = a_mnp[:, :1], None if np is None else a_np[:, :1]
+	return lambda: a_mnp + column_mnp, _numpy(lambda: a_np + column_np)
+
+
+@case("broadcast.outer")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	row_mnp, row_np = a_mnp[0], None if np is None else a_np[0]
+	column_mnp, column_np = a_mnp[:, :1], None if np is None else a_np[:, :1]
+	return lambda: column_mnp + row_mnp, _numpy(lambda: column_np + row_np)
+
+
+# reductions
+@case("reduction.sum")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.sum(), _numpy(lambda: a_np.sum())
+
+
+@case("reduction.sum_axis0")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.sum(axis=0), _numpy(lambda: a_np.sum(axis=0))
+
+
+@case("reduction.sum_axis1")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.sum(axis=1), _numpy(lambda: a_np.sum(axis=1))
+
+
+@case("reduction.max_axis0")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.max(axis=0), _numpy(lambda: a_np.max(axis=0))
+
+
+@case("reduction.mean_axis1")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.mean(axis=1), _numpy(lambda: a_np.mean(axis=1))
+
+
+# layout changes
+@case("layout.transpose")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.transpose(), _numpy(lambda: a_np.transpose())
+
+
+@case("layout.transpose_copy")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: a_mnp.T.copy(), _numpy(lambda: a_np.T.copy())
+
+
+@case("layout.reshape")
+def _(size: int):
+	a_mnp, a_np = _arrays(size)
+	return lambda: a_mnp.reshape((1, size)), _numpy(lambda: a_np.reshape((1, size)))
+
+
+# printing
+@case("printing.str")
+def _(size: int):
+	a_mnp, a_np = _arrays(size, square=True)
+	return lambda: str(a_mnp), _numpy(lambda: str(a_np))
@@ -0,0 +1,246 @@
+# File with the runner of the benchmark suite, timing every case against numpy and a baseline.
+from __future__ import annotations  # for typehinting within the module
+
+import argparse
+import fnmatch
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .cases import CASES
+
+DEFAULT_SIZES = (10, 1_000, 100_000)
+DEFAULT_BASELINE = os.path.join(".benchmarks", "baseline.json")
+# a case is flagged as a regression if it gets slower than its baseline by more than this factor,
+# or if its peak memory grows by more than it
+DEFAULT_THRESHOLD = 1.5
+# peak memory growths smaller than this (in bytes) are never flagged, as the peaks of the smallest
+# sizes vary by a few allocations between runs
+MEMORY_NOISE = 1 << 10
+
+
+def _time(function, min_time: float, repeat: int) -> float:
+	"""
+	Returns the best time (in seconds) of a call to function, over repeat measurements each
+	running it for at least min_time seconds.
+	"""
+	number = 1
+	while True:
+		start = time.perf_counter()
+		for _ in range(number):
+			function()
+		elapsed = time.perf_counter() - start
+		if elapsed >= min_time:
+			break
+		number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+	best = elapsed / number
+	gc_enabled = gc.isenabled()
+	gc.disable()
+	try:
+		for _ in range(repeat - 1):
+			start = time.perf_counter()
+			for _ in range(number):
+				function()
+			best = min(best, (time.perf_counter() - start) / number)
+	finally:
+		if gc_enabled:
+			gc.enable()
+	return best
+
+
+def _peak_memory(function) -> int:
+	"""
+	Returns the peak memory (in bytes) allocated during a call to function.
+	"""
+	tracemalloc.start()
+	try:
+		function()
+		return tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+
+def run(
+	patterns: list[str] | None = None,
+	sizes: tuple[int] = DEFAULT_SIZES,
+	min_time: float = 0.1,
+	repeat: int = 3,
+	compare_numpy: bool = True,
+) -> dict[str, dict]:
+	"""
+	Runs the cases whose names match any of the glob patterns (all of them if None), for every
+	size, and returns the results by key "name[size]".
+	"""
+	results = {}
+	for name, setup in CASES.items():
+		if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+			continue
+		for size in sizes:
+			mnp_function, np_function = setup(size)
+			mnp_time = _time(mnp_function, min_time, repeat)
+			result = {
+				"name": name,
+				"size": size,
+				"time": mnp_time,
+				"throughput": size / mnp_time,
+				"peak_memory": _peak_memory(mnp_function),
+			}
+			if compare_numpy and np_function is not None:
+				result["numpy_time"] = _time(np_function, min_time, repeat)
+			results[f"{name}[{size}]"] = result
+	return results
+
+
+def compare(
+	results: dict[str, dict],
+	baseline: dict[str, dict],
+	threshold: float,
+) -> dict[str, list[str]]:
+	"""
+	Adds the ratios to the baseline's time and peak memory to every result with a baseline, and
+	returns the metrics which grew by more than threshold, by key of the regressed results.
+	"""
+	regressions = {}
+	for key, result in results.items():
+		if key not in baseline:
+			continue
+		metrics = []
+		result["baseline_ratio"] = result["time"] / baseline[key]["time"]
+		if result["baseline_ratio"] > threshold:
+			metrics.append(f"time {result['baseline_ratio']:.3g}x")
+		baseline_memory = baseline[key].get("peak_memory")
+		if baseline_memory is not None:
+			memory = result["peak_memory"]
+			result["memory_ratio"] = memory / max(baseline_memory, 1)
+			if result["memory_ratio"] > threshold and memory - baseline_memory > MEMORY_NOISE:
+				metrics.append(f"peak memory {result['memory_ratio']:.3g}x")
+		if metrics:
+			regressions[key] = metrics
+	return regressions
+
+
+def _format_time(seconds: float) -> str:
+	for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+		if seconds >= scale:
+			return f"{seconds / scale:.3g} {unit}"
+	return f"{seconds / 1e-9:.3g} ns"
+
+
+def _format_bytes(nbytes: int) -> str:
+	for unit, scale in (("GiB", 1 << 30), ("MiB", 1 << 20), ("KiB", 1 << 10)):
+		if nbytes >= scale:
+			return f"{nbytes / scale:.3g} {unit}"
+	return f"{nbytes} B"
+
+
+def _format_ratio(ratio: float | None, regressed: bool) -> str:
+	if ratio is None:
+		return "-"
+	return f"{ratio:.3g}x" + (" REGRESSION" if regressed else "")
+
+
+def report(
+	results: dict[str, dict],
+	regressions: dict[str, list[str]],
+	file=sys.stdout,
+) -> None:
+	"""
+	Prints a table of the results, with the slowdowns relative to numpy and to the baseline, and
+	the peak memory relative to the baseline.
+	"""
+	header = (
+		"case",
+		"size",
+		"time",
+		"elements/s",
+		"peak memory",
+		"vs numpy",
+		"vs baseline",
+		"memory vs baseline",
+	)
+	rows = [header]
+	for key, result in results.items():
+		numpy_time = result.get("numpy_time")
+		metrics = " ".join(regressions.get(key, ()))
+		rows.append(
+			(
+				result["name"],
+				str(result["size"]),
+				_format_time(result["time"]),
+				f"{result['throughput']:.3g}",
+				_format_bytes(result["peak_memory"]),
+				"-" if numpy_time is None else f"{result['time'] / numpy_time:.3g}x",
+				_format_ratio(result.get("baseline_ratio"), "time" in metrics),
+				_format_ratio(result.get("memory_ratio"), "memory" in metrics),
+			)
+		)
+	widths = [max(len(row[column]) for row in rows) for column in range(len(header))]
+	for row in rows:
+		print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip(), file=file)
+
+
+def main(argv: list[str] | None = None) -> int:
+	"""
+	Command line entry point, returning 1 if any regression against the baseline was found.
+	"""
+	parser = argparse.ArgumentParser(
+		prog="python -m benchmarks", description="Benchmarks mininumpy against numpy."
+	)
+	parser.add_argument("patterns", nargs="*", help="glob patterns of the cases to run")
+	parser.add_argument(
+		"--sizes",
+		type=lambda sizes: tuple(int(float(size)) for size in sizes.split(",")),
+		default=DEFAULT_SIZES,
+		help="comma separated numbers of elements, e.g. 10,1e3,1e7",
+	)
+	parser.add_argument("--min-time", type=float, default=0.1, help="seconds per measurement")
+	parser.add_argument("--repeat", type=int, default=3, help="measurements per case")
+	parser.add_argument("--no-numpy", action="store_true", help="skip the numpy comparison")
+	parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="path of the baseline")
+	parser.add_argument(
+		"--save-baseline", action="store_true", help="store the results as the new baseline"
+	)
+	parser.add_argument(
+		"--threshold",
+		type=float,
+		default=DEFAULT_THRESHOLD,
+		help="slowdown or peak memory growth relative to the baseline flagged as a regression",
+	)
+	parser.add_argument("--list", action="store_true", help="list the cases and exit")
+	args = parser.parse_args(argv)
+
+	if args.list:
+		print("\n".join(CASES))
+		return 0
+	results = run(args.patterns, args.sizes, args.min_time, args.repeat, not args.no_numpy)
+
+	regressions = {}
+	if os.path.exists(args.baseline) and not args.save_baseline:
+		with open(args.baseline) as file:
+			regressions = compare(results, json.load(file), args.threshold)
+	report(results, regressions)
+
+	if args.save_baseline:
+		if os.path.exists(args.baseline):
+			with open(args.baseline) as file:
+				baseline = json.load(file)
+		else:
+			baseline = {}
+			os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+		baseline.update(
+			{
+				key: {"time": result["time"], "peak_memory": result["peak_memory"]}
+				for key, result in results.items()
+			}
+		)
+		with open(args.baseline, "w") as file:
+			json.dump(baseline, file, indent=1)
+		print(f"Baseline saved to {args.baseline}")
+	if regressions:
+		descriptions = (f"{key} ({', '.join(metrics)})" for key, metrics in regressions.items())
+		print(f"{len(regressions)} regression(s): {', '.join(descriptions)}", file=sys.stderr)
+		return 1
+	return 0
@@ -1,3 +1,98 @@
-from .core import Array, abs, arange, array, exp, eye, linspace, log, ones, sqrt, zeros
+from . import random, sparse
+from .batch import vmap
+from .core import (
+	Array,
+	arange,
+	argpartition,
+	argsort,
+	array,
+	array_split,
+	asarray,
+	ascontiguousarray,
+	broadcast_to,
+	concatenate,
+	dot,
+	empty,
+	empty_like,
+	eye,
+	frombuffer,
+	fromiter,
+	full,
+	full_like,
+	hstack,
+	linspace,
+	matmul,
+	ones,
+	ones_like,
+	partition,
+	repeat,
+	searchsorted,
+	sort,
+	split,
+	stack,
+	tile,
+	unique,
+	unstack,
+	vstack,
+	zeros,
+	zeros_like,
+)
+from .dtypes import (
+	DType,
+	bool_,
+	can_cast,
+	dtype,
+	float32,
+	float64,
+	int8,
+	int16,
+	int32,
+	int64,
+	promote_types,
+	result_type,
+	uint8,
+	uint16,
+	uint32,
+	uint64,
+)
+from .lazy import LazyArray
+from .npyio import load, save
+from .parallel import get_num_workers, num_workers, set_num_workers
+from .pool import PoolStats, clear_pool, get_pool_stats, set_pool_limits
+from .printing import (
+	PrintOptions,
+	array2string,
+	get_printoptions,
+	printoptions,
+	set_printoptions,
+	write_array,
+)
+from .profiling import Profile, add_hook, profile, remove_hook
+from .stream import Stream, stream
+from .ufunc import (
+	Ufunc,
+	abs,
+	absolute,
+	add,
+	divide,
+	equal,
+	exp,
+	floor_divide,
+	greater,
+	greater_equal,
+	less,
+	less_equal,
+	log,
+	maximum,
+	minimum,
+	multiply,
+	negative,
+	not_equal,
+	power,
+	remainder,
+	sqrt,
+	subtract,
+	true_divide,
+)
 
 __version__ = "0.1.0"
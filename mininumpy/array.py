@@ -1,71 +1,192 @@
 # File with the implementation of the array type.
 from __future__ import annotations  # for typehinting the Array class within itself
 
-from math import exp, log, prod, sqrt
+import sys
+from array import array as typed_array
+from bisect import bisect_left, bisect_right
+from functools import wraps
+from heapq import nlargest, nsmallest
+from inspect import BufferFlags
+from itertools import chain, compress, count, islice, product, repeat
+from math import isnan, prod, sumprod
+from operator import mul
+from time import perf_counter_ns
+
+from . import dtypes
+from .dtypes import DType, bool_, float64, int64, uint64
+
+# maximum number of elements staged at once when writing results into an existing array
+_ASSIGNMENT_CHUNK_SIZE = 1 << 16
+
+# number of columns of each strip of the matrix multiplication kernel
+_MATMUL_BLOCK_SIZE = 64
+
+# partitions selecting fewer than 1/_SELECTION_RATIO of the elements of a lane use a heap, and
+# sort the whole lane otherwise (in which case it is faster)
+_SELECTION_RATIO = 32
+
+
+def _parallelizable_reduction(method):
+	"""
+	Decorator for the reductions of Array, which the parallel backend (if enabled) may split into
+	chunks for large arrays.
+	"""
+
+	@wraps(method)
+	def wrapper(self: Array, *args, **kwargs):
+		backend = self._parallel_backend
+		if backend is not None and self.size >= backend.threshold:
+			return backend.reduce(self, method, *args, **kwargs)
+		return method(self, *args, **kwargs)
+
+	return wrapper
+
+
+def _instrumented(name):
+	"""
+	Decorator reporting every call of an operation to the hooks registered in Array._hooks (see
+	mininumpy.profiling), with its name (or the result of calling name with the arguments), its
+	positional and keyword arguments, the result, and its start time and duration in nanoseconds.
+
+	Only the outermost of nested instrumented calls is reported, and calls are not timed at all
+	while no hook is registered.
+	"""
+
+	def decorator(function):
+		@wraps(function)
+		def wrapper(*args, **kwargs):
+			hooks = Array._hooks
+			if not hooks or Array._instrumented_call_running:
+				return function(*args, **kwargs)
+			Array._instrumented_call_running = True
+			try:
+				start = perf_counter_ns()
+				result = function(*args, **kwargs)
+				duration = perf_counter_ns() - start
+			finally:
+				Array._instrumented_call_running = False
+			operation = name if isinstance(name, str) else name(*args, **kwargs)
+			arguments = args + tuple(kwargs.values())
+			for hook in tuple(hooks):
+				hook(operation, arguments, result, start, duration)
+			return result
+
+		return wrapper
+
+	return decorator
 
 
 class Array:
 	"""Array to implement lite version of NumPy."""
 
-	data: list  # memoryview
-	dtype: type[int] | type[float] | type[None]
+	data: memoryview
+	dtype: DType
 	shape: tuple[int]
 	ndim: int
 	size: int
+	strides: tuple[int]  # in elements, not bytes
+	offset: int
+	base: Array | None
+
+	# backend splitting large operations across processes. Set by mininumpy.parallel.
+	_parallel_backend = None
+	# ufuncs implementing the elementwise operations, by name. Registered by mininumpy.ufunc.
+	_ufuncs = {}
+	# hooks called after every instrumented operation. Registered by mininumpy.profiling.
+	_hooks = []
+	_instrumented_call_running = False
+	# pool recycling the buffers of garbage-collected arrays. Set by mininumpy.pool.
+	_buffer_pool = None
 
-	# TODO: evaluate empty list edge case
-	@classmethod
-	def _get_shape_and_type(
-		cls,
-		test_list: int | float | list[int | float | None],
-	) -> tuple[tuple[int], type[int | float | None]]:
+	@staticmethod
+	def _probe_shape(input_list: int | float | list) -> tuple[int]:
 		"""
-		Get the shape and type of a multi-nested list.
-		If the dimensions do not form an 'n-dimensional square' (if they are not homogeneous in
-		numpy jargon), or if the types do not match, an appropriate exeption will be raised.
-
-		Value error will be raised if non-expected object is inputted to the function.
-		"""
-
-		# If the current object is a list, checks recursively for the
-		# shapes and types of all sublists.
-		#
-		# If these shapes and types are consistent, then the main list's shape is its length
-		# preppended to the shape of any of its sublists (which should be the same).
-		if isinstance(test_list, list):
-			length = len(test_list)
-			if length == 0:
-				return ((0,), None)
-
-			shape_dtype_list = [cls._get_shape_and_type(elem) for elem in test_list]
-			first_shape = shape_dtype_list[0][0]
-			first_dtype = shape_dtype_list[0][1]
-			for shape, dtype in shape_dtype_list[1:]:
-				if shape != first_shape:
-					raise ValueError("Inconsistent shape between sublists")
-				if dtype != first_dtype:
-					raise ValueError("Inconsistent typing between sublists' elements")
-			return (length, *first_shape), first_dtype
-
-		# if it is just a number, return empty tuple and type
-		if isinstance(test_list, (int, float)):
-			return (), type(test_list)
-
-		raise ValueError("Cannot get the shape of non-list, non-number type")
+		Returns the shape of a multi-nested list, guessed from its first elements at each level.
+		"""
+		shape = []
+		while isinstance(input_list, list):
+			shape.append(len(input_list))
+			if not input_list:
+				break
+			input_list = input_list[0]
+		return tuple(shape)
 
-	@classmethod
-	def _flatten_list(cls, lst: list | int | float) -> list:
+	@staticmethod
+	def _as_number(value: int | float | bool) -> int | float | bool:
 		"""
-		Flatten list.
+		Returns value as an exact bool, int or float, raising exception if it is not a number.
 		"""
-		if isinstance(lst, (int, float)):
-			return [lst]
+		if isinstance(value, bool):
+			return value
+		if isinstance(value, int):
+			return int(value)
+		if isinstance(value, float):
+			return float(value)
+		raise ValueError("Cannot create an array from non-list, non-number elements")
 
-		flattened_list = []
-		for elem in lst:
-			flattened_list += cls._flatten_list(elem)
+	@classmethod
+	def _ingest(
+		cls,
+		input_list: int | float | list,
+	) -> tuple[memoryview, tuple[int], DType]:
+		"""
+		Walks a multi-nested list once, validating its shape and types while writing its elements
+		into a typed buffer. Returns the buffer, the shape and the dtype.
 
-		return flattened_list
+		If the dimensions do not form an 'n-dimensional square' (if they are not homogeneous in
+		numpy jargon), or if non-number elements are found, a ValueError is raised. Bools are
+		promoted to ints, and ints to floats, if elements of different types are mixed. Empty lists
+		give float64 arrays, same as numpy.
+		"""
+		shape = cls._probe_shape(input_list)
+		ndim = len(shape)
+		buffer = typed_array(int64.typecode)
+		found_types = set()
+
+		def ingest_row(row: list) -> None:
+			nonlocal buffer
+			row_types = set(map(type, row))
+			if not row_types <= {int, float, bool}:
+				# subclasses of int and float (e.g. numpy's float64) are converted to them
+				row = list(map(cls._as_number, row))
+				row_types = set(map(type, row))
+			if float in row_types and float not in found_types:
+				buffer = typed_array(float64.typecode, buffer)
+			found_types.update(row_types)
+			buffer.extend(row)
+
+		if ndim == 0:
+			ingest_row([input_list])
+		elif ndim == 1:
+			ingest_row(input_list)
+		else:
+			# depth-first walk with a stack of iterators, one per nesting level
+			stack = [iter(input_list)]
+			exhausted = object()
+			while stack:
+				sublist = next(stack[-1], exhausted)
+				if sublist is exhausted:
+					stack.pop()
+					continue
+				depth = len(stack)
+				if not isinstance(sublist, list) or len(sublist) != shape[depth]:
+					raise ValueError("Inconsistent shape between sublists")
+				if depth == ndim - 1:
+					ingest_row(sublist)
+				else:
+					stack.append(iter(sublist))
+
+		if not found_types or float in found_types:
+			dtype = float64
+		elif int in found_types:
+			dtype = int64
+		else:
+			dtype = bool_
+		if dtype is bool_:
+			return cls._make_buffer(bool_, buffer), shape, dtype
+		if not found_types:
+			return cls._make_buffer(float64), shape, dtype
+		return memoryview(cls._adopt_buffer(buffer)), shape, dtype
 
 	@staticmethod
 	def _sanitize_input_list(input_list: any) -> None:
@@ -75,218 +196,814 @@ class Array:
 				"Expected array-like list or single float or int value"
 			)
 
-	# TODO: sanitize the input
 	def __init__(self, input_list: list[int | float]):
 		"""
 		Creates Array object from given list,
 
-		This class only accepts same type (int or float) multi-nested arrays of homegenous
-		dimension. If the input list does not match these conditions, a ValueError will be raised
-		at runtime.
+		This class only accepts multi-nested lists of numbers of homegenous dimension, whose
+		elements are promoted to a common type (bool, int or float). If the input list does not
+		match these conditions, a ValueError will be raised at runtime.
 		"""
 		# sanitize
 		self._sanitize_input_list(input_list)
 
-		# compute shape and
-		self.shape, self.dtype = self._get_shape_and_type(input_list)
+		# compute shape and actually store data, in a single pass
+		self.data, self.shape, self.dtype = self._ingest(input_list)
 		self.ndim = len(self.shape)  # in case of empty list input, ndim = 1 (same as numpy)
 		self.size = prod(self.shape)
+		self.strides = self._contiguous_strides(self.shape)
+		self.offset = 0
+		self.base = None
+
+	def __del__(self) -> None:
+		# arrays owning a typed buffer hand it to the pool, which only reuses it once no memoryview
+		# of it is alive. Buffers from outside (e.g. given to frombuffer) are never recycled.
+		pool = self._buffer_pool
+		if pool is not None and getattr(self, "base", True) is None:
+			buffer = self.data.obj
+			if type(buffer) is typed_array and pool.owns(buffer):
+				pool.release(buffer)
+
+	# buffer handling
+	@staticmethod
+	def _adopt_buffer(buffer: typed_array) -> typed_array:
+		"""
+		Records buffer as allocated by mininumpy, so the pool may recycle it once its array is
+		garbage-collected, and returns it.
+		"""
+		pool = Array._buffer_pool
+		if pool is not None:
+			pool.adopt(buffer)
+		return buffer
 
-		# actually store data
-		self.data = self._flatten_list(input_list)
+	@staticmethod
+	def _allocate_buffer(dtype: DType, size: int) -> memoryview:
+		"""
+		Returns a memoryview over a typed buffer of size elements, whose contents are arbitrary.
 
-	# convenience methods
-	def copy(self) -> Array:
+		The buffer is recycled from the pool (see mininumpy.pool) if it holds one of that size.
 		"""
-		Make a copy of the current instance.
+		pool = Array._buffer_pool
+		buffer = None if pool is None else pool.acquire(dtype.typecode, size)
+		if buffer is None:
+			# repeating a single zero allocates the buffer once, without an intermediate bytes
+			buffer = Array._adopt_buffer(typed_array(dtype.typecode, [0]) * size)
+		if dtype is bool_:
+			return memoryview(buffer).cast("?")
+		return memoryview(buffer)
+
+	@staticmethod
+	def _fill_buffer(dtype: DType, size: int, values) -> memoryview:
 		"""
-		new_array = Array([])
-		# populate it with current values
-		new_array.data = self.data.copy()
-		new_array.dtype = self.dtype
-		new_array.shape = tuple(elem for elem in self.shape)
-		new_array.ndim = self.ndim
-		new_array.size = self.size
+		Returns a memoryview over a typed buffer of size elements (recycled from the pool if
+		possible, see _allocate_buffer) holding the values of the given iterable.
 
-		return new_array
+		Values are written in chunks of at most _ASSIGNMENT_CHUNK_SIZE elements, so no temporary
+		buffer of the full size is allocated.
+		"""
+		data = Array._allocate_buffer(dtype, size)
+		values = iter(values)
+		for start in range(0, size, _ASSIGNMENT_CHUNK_SIZE):
+			stop = min(start + _ASSIGNMENT_CHUNK_SIZE, size)
+			data[start:stop] = Array._make_buffer(dtype, islice(values, stop - start))
+		return data
 
-	@classmethod
-	def array_from_shape(cls, shape: tuple[int]) -> Array:
+	@staticmethod
+	def _make_buffer(
+		dtype: DType,
+		values: bytes | memoryview | list | map = b"",
+	) -> memoryview:
 		"""
-		Returns zero-filled array of given shape
+		Creates the typed contiguous buffer backing an array, and returns a memoryview over it.
+
+		Values can either be an iterable of numbers (integers overflowing integer dtypes wrap
+		around), or a bytes-like object with the raw contents of another buffer of the same dtype,
+		in which case it is copied in bulk.
 		"""
-		new_array = Array([])
+		if isinstance(values, memoryview) and not values.c_contiguous:
+			values = values.tobytes()
+		if isinstance(values, (bytes, bytearray, memoryview)):
+			buffer = typed_array(dtype.typecode)
+			buffer.frombytes(memoryview(values).cast("B"))
+		else:
+			buffer = dtype.buffer(values)
+		Array._adopt_buffer(buffer)
+		if dtype is bool_:
+			return memoryview(buffer).cast("?")
+		return memoryview(buffer)
 
-		new_array.shape = shape
-		new_array.ndim = len(shape)
-		new_array.size = prod(shape)
+	@classmethod
+	def _from_data(
+		cls,
+		data: memoryview,
+		shape: tuple[int],
+		dtype: DType,
+		strides: tuple[int] | None = None,
+		offset: int = 0,
+		base: Array | None = None,
+	) -> Array:
+		"""
+		Creates an array directly from its typed buffer, without going through list parsing.
 
-		new_array.data = [0 for _ in range(new_array.size)]
-		new_array.dtype = int
+		If no strides are given, the data is assumed to be laid out contiguously (C order).
+		"""
+		new_array = cls.__new__(cls)
+
+		new_array.data = data
+		new_array.dtype = dtype
+		new_array.shape = tuple(shape)
+		new_array.ndim = len(new_array.shape)
+		new_array.size = prod(new_array.shape)
+		new_array.strides = (
+			cls._contiguous_strides(new_array.shape) if strides is None else tuple(strides)
+		)
+		new_array.offset = offset
+		new_array.base = base
 
 		return new_array
 
-	# TODO: sanitise the input for it to be a tuple of ints
-	def reshape(self, new_shape: tuple[int]) -> Array:
+	def _view(self, shape: tuple[int], strides: tuple[int], offset: int) -> Array:
 		"""
-		Reshapes array to given new_shape.
+		Returns a new array sharing the buffer of the current one, with the given layout.
+		"""
+		base = self if self.base is None else self.base
+		return self._from_data(self.data, shape, self.dtype, strides, offset, base)
 
-		If the size of new_shape does not match self.size, a RuntimeError will be rised.
+	# strided layout handling
+	@staticmethod
+	def _contiguous_strides(shape: tuple[int]) -> tuple[int]:
 		"""
-		if prod(new_shape) != self.size:
-			raise RuntimeError("Size of input shape does not correspond to size of current array")
-		new_array = self.copy()
-		new_array.shape = new_shape
+		Returns the strides (in elements) of a C-ordered array of the given shape.
+		"""
+		strides = ()
+		step = 1
+		for dim in reversed(shape):
+			strides = (step,) + strides
+			step *= dim
+		return strides
+
+	def _is_contiguous(self) -> bool:
+		"""
+		Whether the elements of the array are laid out contiguously in C order in its buffer.
 
-		return new_array
+		Dimensions of length 1 are ignored, as their stride is never used.
+		"""
+		if self.size == 0:
+			return True
+		expected_stride = 1
+		for dim, stride in zip(reversed(self.shape), reversed(self.strides)):
+			if dim != 1 and stride != expected_stride:
+				return False
+			expected_stride *= dim
+		return True
+
+	@staticmethod
+	def _coalesce_dims(
+		shape: tuple[int],
+		strides: tuple[int],
+	) -> tuple[tuple[int], tuple[int]]:
+		"""
+		Merges contiguous neighbouring dimensions, so strided walks go over longer rows.
+
+		Dimensions of length 1 are dropped, as they do not change the walk.
+		"""
+		new_shape = []
+		new_strides = []
+		for dim, stride in zip(shape, strides):
+			if dim == 1:
+				continue
+			if new_shape and new_strides[-1] == dim * stride:
+				new_shape[-1] *= dim
+				new_strides[-1] = stride
+			else:
+				new_shape.append(dim)
+				new_strides.append(stride)
+		return tuple(new_shape), tuple(new_strides)
+
+	@staticmethod
+	def _strided_offsets(shape: tuple[int], strides: tuple[int], offset: int):
+		"""
+		Returns an iterable over the buffer offsets of every position of a strided layout, in C
+		order.
+		"""
+		if len(shape) == 1 and strides[0] != 0:
+			return range(offset, offset + shape[0] * strides[0], strides[0])
+		ranges = [
+			range(0, dim * stride, stride) if stride else (0,) * dim
+			for dim, stride in zip(shape, strides)
+		]
+		return (offset + sum(offsets) for offsets in product(*ranges))
+
+	@staticmethod
+	def _strided_row(data: memoryview, start: int, length: int, stride: int):
+		"""
+		Returns length elements of data starting from start, stride elements apart.
+
+		The row is a zero-copy memoryview slice of data, or a repeat of a single value if the
+		stride is 0 (broadcasted dimension).
+		"""
+		if stride == 0:
+			return repeat(data[start], length)
+		stop = start + length * stride
+		return data[start : (stop if stop >= 0 else None) : stride]
 
 	@classmethod
-	def _flatten_multi_idx(cls, idx: tuple[int], shape: tuple[int]) -> int:
+	def _strided_rows(
+		cls,
+		data: memoryview,
+		shape: tuple[int],
+		strides: tuple[int],
+		offset: int,
+	):
 		"""
-		Converts an multidimensional index into a linear one for internal data representation.
-		It uses the shape to compute the appropriate strides.
+		Yields, in C order, the innermost rows of a strided layout over data.
 
-		If (d_0, ..., d_(k-1)) is the shape of the array, then a multidimensional index is a tuple
-		I = (i_0, ..., i_(k-1)) with i_j in the range (0, ..., d_j).
+		Rows are zero-copy memoryview slices of data, except for rows with stride 0 (broadcasted
+		dimensions), which are repeats of a single value.
+		"""
+		if prod(shape) == 0:
+			return
+		shape, strides = cls._coalesce_dims(shape, strides)
+		if len(shape) == 0:
+			yield data[offset : offset + 1]
+			return
+
+		*outer_shape, inner_dim = shape
+		*outer_strides, inner_stride = strides
+		for start in cls._strided_offsets(outer_shape, outer_strides, offset):
+			yield cls._strided_row(data, start, inner_dim, inner_stride)
+
+	def _flat_values(self):
+		"""
+		Returns an iterable over the elements of the array, in C order.
 
-		The corresponding linear index for I is:
-		lin_idx_(k+1) = i_k + d_k( i_(k-1) + d_(k-1)( ... i_1 + d_1(i_0) ...))
+		For contiguous arrays this is a zero-copy memoryview slice of the buffer.
+		"""
+		if self._is_contiguous():
+			return self.data[self.offset : self.offset + self.size]
+		return chain.from_iterable(
+			self._strided_rows(self.data, self.shape, self.strides, self.offset)
+		)
 
-		This linearized index for a k-dimensional array can be computed recursively by the
-		recursive sequence:
-		lin_idx_0 = i_0
-		lin_idx_n = i_n + d_n*lin_idx_(n_1)
+	def _value_at(self, multi_idx: tuple[int]) -> int | float:
+		"""
+		Returns the element at the given multidimensional index.
+		"""
+		return self.data[self.offset + sum(map(mul, multi_idx, self.strides))]
 
-		Notice that for these computations
+	# convenience methods
+	@_instrumented("copy")
+	def copy(self) -> Array:
+		"""
+		Make a contiguous copy of the current instance.
 		"""
-		# TODO: should do a sanity check here
-		if len(idx) == 1:
-			return idx[-1]
-		return idx[-1] + (shape[-1] * cls._flatten_multi_idx(idx[:-1], shape[:-1]))
+		data = self._allocate_buffer(self.dtype, self.size)
+		if self._is_contiguous():
+			data[:] = self._flat_values()
+		else:
+			position = 0
+			for row in self._strided_rows(self.data, self.shape, self.strides, self.offset):
+				if not isinstance(row, memoryview):
+					row = self._make_buffer(self.dtype, row)
+				data[position : position + len(row)] = row
+				position += len(row)
+		return self._from_data(data, self.shape, self.dtype)
+
+	@_instrumented("astype")
+	def astype(self, dtype: DType | type | str, copy: bool = True) -> Array:
+		"""
+		Returns the array with its elements converted into dtype (a dtype, its name, or one of the
+		Python types int, float and bool).
+
+		Floats are truncated towards zero when converted into integers, and integers out of the
+		range of integer dtypes wrap around. If copy is False and the array is already of that
+		dtype, the array itself is returned.
+		"""
+		dtype = dtypes.dtype(dtype)
+		if dtype is self.dtype:
+			return self.copy() if copy else self
+		values = iter(self._flat_values())
+		if dtype is bool_:
+			values = map(bool, values)
+		elif dtype.kind in "iu" and self.dtype.kind == "f":
+			values = map(int, values)
+		return self._from_data(self._fill_buffer(dtype, self.size, values), self.shape, dtype)
+
+	def ascontiguousarray(self) -> Array:
+		"""
+		Returns the array itself if it is laid out contiguously, or a contiguous copy otherwise.
+		"""
+		return self if self._is_contiguous() else self.copy()
+
+	# interoperability with other buffers (e.g. numpy arrays and bytes)
+	def __buffer__(self, flags: int) -> memoryview:
+		"""
+		Exposes the elements of the array through the buffer protocol (PEP 688), with its shape.
+
+		Contiguous arrays share their memory, while other layouts (which cannot be described by
+		a memoryview) are exported as a read-only contiguous copy.
+		"""
+		source = self if self._is_contiguous() else self.copy()
+		data = source.data[source.offset : source.offset + source.size]
+		if source is not self:
+			if flags & BufferFlags.WRITABLE:
+				raise BufferError("Cannot export a writable buffer of a non-contiguous array")
+			data = data.toreadonly()
+		if self.size == 0 and self.ndim != 1:
+			# memoryviews cannot be cast into shapes with zeros. Consumers like numpy fall back to
+			# the array interface.
+			raise BufferError("Cannot export a buffer of an empty multi-dimensional array")
+		if self.size == 0:
+			return data
+		return data.cast("B").cast(data.format, self.shape)
+
+	@property
+	def __array_interface__(self) -> dict:
+		"""
+		Description of the array's memory layout (version 3 of numpy's array interface), so
+		numpy can wrap it without copying, views included.
+		"""
+		itemsize = self.dtype.itemsize
+		byteorder = "|" if itemsize == 1 else "<" if sys.byteorder == "little" else ">"
+		typestr = f"{byteorder}{self.dtype.kind}{itemsize}"
+		return {
+			"version": 3,
+			"shape": self.shape,
+			"typestr": typestr,
+			"data": self.data,
+			"offset": self.offset * itemsize,
+			"strides": tuple(stride * itemsize for stride in self.strides),
+		}
 
 	@classmethod
-	def _circular_increment_multi_idx(cls, idx: tuple[int], shape: tuple[int]) -> tuple[int]:
+	def array_from_shape(
+		cls,
+		shape: tuple[int],
+		dtype: DType = int64,
+		fill_value: int | float | bool | None = 0,
+	) -> Array:
 		"""
-		Increment the multidimensional idx of an array by 1, given its shape.
+		Returns an array of given shape filled with fill_value (zero-filled by default), or with
+		arbitrary contents if fill_value is None.
 
-		This operation is defined so that it adds one to the last idx position, and in case
-		of overflow, it carries a +1 to the previous idx position.
+		The buffer is allocated (or recycled from the pool) in a single step, and filled by
+		doubling copies within itself, without going through Python lists.
+		"""
+		size = prod(shape)
+		data = cls._allocate_buffer(dtype, size)
+		if fill_value is not None and size:
+			data[:1] = cls._make_buffer(dtype, [dtype.type(fill_value)])
+			filled = 1
+			while filled < size:
+				length = min(filled, size - filled)
+				data[filled : filled + length] = data[:length]
+				filled += length
+		return cls._from_data(data, shape, dtype)
 
-		It is implemented in a circular manner for simplification purposes.
+	# TODO: sanitise the input for it to be a tuple of ints
+	@_instrumented("reshape")
+	def reshape(self, new_shape: tuple[int]) -> Array:
 		"""
-		if len(idx) == 0:
-			return ()
+		Reshapes array to given new_shape.
 
-		if idx[-1] < (shape[-1] - 1):
-			return *idx[:-1], (idx[-1] + 1)
+		Contiguous arrays are reshaped as views over the same buffer, while non-contiguous ones are
+		copied first.
 
-		return *cls._circular_increment_multi_idx(idx[:-1], shape[:-1]), 0
+		If the size of new_shape does not match self.size, a RuntimeError will be rised.
+		"""
+		if prod(new_shape) != self.size:
+			raise RuntimeError("Size of input shape does not correspond to size of current array")
+		source = self.ascontiguousarray()
+		return source._view(new_shape, self._contiguous_strides(new_shape), source.offset)
 
+	@_instrumented("transpose")
 	def transpose(self, permutation: tuple[int] | None = None) -> Array:
+		"""
+		Returns a view of the array with its axes permuted.
+
+		By default the order of the axes is reversed, same as numpy.
+		"""
 		# sanity check the input
 		if permutation is None:
 			permutation = tuple(reversed(range(self.ndim)))
 		if not isinstance(permutation, tuple):
 			raise ValueError("Non tuple, non-None value given as permutation")
+		if len(permutation) != self.ndim:
+			raise ValueError(
+				f"Permutation of {len(permutation)} axes given for an array of {self.ndim} axes"
+			)
 		if set(permutation) != set(range(len(permutation))):
 			raise RuntimeError("Invalid permutation for transposition.")
 
-		# get new shape and empty new data. Same behaviour as numpy.
 		new_shape = tuple(self.shape[p] for p in permutation)
-		new_data = [0 for _ in range(len(self.data))]
+		new_strides = tuple(self.strides[p] for p in permutation)
+		return self._view(new_shape, new_strides, self.offset)
 
-		idx = tuple(0 for _ in range(self.ndim))
-		for _ in range(self.size):
-			# get index in list for value
-			linear_idx = self._flatten_multi_idx(idx, self.shape)
+	@property
+	def T(self) -> Array:
+		"""
+		View of the array with its axes reversed.
+		"""
+		return self.transpose()
 
-			# compute corresponding idx in new array, and its linearization
-			new_idx = tuple(idx[p] for p in permutation)
-			new_linear_idx = self._flatten_multi_idx(new_idx, new_shape)
+	def lazy(self) -> LazyArray:  # noqa: F821
+		"""
+		Returns a lazy version of the array.
 
-			# copy corresponding values and increment idx
-			new_data[new_linear_idx] = self.data[linear_idx]
-			idx = self._circular_increment_multi_idx(idx, self.shape)
+		Operations on it build an expression which is evaluated in a single fused pass by
+		compute(), or by a trailing reduction.
+		"""
+		from .lazy import LazyArray  # imported here, as it depends on this module
 
-		# Create new_array and return it with new shape and list
-		new_array = self.copy()
-		new_array.shape = new_shape
-		new_array.data = new_data
+		return LazyArray(self)
 
-		return new_array
+	# basic indexing
+	def _expand_key(self, key) -> list:
+		"""
+		Returns the entries of an indexing key as a list covering every axis of the array: the
+		ellipsis (or the end of the key) is expanded into full slices, lists are converted into
+		index arrays, and integer-like objects into ints.
+		"""
+		if not isinstance(key, tuple):
+			key = (key,)
+		entries = []
+		for idx in key:
+			if isinstance(idx, list):
+				idx = Array(idx)
+			elif isinstance(idx, bool):
+				raise IndexError("Boolean scalars are not supported as indices")
+			elif not isinstance(idx, (int, slice, Array)) and hasattr(idx, "__index__"):
+				idx = idx.__index__()
+			elif not isinstance(idx, (int, slice, Array)) and idx not in (None, Ellipsis):
+				raise IndexError(f"Unsupported index type {type(idx)}")
+			entries.append(idx)
+
+		consumed = sum(
+			0
+			if idx is None or idx is Ellipsis
+			else idx.ndim
+			if isinstance(idx, Array) and idx.dtype is bool_
+			else 1
+			for idx in entries
+		)
+		if consumed > self.ndim:
+			raise IndexError(
+				f"Too many indices for array: array is {self.ndim}-dimensional, "
+				f"but {consumed} were indexed"
+			)
+		ellipses = [pos for pos, idx in enumerate(entries) if idx is Ellipsis]
+		if len(ellipses) > 1:
+			raise IndexError("An index can only have a single ellipsis ('...')")
+		position = ellipses[0] if ellipses else len(entries)
+		entries[position : position + len(ellipses)] = [slice(None)] * (self.ndim - consumed)
+		return entries
+
+	def _basic_index(self, key: list[int | slice | None]) -> Array:
+		"""
+		Returns the view selected by basic indexing with integers, slices and None (new axes of
+		length 1), given an expanded key (see _expand_key).
 
-	@classmethod
-	def _unflatten_list(
-		cls,
-		flattened_list: list[int | float | None],
-		shape: tuple[int],
-	) -> list:
-		"""
-		Unflattens given list given specific shape.
-		"""
-		# sanity assertion
-		if prod(shape) != len(flattened_list):
-			raise ValueError("Given list size does not match size obtained from given shape.")
-
-		# empty list and dtype list cases
-		if flattened_list == []:
-			return flattened_list
-		if (len(shape) == 0) or (len(shape) == 1):
-			return flattened_list
-
-		# recursive call
-		unflattend_list = []
-		sublength = prod(shape[1:])
-		for idx in range(shape[0]):
-			unflattend_list.append(
-				cls._unflatten_list(
-					flattened_list[idx * sublength : (idx + 1) * sublength], shape[1:]
-				)
+		If every axis is indexed by an integer, the result is a 0-dimensional view.
+		"""
+		new_shape = []
+		new_strides = []
+		offset = self.offset
+		axis = 0
+		for idx in key:
+			if idx is None:
+				new_shape.append(1)
+				new_strides.append(0)
+				continue
+			dim, stride = self.shape[axis], self.strides[axis]
+			if isinstance(idx, slice):
+				start, stop, step = idx.indices(dim)
+				new_shape.append(len(range(start, stop, step)))
+				new_strides.append(stride * step)
+				offset += start * stride
+			else:
+				if not -dim <= idx < dim:
+					raise IndexError(
+						f"Index {idx} is out of bounds for axis {axis} with size {dim}"
+					)
+				offset += (idx % dim) * stride
+			axis += 1
+
+		return self._view(tuple(new_shape), tuple(new_strides), offset)
+
+	def nonzero(self) -> tuple[Array]:
+		"""
+		Returns one array per axis, with the indices of the non-zero elements along it (in C
+		order of the elements).
+		"""
+		if self.ndim == 0:
+			raise ValueError("Cannot compute the non-zero indices of a 0-dimensional array")
+		flat_indices = list(compress(count(), self._flat_values()))
+		return tuple(
+			self._from_data(
+				self._make_buffer(int64, [flat_idx // stride % dim for flat_idx in flat_indices]),
+				(len(flat_indices),),
+				int64,
 			)
+			for dim, stride in zip(self.shape, self._contiguous_strides(self.shape))
+		)
 
-		return unflattend_list
+	def _advanced_index(self, key: list) -> tuple[tuple[int], object]:
+		"""
+		Resolves an expanded key with index arrays (advanced indexing) into the shape of the
+		selection, and an iterable over the rows (start, length, stride) of the buffer which it
+		selects, in C order.
+
+		Boolean masks select the indices of their True elements. Index arrays (and integers) are
+		broadcasted together, and their dimensions replace the indexed axes if these are adjacent,
+		or go first otherwise (same as numpy).
+		"""
+		entries = []
+		axis = 0
+		for idx in key:
+			if isinstance(idx, Array) and idx.dtype is bool_:
+				if idx.shape != self.shape[axis : axis + idx.ndim]:
+					raise IndexError(
+						f"Boolean index of shape {idx.shape} does not match the indexed axes "
+						f"of shape {self.shape[axis : axis + idx.ndim]}"
+					)
+				entries += idx.nonzero()
+				axis += idx.ndim
+				continue
+			# empty index arrays (e.g. from empty lists) are float64, but select nothing anyway
+			if isinstance(idx, Array) and idx.dtype.kind not in "iu" and idx.size:
+				raise IndexError("Index arrays must be of integer or boolean dtype")
+			entries.append(idx)
+			axis += idx is not None
+
+		# the view has one axis per entry, index arrays being resolved along them afterwards
+		is_index = [isinstance(idx, (Array, int)) for idx in entries]
+		view = self._basic_index(
+			[slice(None) if index else idx for idx, index in zip(entries, is_index)]
+		)
+		positions = [pos for pos, index in enumerate(is_index) if index]
+		indices = [entries[pos] for pos in positions]
+		index_shape = ()
+		for idx in indices:
+			index_shape = self._broadcast_shapes(index_shape, self._shape_of(idx))
+
+		# buffer offsets (relative to the view) selected by each broadcasted index array
+		index_size = prod(index_shape)
+		columns = []
+		for pos, idx in zip(positions, indices):
+			dim, stride = view.shape[pos], view.strides[pos]
+			values = list(
+				idx._broadcast_values(index_shape)
+				if isinstance(idx, Array)
+				else repeat(idx, index_size)
+			)
+			if values and not -dim <= min(values) <= max(values) < dim:
+				raise IndexError(f"Index out of bounds for axis with size {dim}")
+			columns.append([value % dim * stride for value in values])
+		index_offsets = columns[0] if len(columns) == 1 else list(map(sum, zip(*columns)))
+
+		rest = [pos for pos in range(view.ndim) if pos not in positions]
+		if positions == list(range(positions[0], positions[-1] + 1)):
+			before = [pos for pos in rest if pos < positions[0]]
+			after = [pos for pos in rest if pos > positions[-1]]
+		else:
+			before, after = [], rest
+		shape = (
+			tuple(view.shape[pos] for pos in before)
+			+ index_shape
+			+ tuple(view.shape[pos] for pos in after)
+		)
+
+		after_shape, after_strides = self._coalesce_dims(
+			tuple(view.shape[pos] for pos in after), tuple(view.strides[pos] for pos in after)
+		)
+		*outer_shape, length = after_shape or (1,)
+		*outer_strides, stride = after_strides or (1,)
+		rows = (
+			(start, length, stride)
+			for before_offset in self._strided_offsets(
+				tuple(view.shape[pos] for pos in before),
+				tuple(view.strides[pos] for pos in before),
+				view.offset,
+			)
+			for index_offset in index_offsets
+			for start in self._strided_offsets(
+				outer_shape, outer_strides, before_offset + index_offset
+			)
+		)
+		return shape, rows
+
+	def __getitem__(self, key) -> Array | int | float:
+		"""
+		Indexing with integers, slices, None, ellipsis, boolean masks and integer index arrays.
+
+		Basic indexing (integers, slices, None and ellipsis) returns views over the same buffer,
+		while advanced indexing (masks and index arrays) gathers the selection into a new array.
+		If the selection is 0-dimensional, the element itself is returned.
+		"""
+		if isinstance(key, Array) and key.dtype is bool_ and key.shape == self.shape:
+			# a mask over the whole array selects its elements directly
+			values = compress(self._flat_values(), key._flat_values())
+			data = self._make_buffer(self.dtype, values)
+			return self._from_data(data, (len(data),), self.dtype)
+
+		key = self._expand_key(key)
+		if not any(isinstance(idx, Array) for idx in key):
+			view = self._basic_index(key)
+			if view.ndim == 0:
+				return view.data[view.offset]
+			return view
+
+		shape, rows = self._advanced_index(key)
+		values = chain.from_iterable(
+			self._strided_row(self.data, start, length, stride) for start, length, stride in rows
+		)
+		data = self._fill_buffer(self.dtype, prod(shape), values)
+		result = self._from_data(data, shape, self.dtype)
+		if result.ndim == 0:
+			return result.data[0]
+		return result
+
+	def __setitem__(self, key, value: Array | list | int | float) -> None:
+		"""
+		Assigns value (an array, a nested list or a number) to the elements selected by indexing
+		(see __getitem__), broadcasting it if needed.
+
+		Values are cast into the array's dtype whatever their kind, same as in numpy: floats are
+		truncated towards zero in integer arrays, and integers out of range wrap around.
+		"""
+		if isinstance(value, list):
+			value = Array(value)
+		self._sanitize_operand(value)
+		if isinstance(value, Array):
+			value = value.astype(self.dtype, copy=False)
+		else:
+			value = self.dtype.type(value)
+		key = self._expand_key(key)
+		if any(isinstance(idx, Array) for idx in key):
+			shape, rows = self._advanced_index(key)
+			self._check_assignable(self._shape_of(value), self._dtype_of(value), shape)
+			if self._shares_buffer(value):
+				value = value.copy()
+			_, values, _ = self._broadcast_operands(value, 0, shape)
+			self._assign_rows(rows, values)
+			return
+
+		target = self._basic_index(key)
+		if isinstance(value, Array):
+			same_layout = (value.shape, value.strides, value.offset) == (
+				target.shape,
+				target.strides,
+				target.offset,
+			)
+			if target._shares_buffer(value) and same_layout:
+				# nothing to do, e.g. the result of an in-place operation on a view
+				return
+		target._check_out(self._shape_of(value), self._dtype_of(value))
+		value = target._prepare_operand_for_out(value, target)
+		_, values, _ = self._broadcast_operands(value, 0, target.shape)
+		target._assign_values(values)
 
 	# for pretty printing purposes
 	def __str__(self) -> str:
-		return self._unflatten_list(self.data, self.shape).__str__()
+		"""
+		Returns the text of the array, summarized according to the print options if it is large.
+		"""
+		from .printing import array2string  # imported here, as it depends on this module
+
+		return array2string(self)
 
 	__repr__ = __str__
 
-	# elementwise operations
-	def exp(self) -> Array:
+	# writing into existing arrays
+	def _assign_values(self, values) -> None:
 		"""
-		Return a copy of the array with elements e^(elem).
+		Writes values (an iterable in C order) into the array's buffer, respecting its layout.
 		"""
-		new_array = self.copy()
-		new_array.data = [exp(elem) for elem in new_array.data]
-		new_array.dtype = float
-		return new_array
+		if self._is_contiguous():
+			rows = [(self.offset, self.size, 1)]
+		else:
+			shape, strides = self._coalesce_dims(self.shape, self.strides)
+			*outer_shape, length = shape
+			*outer_strides, stride = strides
+			rows = (
+				(start, length, stride)
+				for start in self._strided_offsets(outer_shape, outer_strides, self.offset)
+			)
+		self._assign_rows(rows, values)
+
+	def _assign_rows(self, rows, values) -> None:
+		"""
+		Writes values (an iterable) into the given rows (start, length, stride) of the buffer.
 
-	def log(self) -> Array:
+		Values are staged through chunks of at most _ASSIGNMENT_CHUNK_SIZE elements, so no
+		temporary buffer of the full size of the array is ever allocated.
 		"""
-		Return a copy of the array with elements log_e(elem).
+		values = iter(values)
+		for start, length, stride in rows:
+			for chunk_start in range(0, length, _ASSIGNMENT_CHUNK_SIZE):
+				chunk_length = min(_ASSIGNMENT_CHUNK_SIZE, length - chunk_start)
+				chunk = self._make_buffer(self.dtype, islice(values, chunk_length))
+				first = start + chunk_start * stride
+				stop = first + chunk_length * stride
+				self.data[first : (stop if stop >= 0 else None) : stride] = chunk
+
+	def _shares_buffer(self, other: Array | int | float) -> bool:
 		"""
-		new_array = self.copy()
-		new_array.data = [log(elem) for elem in new_array.data]
-		new_array.dtype = float
-		return new_array
+		Whether other is an array backed by the same buffer as the current one.
+		"""
+		return isinstance(other, Array) and other.data.obj is self.data.obj
+
+	def _check_assignable(
+		self,
+		shape: tuple[int],
+		resulting_dtype: DType,
+		target_shape: tuple[int],
+	) -> None:
+		"""
+		Checks that values of given shape and dtype can be written into a selection of given shape
+		of the current array.
 
-	def sqrt(self) -> Array:
+		Raises ValueError if the values do not broadcast to the selection's shape, or if their
+		dtype cannot be stored in the array without changing its kind (e.g. floats into an int
+		array, see dtypes.can_cast).
 		"""
-		Return a copy of the array with elements sqrt(elem).
+		if self._broadcast_shapes(shape, target_shape) != target_shape:
+			raise ValueError(
+				f"Output array of shape {target_shape} does not match the broadcast shape {shape}"
+			)
+		if not dtypes.can_cast(resulting_dtype, self.dtype):
+			raise ValueError(
+				f"Cannot store result of dtype {dtypes.dtype(resulting_dtype)} into array of "
+				f"dtype {self.dtype}"
+			)
+
+	def _check_out(
+		self,
+		shape: tuple[int],
+		resulting_dtype: DType,
+	) -> None:
 		"""
-		new_array = self.copy()
-		new_array.data = [sqrt(elem) for elem in new_array.data]
-		new_array.dtype = float
-		return new_array
+		Checks that a result of given shape and dtype can be written into the current array, when
+		given as an out= destination (see _check_assignable).
+		"""
+		self._check_assignable(shape, resulting_dtype, self.shape)
 
-	def abs(self) -> Array:
+	def _prepare_operand_for_out(
+		self,
+		operand: Array | int | float,
+		out: Array,
+	) -> Array | int | float:
 		"""
-		Return a copy of the array with elements abs(elem).
+		Returns operand, or a copy of it if it overlaps with out in a different layout, so writing
+		into out does not modify values which are still to be read.
 		"""
-		new_array = self.copy()
-		new_array.data = [abs(elem) for elem in new_array.data]
-		return new_array
+		same_layout = isinstance(operand, Array) and (
+			operand.shape == out.shape
+			and operand.strides == out.strides
+			and operand.offset == out.offset
+		)
+		if out._shares_buffer(operand) and not same_layout:
+			return operand.copy()
+		return operand
+
+	# elementwise operations, implemented by the ufuncs of the same names
+	def _apply_ufunc(
+		self,
+		name: str,
+		*operands: Array | int | float,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Applies the ufunc registered as name to operands, or returns NotImplemented if any of them
+		is not supported (so Python can try the reflected operation of the other operand).
+		"""
+		if not all(isinstance(operand, (int, float, Array)) for operand in operands):
+			return NotImplemented
+		return self._ufuncs[name](*operands, out=out)
+
+	def exp(self, out: Array | None = None) -> Array:
+		"""
+		Return a copy of the array with elements e^(elem), or write them into out if given.
+		"""
+		return self._ufuncs["exp"](self, out=out)
+
+	def log(self, out: Array | None = None) -> Array:
+		"""
+		Return a copy of the array with elements log_e(elem), or write them into out if given.
+		"""
+		return self._ufuncs["log"](self, out=out)
+
+	def sqrt(self, out: Array | None = None) -> Array:
+		"""
+		Return a copy of the array with elements sqrt(elem), or write them into out if given.
+		"""
+		return self._ufuncs["sqrt"](self, out=out)
+
+	def abs(self, out: Array | None = None) -> Array:
+		"""
+		Return a copy of the array with elements abs(elem), or write them into out if given.
+		"""
+		return self._ufuncs["absolute"](self, out=out)
 
 	# binary operations
 	@staticmethod
@@ -327,79 +1044,63 @@ class Array:
 		broadcasted_shape = remaining_dims + broadcasted_shape
 		return broadcasted_shape
 
-	@staticmethod
-	def _fit_broadcasted_multi_idx_to_shape(
-		multi_idx: tuple[int],
-		shape: tuple[int],
-	) -> tuple[int]:
+	def _broadcast_strides(self, shape: tuple[int]) -> tuple[int]:
 		"""
-		Makes multi-index corresponding to a some broadcasted array fit into the shape of one of its
-		base arrays.
+		Returns the strides that walk the current array as if it was broadcasted into shape.
 
-		This method MUST only be used for the corresponding broadcasted arrays, as it is optimized
-		in such a way that operations can be done, without actually copying information for the
-		broadcast.
+		Broadcasted dimensions (either missing or of length 1) get a stride of 0, so the same
+		elements are revisited without copying anything.
 		"""
-		starting_dim = len(multi_idx) - len(shape)
-		new_mulit_idx = list(multi_idx[starting_dim:])
-		for idx, (dim, dim_value) in enumerate(zip(shape, new_mulit_idx)):
-			if dim_value > (dim - 1):
-				new_mulit_idx[idx] = 0
-		return tuple(new_mulit_idx)
+		leading_dims = len(shape) - self.ndim
+		return (0,) * leading_dims + tuple(
+			0 if (dim == 1 and new_dim != 1) else stride
+			for dim, new_dim, stride in zip(self.shape, shape[leading_dims:], self.strides)
+		)
 
-	@classmethod
-	def _evaluate_array_in_broadcasted_multi_idx(
-		cls,
-		array: Array,
-		multi_idx: tuple[int],
-	) -> int | float | None:
-		array_multi_idx = cls._fit_broadcasted_multi_idx_to_shape(multi_idx, array.shape)
-		array_idx = cls._flatten_multi_idx(array_multi_idx, array.shape)
-		return array.data[array_idx]
-
-	_binary_operations = {
-		"add": lambda x, y: x + y,
-		"sub": lambda x, y: x - y,
-		"mul": lambda x, y: x * y,
-		"truediv": lambda x, y: x / y,
-		"pow": lambda x, y: x**y,
-		"max": lambda x, y: max(x, y),
-		"min": lambda x, y: min(x, y),
-		"argmin": lambda x, y: 0 if x <= y else 1,
-		"argmax": lambda x, y: 1 if x <= y else 0,
-	}
+	def _broadcast_values(self, shape: tuple[int]):
+		"""
+		Returns an iterable over the elements of the array broadcasted into shape, in C order.
+		"""
+		if shape == self.shape:
+			return self._flat_values()
+		return chain.from_iterable(
+			self._strided_rows(self.data, shape, self._broadcast_strides(shape), self.offset)
+		)
 
 	@classmethod
-	def _operation_with_broadcasting(
+	def _broadcast_operands(
 		cls,
-		array1: Array,
-		array2: Array,
-		op: str,
-		resulting_dtype: type[int] | type[float] | type[None],
-	) -> None:
+		operand1: Array | int | float,
+		operand2: Array | int | float,
+		shape: tuple[int] | None = None,
+	) -> tuple[tuple[int], ...]:
 		"""
-		Performs a dummy binary operation between array1 and array2.
+		Broadcasts both operands together, or into shape if given.
 
-		New dtype expected must be given.
+		Returns the broadcasted shape, and an iterable over the values of each operand in the
+		broadcasted shape (in C order). Scalars are just repeated, without wrapping them into
+		arrays.
 		"""
-		# get shape of, and create new array
-		new_shape = cls._broadcast_shapes(array1.shape, array2.shape)
-		new_array = cls.array_from_shape(new_shape)
-		new_array.dtype = resulting_dtype
-
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in new_shape])
-		for _ in range(new_array.size):
-			# get value for first array
-			operand_left = cls._evaluate_array_in_broadcasted_multi_idx(array1, multi_idx)
-			operand_right = cls._evaluate_array_in_broadcasted_multi_idx(array2, multi_idx)
-			# update value on new array
-			new_array_idx = cls._flatten_multi_idx(multi_idx, new_array.shape)
-			new_array.data[new_array_idx] = cls._binary_operations[op](operand_left, operand_right)
-			# increase the general idx
-			multi_idx = cls._circular_increment_multi_idx(multi_idx, new_array.shape)
-
-		return new_array
+		if shape is not None:
+			return shape, *(
+				operand._broadcast_values(shape)
+				if isinstance(operand, Array)
+				else repeat(operand, prod(shape))
+				for operand in (operand1, operand2)
+			)
+		if not isinstance(operand1, Array):
+			return operand2.shape, repeat(operand1, operand2.size), operand2._flat_values()
+		if not isinstance(operand2, Array):
+			return operand1.shape, operand1._flat_values(), repeat(operand2, operand1.size)
+		if operand1.shape == operand2.shape:
+			return operand1.shape, operand1._flat_values(), operand2._flat_values()
+
+		new_shape = cls._broadcast_shapes(operand1.shape, operand2.shape)
+		return (
+			new_shape,
+			operand1._broadcast_values(new_shape),
+			operand2._broadcast_values(new_shape),
+		)
 
 	@staticmethod
 	def _sanitize_operand(operand: any) -> None:
@@ -407,219 +1108,700 @@ class Array:
 			raise ValueError(f"Unsopported operation for types {Array} and {type(operand)}")
 		pass
 
+	@staticmethod
+	def _dtype_of(operand: Array | int | float) -> DType | type[int] | type[float] | type[bool]:
+		"""
+		Returns the dtype of an operand, be it an array or a scalar (whose Python type stands for
+		its weak dtype, see dtypes.result_type).
+		"""
+		return operand.dtype if isinstance(operand, Array) else type(operand)
+
+	@staticmethod
+	def _shape_of(operand: Array | int | float) -> tuple[int]:
+		"""
+		Returns the shape of an operand, be it an array or a scalar.
+		"""
+		return operand.shape if isinstance(operand, Array) else ()
+
 	def __add__(self, right_operand: Array | int | float) -> Array:
-		self._sanitize_operand(right_operand)
-		right_operand = (
-			Array([right_operand]) if isinstance(right_operand, (int, float)) else right_operand
-		)
-		new_type = float if float in {self.dtype, right_operand.dtype} else int
-		return self._operation_with_broadcasting(self, right_operand, "add", new_type)
+		return self._apply_ufunc("add", self, right_operand)
 
 	__radd__ = __add__
 
+	def __iadd__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("add", self, right_operand, out=self)
+
 	def __sub__(self, right_operand: Array | int | float) -> Array:
-		self._sanitize_operand(right_operand)
-		right_operand = (
-			Array([right_operand]) if isinstance(right_operand, (int, float)) else right_operand
-		)
-		new_type = float if float in {self.dtype, right_operand.dtype} else int
-		return self._operation_with_broadcasting(self, right_operand, "sub", new_type)
+		return self._apply_ufunc("subtract", self, right_operand)
 
 	def __rsub__(self, left_operand: Array | int | float) -> Array:
-		self._sanitize_operand(left_operand)
-		left_operand = (
-			Array([left_operand]) if isinstance(left_operand, (int, float)) else left_operand
-		)
-		new_type = float if float in {self.dtype, left_operand.dtype} else int
-		return self._operation_with_broadcasting(left_operand, self, "sub", new_type)
+		return self._apply_ufunc("subtract", left_operand, self)
+
+	def __isub__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("subtract", self, right_operand, out=self)
 
 	def __mul__(self, right_operand: Array | int | float) -> Array:
-		self._sanitize_operand(right_operand)
-		right_operand = (
-			Array([right_operand]) if isinstance(right_operand, (int, float)) else right_operand
-		)
-		new_type = float if float in {self.dtype, right_operand.dtype} else int
-		return self._operation_with_broadcasting(self, right_operand, "mul", new_type)
+		return self._apply_ufunc("multiply", self, right_operand)
 
 	__rmul__ = __mul__
 
+	def __imul__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("multiply", self, right_operand, out=self)
+
 	def __truediv__(self, right_operand: Array | int | float) -> Array:
-		self._sanitize_operand(right_operand)
-		right_operand = (
-			Array([right_operand]) if isinstance(right_operand, (int, float)) else right_operand
-		)
-		return self._operation_with_broadcasting(self, right_operand, "truediv", float)
+		return self._apply_ufunc("divide", self, right_operand)
 
 	def __rtruediv__(self, left_operand: Array | int | float) -> Array:
-		self._sanitize_operand(left_operand)
-		left_operand = (
-			Array([left_operand]) if isinstance(left_operand, (int, float)) else left_operand
-		)
-		return self._operation_with_broadcasting(left_operand, self, "truediv", float)
+		return self._apply_ufunc("divide", left_operand, self)
+
+	def __itruediv__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("divide", self, right_operand, out=self)
+
+	def __floordiv__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("floor_divide", self, right_operand)
+
+	def __rfloordiv__(self, left_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("floor_divide", left_operand, self)
+
+	def __ifloordiv__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("floor_divide", self, right_operand, out=self)
+
+	def __mod__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("remainder", self, right_operand)
+
+	def __rmod__(self, left_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("remainder", left_operand, self)
+
+	def __imod__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("remainder", self, right_operand, out=self)
 
 	def __pow__(self, right_operand: Array | int | float) -> Array:
-		self._sanitize_operand(right_operand)
-		right_operand = (
-			Array([right_operand]) if isinstance(right_operand, (int, float)) else right_operand
-		)
-		new_type = float if float in {self.dtype, right_operand.dtype} else int
-		return self._operation_with_broadcasting(self, right_operand, "pow", new_type)
+		return self._apply_ufunc("power", self, right_operand)
 
 	def __rpow__(self, left_operand: Array | int | float) -> Array:
-		self._sanitize_operand(left_operand)
-		left_operand = (
-			Array([left_operand]) if isinstance(left_operand, (int, float)) else left_operand
-		)
-		new_type = float if float in {self.dtype, left_operand.dtype} else int
-		return self._operation_with_broadcasting(left_operand, self, "pow", new_type)
+		return self._apply_ufunc("power", left_operand, self)
 
-	# Aggregation methods
-	def _general_aggregate(self, axis: tuple[int] | None = None) -> Array:
-		if axis is None:
-			axis = (-1,)
-		if not isinstance(axis, tuple):
-			raise ValueError("Axis given is not a tuple of int or None.")
+	def __ipow__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("power", self, right_operand, out=self)
 
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
+	def __neg__(self) -> Array:
+		return self._ufuncs["negative"](self)
 
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
+	def __abs__(self) -> Array:
+		return self._ufuncs["absolute"](self)
 
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = (
-				stored_value + current_value
-			)
+	# comparisons, elementwise into bool arrays
+	def __lt__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("less", self, right_operand)
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+	def __le__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("less_equal", self, right_operand)
 
-		return new_array
+	def __gt__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("greater", self, right_operand)
 
-	def sum(self, axis: tuple[int] | None = None) -> Array:
-		if axis is None:
-			axis = (-1,)
-		if not isinstance(axis, tuple):
-			raise ValueError("Axis given is not a tuple of int or None.")
+	def __ge__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("greater_equal", self, right_operand)
+
+	def __eq__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("equal", self, right_operand)
 
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
+	def __ne__(self, right_operand: Array | int | float) -> Array:
+		return self._apply_ufunc("not_equal", self, right_operand)
 
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
+	# elementwise equality makes arrays unhashable, same as in numpy
+	__hash__ = None
 
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = (
-				stored_value + current_value
+	def __bool__(self) -> bool:
+		"""
+		Truth value of the element of a size-1 array. Raises ValueError for any other size, as the
+		truth value of e.g. an elementwise comparison between arrays is ambiguous.
+		"""
+		if self.size == 0:
+			raise ValueError("The truth value of an empty array is ambiguous")
+		if self.size > 1:
+			raise ValueError(
+				"The truth value of an array with more than one element is ambiguous. "
+				"Use a.any() or a.all()"
 			)
+		return bool(self.data[self.offset])
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+	def __contains__(self, value: Array | list | int | float) -> bool:
+		"""
+		Whether any element of the array equals value (compared elementwise), same as in numpy.
+		"""
+		return bool(self._ufuncs["equal"](self, value).any())
 
-		return new_array
+	# linear algebra
+	@staticmethod
+	def _matmul_kernel(
+		left: memoryview,
+		right_transposed: memoryview,
+		out: memoryview,
+		n: int,
+		k: int,
+		m: int,
+		dtype: DType,
+	) -> None:
+		"""
+		Writes into out (of given dtype) the (n, m) product of the (n, k) matrix in left and the
+		(k, m) matrix whose transpose is stored in right_transposed. All buffers must be contiguous
+		(C order).
+
+		Both operands are read row by row, so each output element is the dot product of two
+		contiguous rows. The output is computed in strips of _MATMUL_BLOCK_SIZE columns: the
+		columns of a strip are unpacked once and reused for every row of left, so only they (and
+		the current row) are unpacked at any time.
+		"""
+		for col_start in range(0, m, _MATMUL_BLOCK_SIZE):
+			col_stop = min(col_start + _MATMUL_BLOCK_SIZE, m)
+			cols = [
+				right_transposed[j * k : (j + 1) * k].tolist() for j in range(col_start, col_stop)
+			]
+			for i in range(n):
+				row = left[i * k : (i + 1) * k].tolist()
+				out[i * m + col_start : i * m + col_stop] = Array._make_buffer(
+					dtype, [sumprod(row, col) for col in cols]
+				)
 
-	def mean(self, axis: tuple[int] | None = None) -> Array:
-		if axis is None:
-			axis = (-1,)
-		if not isinstance(axis, tuple):
-			raise ValueError("Axis given is not a tuple of int or None.")
+	@classmethod
+	@_instrumented("matmul")
+	def _matmul(
+		cls,
+		operand1: Array,
+		operand2: Array,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Matrix product of both arrays, following numpy's matmul semantics.
 
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
+		Arrays of more than 2 dimensions are treated as stacks of matrices in their last two
+		dimensions, with the leading (batch) dimensions broadcasted together. 1-dimensional arrays
+		are promoted to a matrix by prepending (left) or appending (right) a dimension of length 1,
+		which is removed from the result.
+		"""
+		if not (isinstance(operand1, Array) and isinstance(operand2, Array)):
+			raise ValueError("Matrix multiplication is not supported for scalars.")
+		if operand1.ndim == 0 or operand2.ndim == 0:
+			raise ValueError("Matrix multiplication is not supported for 0-dimensional arrays.")
+
+		left = operand1.reshape((1, operand1.size)) if operand1.ndim == 1 else operand1
+		right = operand2.reshape((operand2.size, 1)) if operand2.ndim == 1 else operand2
+		*left_batch, n, k = left.shape
+		*right_batch, k2, m = right.shape
+		if k != k2:
+			raise ValueError(
+				f"Mismatch in core dimension for matrix multiplication of shapes {operand1.shape} "
+				f"and {operand2.shape}"
+			)
+		batch_shape = cls._broadcast_shapes(tuple(left_batch), tuple(right_batch))
+		new_shape = batch_shape + (n, m)
+
+		# operands are laid out contiguously once, with the right one transposed
+		left = left.ascontiguousarray()
+		right_axes = tuple(range(right.ndim - 2)) + (right.ndim - 1, right.ndim - 2)
+		right = right.transpose(right_axes).copy()
+
+		# booleans are summed as ints, same as in the arithmetic ufuncs
+		resulting_dtype = dtypes.result_type(operand1.dtype, operand2.dtype)
+		if resulting_dtype is bool_:
+			resulting_dtype = int64
+		# every element is written by the kernel
+		result = cls.array_from_shape(new_shape, resulting_dtype, fill_value=None)
+
+		# matrices of broadcasted batch dimensions are reused, by walking them with 0 strides
+		left_batch_strides = left._broadcast_strides(batch_shape + (n, k))[:-2]
+		right_batch_strides = right._broadcast_strides(batch_shape + (m, k))[:-2]
+		left_starts = cls._strided_offsets(batch_shape, left_batch_strides, left.offset)
+		right_starts = cls._strided_offsets(batch_shape, right_batch_strides, right.offset)
+		for idx, (left_start, right_start) in enumerate(zip(left_starts, right_starts)):
+			cls._matmul_kernel(
+				left.data[left_start : left_start + n * k],
+				right.data[right_start : right_start + m * k],
+				result.data[idx * n * m : (idx + 1) * n * m],
+				n,
+				k,
+				m,
+				resulting_dtype,
+			)
 
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
+		# remove the dimensions added to 1-dimensional operands
+		final_shape = (
+			batch_shape + ((n,) if operand1.ndim > 1 else ()) + ((m,) if operand2.ndim > 1 else ())
+		)
+		result = result.reshape(final_shape)
 
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = (
-				stored_value + current_value
-			)
+		if out is not None:
+			out._check_out(final_shape, resulting_dtype)
+			out._assign_values(result._broadcast_values(out.shape))
+			return out
+		if result.ndim == 0:
+			return result.data[0]
+		return result
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+	def __matmul__(self, right_operand: Array) -> Array | int | float:
+		return self._matmul(self, right_operand)
 
-		denominator = prod([elem for idx, elem in enumerate(self.shape) if idx in axis])
+	def __rmatmul__(self, left_operand: Array) -> Array | int | float:
+		return self._matmul(left_operand, self)
 
-		new_array.data = [elem / denominator for elem in new_array.data]
+	@_instrumented("dot")
+	def dot(self, operand: Array | int | float, out: Array | None = None) -> Array | int | float:
+		"""
+		Dot product of the array with operand, following numpy's dot semantics.
 
-		return new_array
+		For 1 and 2-dimensional arrays it is the inner product of vectors or the matrix product.
+		For N-dimensional arrays, it is a sum product over the last axis of the array and the
+		second-to-last axis of operand. Scalars are just multiplied.
+		"""
+		if not isinstance(operand, Array) or self.ndim == 0 or operand.ndim == 0:
+			return self._ufuncs["multiply"](self, operand, out=out)
+		if self.ndim <= 2 and operand.ndim <= 2:
+			return self._matmul(self, operand, out)
+
+		# N-dimensional case: flatten both operands into matrices, and reuse the matmul kernel
+		k = self.shape[-1]
+		if operand.shape[-2 if operand.ndim > 1 else -1] != k:
+			raise ValueError(
+				f"Shapes {self.shape} and {operand.shape} are not aligned for the dot product"
+			)
+		if operand.ndim == 1:
+			other_shape = ()
+			right = operand.reshape((k, 1))
+		else:
+			other_shape = operand.shape[:-2] + operand.shape[-1:]
+			right_axes = tuple(range(operand.ndim - 2)) + (operand.ndim - 1, operand.ndim - 2)
+			right = operand.transpose(right_axes).reshape((prod(other_shape), k)).T
+		left = self.reshape((prod(self.shape[:-1]), k))
+		result = self._matmul(left, right).reshape(self.shape[:-1] + other_shape)
+		if out is not None:
+			out._check_out(result.shape, result.dtype)
+			out._assign_values(result._broadcast_values(out.shape))
+			return out
+		return result
 
-	def max(self, axis: tuple[int] | None = None) -> Array:
+	# Aggregation methods
+	@staticmethod
+	def _normalize_axes(axis: int | tuple[int] | None, ndim: int) -> tuple[int]:
+		"""
+		Returns the sorted, non-negative axes referred to by axis, for an array of ndim dimensions.
+		None refers to all axes.
+
+		Raises ValueError for out of bounds or repeated axes.
+		"""
 		if axis is None:
-			axis = (-1,)
+			return tuple(range(ndim))
+		if isinstance(axis, int):
+			axis = (axis,)
 		if not isinstance(axis, tuple):
-			raise ValueError("Axis given is not a tuple of int or None.")
+			raise ValueError("Axis given is not an int, a tuple of int or None.")
+
+		axes = []
+		for ax in axis:
+			if not isinstance(ax, int) or not -ndim <= ax < ndim:
+				raise ValueError(f"Axis {ax} is out of bounds for array of dimension {ndim}")
+			axes.append(ax % ndim)
+		if len(set(axes)) != len(axes):
+			raise ValueError("Repeated axis given for reduction.")
+		return tuple(sorted(axes))
+
+	def _reduce(
+		self,
+		kernel,
+		axis: int | tuple[int] | None,
+		keepdims: bool,
+		resulting_dtype: DType,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Reduces the array along the given axes, with kernel.
 
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
+		The kernel receives an iterable over the elements of each reduced block (in C order of the
+		reduced axes) and returns its reduction. Reduced axes are walked as an inner strided loop
+		directly on the buffer, so each block is a zero-copy memoryview slice whenever the reduced
+		axes can be merged into a single strided row.
 
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
+		Reducing over all axes (axis=None) returns a scalar, unless keepdims is True. If out is
+		given, the result is written into it instead, and out is returned.
+		"""
+		axes = self._normalize_axes(axis, self.ndim)
+		outer_shape = tuple(dim for ax, dim in enumerate(self.shape) if ax not in axes)
+		outer_strides = tuple(stride for ax, stride in enumerate(self.strides) if ax not in axes)
+		inner_shape, inner_strides = self._coalesce_dims(
+			tuple(self.shape[ax] for ax in axes), tuple(self.strides[ax] for ax in axes)
+		)
 
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = max(
-				stored_value, current_value
-			)
+		starts = self._strided_offsets(outer_shape, outer_strides, self.offset)
+		if prod(inner_shape) == 0:
+			results = [kernel(()) for _ in starts]
+		elif len(inner_shape) == 0:
+			results = [kernel(self.data[start : start + 1]) for start in starts]
+		elif len(inner_shape) == 1:
+			length, stride = inner_shape[0], inner_strides[0]
+			results = [
+				kernel(self._strided_row(self.data, start, length, stride)) for start in starts
+			]
+		else:
+			results = [
+				kernel(
+					chain.from_iterable(
+						self._strided_rows(self.data, inner_shape, inner_strides, start)
+					)
+				)
+				for start in starts
+			]
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+		new_shape = (
+			tuple(1 if ax in axes else dim for ax, dim in enumerate(self.shape))
+			if keepdims
+			else outer_shape
+		)
+		if out is not None:
+			if out.shape != new_shape:
+				raise ValueError(
+					f"Output array of shape {out.shape} does not match the reduction's shape "
+					f"{new_shape}"
+				)
+			out._check_out(new_shape, resulting_dtype)
+			out._assign_values(results)
+			return out
+		if axis is None and not keepdims:
+			return results[0]
+		return self._from_data(
+			self._make_buffer(resulting_dtype, results), new_shape, resulting_dtype
+		)
 
-		return new_array
+	def _accumulation_dtype(self) -> DType:
+		"""
+		Returns the dtype of sums and products of the array's elements: bools and integers are
+		accumulated as 64 bit integers (of the same signedness), same as numpy.
+		"""
+		if self.dtype.kind == "u":
+			return uint64
+		return self.dtype if self.dtype.kind == "f" else int64
 
-	def min(self, axis: tuple[int] | None = None) -> Array:
-		if axis is None:
-			axis = (-1,)
-		if not isinstance(axis, tuple):
-			raise ValueError("Axis given is not a tuple of int or None.")
+	@staticmethod
+	def _extremum_kernel(function, name: str, initial: int | float | None):
+		"""
+		Returns a reduction kernel for max or min, starting from initial if given.
+		"""
 
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
+		def kernel(values):
+			result = function(values, default=initial)
+			if result is None:
+				raise ValueError(f"Zero-size array to reduction operation {name} has no identity")
+			return result if initial is None else function(result, initial)
+
+		return kernel
+
+	@_instrumented("sum")
+	@_parallelizable_reduction
+	def sum(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		initial: int | float = 0,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Sum of the elements along the given axes, or of all of them if axis is None.
+		"""
+		return self._reduce(
+			lambda values: sum(values, initial), axis, keepdims, self._accumulation_dtype(), out
+		)
 
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
+	@_instrumented("prod")
+	@_parallelizable_reduction
+	def prod(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		initial: int | float = 1,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Product of the elements along the given axes, or of all of them if axis is None.
+		"""
+		return self._reduce(
+			lambda values: prod(values, start=initial),
+			axis,
+			keepdims,
+			self._accumulation_dtype(),
+			out,
+		)
 
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = min(
-				stored_value, current_value
-			)
+	@_instrumented("mean")
+	@_parallelizable_reduction
+	def mean(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		out: Array | None = None,
+	) -> Array | float:
+		"""
+		Mean of the elements along the given axes, or of all of them if axis is None.
+		"""
+		count = prod(self.shape[ax] for ax in self._normalize_axes(axis, self.ndim))
+		return self._reduce(
+			lambda values: sum(values) / count if count else float("nan"),
+			axis,
+			keepdims,
+			self.dtype if self.dtype.kind == "f" else float64,
+			out,
+		)
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+	@_instrumented("max")
+	@_parallelizable_reduction
+	def max(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		initial: int | float | None = None,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Maximum of the elements along the given axes, or of all of them if axis is None.
+		"""
+		kernel = self._extremum_kernel(max, "maximum", initial)
+		return self._reduce(kernel, axis, keepdims, self.dtype, out)
+
+	@_instrumented("min")
+	@_parallelizable_reduction
+	def min(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		initial: int | float | None = None,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Minimum of the elements along the given axes, or of all of them if axis is None.
+		"""
+		kernel = self._extremum_kernel(min, "minimum", initial)
+		return self._reduce(kernel, axis, keepdims, self.dtype, out)
 
-		return new_array
+	@staticmethod
+	def _arg_extremum_kernel(function, name: str):
+		"""
+		Returns a reduction kernel for the index of the first max or min of each block, or of its
+		first NaN if it has any (same as numpy).
+		"""
 
-	def argmax(self, axis: int) -> Array:
-		"""Comput the argmax along given axis"""
-		# TODO: further sanity checking is necessary.
-		new_shape = [elem for idx, elem in enumerate(self.shape) if idx not in axis]
-		new_array = self.array_from_shape(new_shape)
-
-		# create starting multi-idx, to iterate over all its possible values
-		multi_idx = tuple([0 for _ in self.shape])
-		for _ in range(self.size):
-			current_value = self.data[self._flatten_multi_idx(multi_idx, self.shape)]
-			adapted_multi_idx = [elem for idx, elem in enumerate(multi_idx) if idx not in axis]
-			stored_value = new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)]
-
-			new_array.data[self._flatten_multi_idx(adapted_multi_idx, new_shape)] = max(
-				stored_value, current_value
-			)
+		def kernel(values):
+			values = list(values)
+			if len(values) == 0:
+				raise ValueError(f"Attempt to get {name} of an empty sequence")
+			if isinstance(values[0], float):
+				nans = list(map(isnan, values))
+				if True in nans:
+					return nans.index(True)
+			return values.index(function(values))
+
+		return kernel
+
+	@_instrumented("argmax")
+	@_parallelizable_reduction
+	def argmax(
+		self,
+		axis: int | None = None,
+		keepdims: bool = False,
+		out: Array | None = None,
+	) -> Array | int:
+		"""
+		Indices of the maximum values along the given axis.
 
-			multi_idx = self._circular_increment_multi_idx(multi_idx, self.shape)
+		If axis is None, the index is into the flattened array.
+		"""
+		if not (axis is None or isinstance(axis, int)):
+			raise ValueError("Axis given is not an int or None.")
+		kernel = self._arg_extremum_kernel(max, "argmax")
+		return self._reduce(kernel, axis, keepdims, int64, out)
+
+	@_instrumented("argmin")
+	@_parallelizable_reduction
+	def argmin(
+		self,
+		axis: int | None = None,
+		keepdims: bool = False,
+		out: Array | None = None,
+	) -> Array | int:
+		"""
+		Indices of the minimum values along the given axis.
 
-		return new_array
+		If axis is None, the index is into the flattened array.
+		"""
+		if not (axis is None or isinstance(axis, int)):
+			raise ValueError("Axis given is not an int or None.")
+		kernel = self._arg_extremum_kernel(min, "argmin")
+		return self._reduce(kernel, axis, keepdims, int64, out)
+
+	@_instrumented("any")
+	@_parallelizable_reduction
+	def any(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		out: Array | None = None,
+	) -> Array | bool:
+		"""
+		Whether any element along the given axes evaluates to True.
+		"""
+		return self._reduce(any, axis, keepdims, bool_, out)
+
+	@_instrumented("all")
+	@_parallelizable_reduction
+	def all(
+		self,
+		axis: int | tuple[int] | None = None,
+		keepdims: bool = False,
+		out: Array | None = None,
+	) -> Array | bool:
+		"""
+		Whether all elements along the given axes evaluate to True.
+		"""
+		return self._reduce(all, axis, keepdims, bool_, out)
+
+	# ordering
+	def _lanes(self, axis: int) -> tuple:
+		"""
+		Returns the buffer offsets where each 1-dimensional lane of the array along axis starts
+		(in C order of the other axes), along with the length and stride of the lanes.
+		"""
+		if not isinstance(axis, int):
+			raise ValueError("Axis given is not an int.")
+		(axis,) = self._normalize_axes(axis, self.ndim)
+		outer_shape = self.shape[:axis] + self.shape[axis + 1 :]
+		outer_strides = self.strides[:axis] + self.strides[axis + 1 :]
+		starts = self._strided_offsets(outer_shape, outer_strides, self.offset)
+		return starts, self.shape[axis], self.strides[axis]
+
+	def _has_nan(self, values) -> bool:
+		"""
+		Whether values (elements of the array) contain NaNs, which do not compare as numbers.
+		"""
+		return self.dtype.kind == "f" and any(map(isnan, values))
+
+	def _sort_order(self, values) -> list[int]:
+		"""
+		Returns the indices sorting values (a lane of the array) stably, with NaNs last.
+		"""
+		if not self._has_nan(values):
+			return sorted(range(len(values)), key=values.__getitem__)
+		numbers = [idx for idx, value in enumerate(values) if value == value]
+		nans = [idx for idx, value in enumerate(values) if value != value]
+		return sorted(numbers, key=values.__getitem__) + nans
+
+	def _partition_order(self, values, kth: int) -> list[int]:
+		"""
+		Returns the indices of values (a lane of the array) with the kth smallest element at
+		position kth, the ones before it not larger, and the ones after it not smaller.
+
+		If kth is close to either end, only the elements up to it are selected through a heap, in
+		O(n log k) instead of sorting the whole lane.
+		"""
+		length = len(values)
+		if not -length <= kth < length:
+			raise ValueError(f"kth {kth} is out of bounds for axis of length {length}")
+		kth %= length
+		selected = min(kth + 1, length - kth)
+		if selected * _SELECTION_RATIO > length or self._has_nan(values):
+			return self._sort_order(values)
+		if kth + 1 == selected:
+			chosen = nsmallest(selected, range(length), key=values.__getitem__)
+			rest = set(chosen)
+			return chosen + [idx for idx in range(length) if idx not in rest]
+		chosen = nlargest(selected, range(length), key=values.__getitem__)
+		rest = set(chosen)
+		return [idx for idx in range(length) if idx not in rest] + chosen[::-1]
+
+	def _sorted(self, values) -> list[int | float]:
+		"""
+		Returns the values (a lane of the array) sorted, with NaNs last.
+		"""
+		if not self._has_nan(values):
+			return sorted(values)
+		return [values[idx] for idx in self._sort_order(values)]
+
+	def _reorder_lanes(self, axis: int, reorder, target: Array) -> None:
+		"""
+		Writes the lanes of the array along axis, transformed by reorder, into the lanes of target
+		(of the same shape, and possibly the array itself).
+
+		reorder receives each lane as a sequence, and returns a list of the same length.
+		"""
+		starts, length, stride = self._lanes(axis)
+		target_starts, _, target_stride = target._lanes(axis)
+
+		def reordered():
+			for start in starts:
+				values = self._strided_row(self.data, start, length, stride)
+				yield reorder(values if isinstance(values, memoryview) else list(values))
+
+		rows = ((start, length, target_stride) for start in target_starts)
+		target._assign_rows(rows, chain.from_iterable(reordered()))
+
+	@_instrumented("sort")
+	def sort(self, axis: int = -1) -> None:
+		"""
+		Sorts the array in place along axis (the last one by default). The sort is stable, and
+		NaNs are sorted last (same as numpy).
+		"""
+		self._reorder_lanes(axis, self._sorted, self)
+
+	@_instrumented("argsort")
+	def argsort(self, axis: int | None = -1) -> Array:
+		"""
+		Returns the indices that sort the array along axis (the last one by default, or the
+		flattened array if None), with a stable sort.
+		"""
+		if axis is None:
+			return self.reshape((self.size,)).argsort()
+		indices = self.array_from_shape(self.shape, int64, None)
+		self._reorder_lanes(axis, self._sort_order, indices)
+		return indices
+
+	@_instrumented("partition")
+	def partition(self, kth: int, axis: int = -1) -> None:
+		"""
+		Rearranges the array in place along axis (the last one by default), so the element at
+		position kth is the one a sort would put there, with no larger elements before it and no
+		smaller elements after it. The order within both sides is undefined.
+
+		Selecting the top (or bottom) k elements only takes O(n log k), instead of a full sort.
+		"""
+
+		def reorder(values):
+			return [values[idx] for idx in self._partition_order(values, kth)]
+
+		self._reorder_lanes(axis, reorder, self)
+
+	@_instrumented("argpartition")
+	def argpartition(self, kth: int, axis: int | None = -1) -> Array:
+		"""
+		Returns the indices that partition the array along axis (the last one by default, or the
+		flattened array if None) around its kth element, see partition.
+		"""
+		if axis is None:
+			return self.reshape((self.size,)).argpartition(kth)
+		indices = self.array_from_shape(self.shape, int64, None)
+		self._reorder_lanes(axis, lambda values: self._partition_order(values, kth), indices)
+		return indices
+
+	@_instrumented("searchsorted")
+	def searchsorted(self, values: Array | int | float, side: str = "left") -> Array | int:
+		"""
+		Returns the indices where values would be inserted into the (sorted, 1-dimensional) array
+		to keep it sorted, before equal elements if side is "left", or after them if "right".
+		"""
+		if self.ndim != 1:
+			raise ValueError("searchsorted needs a 1-dimensional array")
+		if side not in ("left", "right"):
+			raise ValueError(f"Invalid side {side!r}. Expected 'left' or 'right'")
+		search = bisect_left if side == "left" else bisect_right
+		flat_values = self._flat_values()
+		if not isinstance(flat_values, memoryview):
+			flat_values = list(flat_values)
+		if not isinstance(values, Array):
+			return search(flat_values, values)
+		indices = (search(flat_values, value) for value in values._flat_values())
+		return self._from_data(self._make_buffer(int64, indices), values.shape, int64)
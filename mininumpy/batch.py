@@ -0,0 +1,106 @@
+# File with the batched execution of functions over many small arrays at once.
+from __future__ import annotations  # for typehinting within the module
+
+from functools import wraps
+
+from .array import Array
+from .core import stack, unstack
+
+
+def _to_batch(argument, axis: int) -> tuple[Array, bool]:
+	"""
+	Returns the batched argument as an array with its batch axis first, and whether it was given
+	as a sequence of items (stacked into a new array) instead of an array.
+	"""
+	if not isinstance(argument, Array):
+		return stack(argument), True
+	(axis,) = Array._normalize_axes(axis, argument.ndim)
+	if axis == 0:
+		return argument, False
+	permutation = (axis, *range(axis), *range(axis + 1, argument.ndim))
+	return argument.transpose(permutation), False
+
+
+def _expand_items(batch: Array, ndim: int) -> Array:
+	"""
+	Returns a view of batch whose items have ndim dimensions, adding leading axes of length 1 to
+	them, so they broadcast against unbatched arrays the same as each item alone would.
+	"""
+	padding = ndim - (batch.ndim - 1)
+	if padding <= 0:
+		return batch
+	shape = (batch.shape[0], *(1,) * padding, *batch.shape[1:])
+	strides = (batch.strides[0], *(0,) * padding, *batch.strides[1:])
+	return batch._view(shape, strides, batch.offset)
+
+
+def _check_batched(result, batch_size: int) -> None:
+	"""
+	Raises exception if result is not an array whose first axis is the batch.
+	"""
+	if not isinstance(result, Array) or result.ndim == 0 or result.shape[0] != batch_size:
+		raise ValueError(
+			"Batched function must return arrays keeping the batch as first axis (e.g. reduce "
+			"along negative axes instead of all of them)"
+		)
+
+
+def vmap(function, in_axes: int | tuple[int | None] | None = 0):
+	"""
+	Vectorizes function, written for single arrays, so it runs once over a whole batch of them.
+
+	Each argument is batched along in_axes (one axis for all of them, or one per argument, None
+	for arguments shared by every item): either an array with the batch along that axis, or a
+	sequence of same-shape items (arrays, lists or numbers), which are stacked into one array.
+	The function is then called a single time with the batch as first axis of its arguments, and
+	returns the batched result (or tuple of them), unpacked into a list with the result of each
+	item if any argument was given as a sequence:
+
+		center = mnp.vmap(lambda x, w: (x - x.mean(axis=-1, keepdims=True)) * w, in_axes=(0, None))
+		centered_rows = center(rows, weights)  # rows is a list of arrays of shape (n,)
+
+	The function must be made of operations acting the same on every item when given the batch
+	(elementwise operations and broadcasting, or reductions along negative axes, with keepdims).
+	"""
+
+	@wraps(function)
+	def batched(*arguments):
+		axes = in_axes if isinstance(in_axes, tuple) else (in_axes,) * len(arguments)
+		if len(axes) != len(arguments):
+			raise ValueError(f"Got {len(axes)} in_axes for {len(arguments)} arguments")
+
+		batches, unpack = {}, False
+		for position, (argument, axis) in enumerate(zip(arguments, axes)):
+			if axis is not None:
+				batches[position], from_items = _to_batch(argument, axis)
+				unpack |= from_items
+		if not batches:
+			raise ValueError("At least one argument must be batched")
+		batch_size = next(iter(batches.values())).shape[0]
+		if any(batch.shape[0] != batch_size for batch in batches.values()):
+			raise ValueError("Batched arguments have different batch sizes")
+
+		# items are expanded to the dimensions of the largest argument, so the batch axis never
+		# broadcasts against the axes of unbatched arguments
+		ndim = max(
+			batches[position].ndim - 1 if position in batches else argument.ndim
+			for position, argument in enumerate(arguments)
+			if position in batches or isinstance(argument, Array)
+		)
+		results = function(
+			*(
+				_expand_items(batches[position], ndim) if position in batches else argument
+				for position, argument in enumerate(arguments)
+			)
+		)
+
+		is_tuple = isinstance(results, tuple)
+		for result in results if is_tuple else (results,):
+			_check_batched(result, batch_size)
+		if not unpack:
+			return results
+		if is_tuple:
+			return list(zip(*(unstack(result) for result in results)))
+		return list(unstack(results))
+
+	return batched
@@ -1,4 +1,14 @@
-from .array import Array
+import ctypes
+import itertools
+import math
+import operator
+import sys
+from itertools import islice
+
+from . import dtypes
+from .array import Array, _instrumented
+from .dtypes import DType
+from .ufunc import multiply
 
 """
 Would be nice to put all this under a unique class. Check later how to do so.
@@ -9,48 +19,262 @@ Would be nice to put all this under a unique class. Check later how to do so.
 # 	"""
 
 
+@_instrumented("array")
 def array(list_or_nested_list: list) -> Array:
 	"""Creates array from a given list"""
 	# Sanitize array
 	return Array(list_or_nested_list)
 
 
-def _singular_value_array(shape: tuple[int], value: int | float) -> Array:
-	"""Builds an array of the specified shape, with given value."""
-	size = 1
-	for dim_length in shape:
-		size *= dim_length
+def _normalize_dtype(dtype: DType | type | str) -> DType:
+	"""Helper method returning the dtype given (see dtypes.dtype), raising exception if invalid"""
+	return dtypes.dtype(dtype)
 
-	current_value = value
-	for dim in shape[::-1]:
-		if isinstance(current_value, (int, float)):
-			current_list_level = [current_value for _ in range(dim)]
-		else:  # should be list instance. Copies it along new axis.
-			current_list_level = [current_value.copy() for _ in range(dim)]
-		current_value = current_list_level
 
-	return array(current_list_level)
+@_instrumented("fromiter")
+def fromiter(
+	iterable,
+	dtype: DType | type | str,
+	count: int = -1,
+) -> Array:
+	"""
+	Creates a 1-dimensional array from the numbers of an iterable, without building any list.
+
+	If count is non-negative, only its first count elements are read, and a ValueError is raised
+	if the iterable is shorter.
+	"""
+	dtype = _normalize_dtype(dtype)
+	if count >= 0:
+		iterable = islice(iterable, count)
+	data = Array._make_buffer(dtype, iterable)
+	if count >= 0 and len(data) < count:
+		raise ValueError(f"Iterable too short: expected {count} elements, got {len(data)}")
+	return Array._from_data(data, (len(data),), dtype)
+
+
+@_instrumented("frombuffer")
+def frombuffer(
+	buffer,
+	dtype: DType | type | str = float,
+	shape: int | tuple[int] | None = None,
+	offset: int = 0,
+) -> Array:
+	"""
+	Creates an array over the raw (native byte order) contents of a bytes-like object, starting
+	offset bytes into it. The memory is shared, not copied, and is read-only if the buffer is.
+
+	If no shape is given, a 1-dimensional array with all the elements of the buffer is returned.
+	"""
+	dtype = _normalize_dtype(dtype)
+	raw_data = memoryview(buffer).cast("B")[offset:]
+	if len(raw_data) % dtype.itemsize:
+		raise ValueError(
+			f"Buffer size {len(raw_data)} is not a multiple of itemsize {dtype.itemsize}"
+		)
+	data = raw_data.cast(dtype.format)
+	shape = (len(data),) if shape is None else _normalize_shape(shape)
+	if math.prod(shape) != len(data):
+		raise ValueError(f"Cannot create array of shape {shape} from {len(data)} elements")
+	return Array._from_data(data, shape, dtype)
+
+
+def _normalize_shape(shape: int | tuple[int]) -> tuple[int]:
+	"""Helper method returning shape as a tuple, and raising exception if it is invalid"""
+	shape = (shape,) if isinstance(shape, int) else tuple(shape)
+	if not all(isinstance(dim, int) and dim >= 0 for dim in shape):
+		raise ValueError(f"Invalid shape {shape}. Expected non-negative ints")
+	return shape
+
+
+def _dtype_of_value(value: int | float | bool) -> DType:
+	"""Returns the dtype of the array holding the given value"""
+	if not isinstance(value, (int, float)):
+		raise ValueError(f"Invalid fill value of type {type(value)}")
+	return dtypes.dtype(type(value))
+
+
+# kinds of the dtypes of the elements of buffers, for each struct format
+_FORMAT_KINDS = (
+	{"?": "b", "f": "f", "d": "f"} | dict.fromkeys("bhilq", "i") | dict.fromkeys("BHILQ", "u")
+)
+
 
+def _native_dtype(format: str, itemsize: int) -> DType | None:
+	"""Returns the dtype of the elements of a buffer, if they can be used without conversion"""
+	kind = _FORMAT_KINDS.get(format.lstrip("@"))
+	return None if kind is None else dtypes._from_kind(kind, itemsize)
 
-def zeros(shape: tuple[int]) -> Array:
+
+def _copy_byte_order(view: memoryview) -> Array | None:
+	"""
+	Copies a buffer of explicit byte order (e.g. big-endian numpy arrays) into a native array,
+	byteswapping its elements if needed. Returns None if its elements are not of a known dtype.
+	"""
+	order, format = view.format[:1], view.format[1:]
+	kind = _FORMAT_KINDS.get(format)
+	if order not in "<>!=" or kind is None:
+		return None
+	dtype = dtypes._from_kind(kind, view.itemsize)
+	if dtype is None:
+		return None
+	data = Array._make_buffer(dtype, view.tobytes())
+	byteorder = {"<": "little", ">": "big", "!": "big"}.get(order, sys.byteorder)
+	if byteorder != sys.byteorder:
+		data.obj.byteswap()
+	return Array._from_data(data, view.shape, dtype)
+
+
+def _wrap_array_interface(obj, interface: dict) -> Array | None:
+	"""
+	Wraps the memory described by numpy's array interface, with its strides, without copying.
+
+	Returns None if the described memory cannot be wrapped (e.g. its dtype is not native).
+	"""
+	typestr = interface["typestr"]
+	byteorder = {"<": "little", ">": "big"}.get(typestr[0], sys.byteorder)
+	dtype = dtypes._from_kind(typestr[1], int(typestr[2:]))
+	if dtype is None or byteorder != sys.byteorder or not isinstance(interface.get("data"), tuple):
+		return None
+	pointer, readonly = interface["data"]
+	shape = tuple(interface["shape"])
+	itemsize = dtype.itemsize
+	byte_strides = interface.get("strides") or tuple(
+		stride * itemsize for stride in Array._contiguous_strides(shape)
+	)
+	if math.prod(shape) == 0 or any(stride % itemsize for stride in byte_strides):
+		return None
+
+	# span of memory covered by the array, relative to the pointer to its first element
+	start = sum(min(0, (dim - 1) * stride) for dim, stride in zip(shape, byte_strides))
+	stop = sum(max(0, (dim - 1) * stride) for dim, stride in zip(shape, byte_strides)) + itemsize
+	buffer = (ctypes.c_char * (stop - start)).from_address(pointer + start)
+	# the owner of the memory must live as long as any array over it
+	buffer._owner = obj
+	data = memoryview(buffer).cast("B").cast(dtype.format)
+	if readonly:
+		data = data.toreadonly()
+	strides = tuple(stride // itemsize for stride in byte_strides)
+	return Array._from_data(data, shape, dtype, strides, -start // itemsize)
+
+
+@_instrumented("asarray")
+def asarray(obj, dtype: DType | type | str | None = None) -> Array:
+	"""
+	Converts obj into an array, without copying whenever possible.
+
+	Arrays are returned as they are, and objects supporting the buffer protocol (bytes-like
+	objects, or numpy arrays) are wrapped sharing their memory, with their shape, strides and
+	dtype. Lists and numbers are copied, and so are buffers whose elements are not of a supported
+	dtype or of native byte order (which are converted), or whose layout cannot be wrapped.
+	Buffers of elements which cannot be converted raise a ValueError.
+	"""
+	if dtype is not None:
+		dtype = _normalize_dtype(dtype)
+
+	if isinstance(obj, (list, int, float)):
+		result = Array(obj)
+	elif isinstance(obj, Array):
+		result = obj
+	else:
+		try:
+			view = memoryview(obj)
+		except TypeError:
+			raise ValueError(f"Cannot create array from type {type(obj)}") from None
+		native_dtype = _native_dtype(view.format, view.itemsize)
+		interface = getattr(obj, "__array_interface__", None)
+		wrapped = None
+		if native_dtype is not None and view.c_contiguous and view.nbytes:
+			data = view.cast("B").cast(native_dtype.format)
+			wrapped = Array._from_data(data, view.shape, native_dtype)
+		elif interface is not None:
+			wrapped = _wrap_array_interface(obj, interface)
+		if wrapped is not None:
+			result = wrapped
+		elif (result := _copy_byte_order(view)) is None:
+			# anything else is copied, converting its elements
+			try:
+				result = Array(view.tolist())
+			except NotImplementedError:
+				raise ValueError(
+					f"Cannot create array from buffer of format {view.format}"
+				) from None
+			if result.shape != view.shape:
+				result = result.reshape(view.shape)
+
+	if dtype is None:
+		return result
+	return result.astype(dtype, copy=False)
+
+
+@_instrumented("full")
+def full(
+	shape: int | tuple[int],
+	fill_value: int | float | bool,
+	dtype: DType | type | str | None = None,
+) -> Array:
+	"""Returns an array of the specified shape filled with fill_value, of its type by default."""
+	dtype = _dtype_of_value(fill_value) if dtype is None else _normalize_dtype(dtype)
+	return Array.array_from_shape(_normalize_shape(shape), dtype, fill_value)
+
+
+@_instrumented("zeros")
+def zeros(shape: int | tuple[int], dtype: DType | type | str = int) -> Array:
 	"""Returns an array of zeros of the specified shape."""
-	return _singular_value_array(shape, 0)
+	return full(shape, 0, dtype)
 
 
-def ones(shape: tuple[int]) -> Array:
+@_instrumented("ones")
+def ones(shape: int | tuple[int], dtype: DType | type | str = int) -> Array:
 	"""Returns an array of ones of the specified shape."""
-	return _singular_value_array(shape, 1)
+	return full(shape, 1, dtype)
 
 
-def eye(n: int) -> Array:
+@_instrumented("empty")
+def empty(shape: int | tuple[int], dtype: DType | type | str = int) -> Array:
+	"""
+	Returns an array of the specified shape, whose values should not be relied upon (they are
+	left as found in the buffer, which may be recycled from a garbage-collected array).
+	"""
+	return Array.array_from_shape(_normalize_shape(shape), _normalize_dtype(dtype), None)
+
+
+@_instrumented("full_like")
+def full_like(
+	array: Array,
+	fill_value: int | float | bool,
+	dtype: DType | type | str | None = None,
+) -> Array:
+	"""Returns an array of the same shape (and dtype by default) as array, filled with fill_value."""
+	return full(array.shape, fill_value, array.dtype if dtype is None else dtype)
+
+
+@_instrumented("zeros_like")
+def zeros_like(array: Array, dtype: DType | type | str | None = None) -> Array:
+	"""Returns an array of zeros of the same shape (and dtype by default) as array."""
+	return full_like(array, 0, dtype)
+
+
+@_instrumented("ones_like")
+def ones_like(array: Array, dtype: DType | type | str | None = None) -> Array:
+	"""Returns an array of ones of the same shape (and dtype by default) as array."""
+	return full_like(array, 1, dtype)
+
+
+@_instrumented("empty_like")
+def empty_like(array: Array, dtype: DType | type | str | None = None) -> Array:
+	"""Returns an array of the same shape (and dtype by default) as array, see empty."""
+	return empty(array.shape, array.dtype if dtype is None else dtype)
+
+
+@_instrumented("eye")
+def eye(n: int, dtype: DType | type | str = int) -> Array:
 	"""Returns a square array of shape (n,n) with ones in its diagonal."""
-	# creates 2-dimensional list with proper shape and values
-	lst = [
-		[1 if idx_2 == idx else 0 for idx_2, __ in enumerate(range(n))]
-		for idx, _ in enumerate(range(n))
-	]
-	# converts to array and returns
-	return array(lst)
+	identity = zeros((n, n), dtype)
+	# the diagonal is every (n+1)-th element of the flat buffer
+	identity.data[:: n + 1] = Array._make_buffer(
+		identity.dtype, itertools.repeat(identity.dtype.type(1), n)
+	)
+	return identity
 
 
 def _check_range(start: float, stop: float) -> None:
@@ -65,62 +289,445 @@ def _check_positive(number: float, name: str) -> None:
 		raise RuntimeError(f"Invalid value ( <=0 ) for {name}")
 
 
-def arange(start: float, stop: float, step: float) -> Array:
-	# Array of values from [start,stop), with difference of
-	# step in between each pair
-
+def _from_values(
+	values,
+	length: int,
+	dtype: DType | type | str,
+	values_dtype: type[int] | type[float],
+) -> Array:
+	"""Builds a 1-dimensional array of given length and dtype from an iterable of values."""
+	dtype = _normalize_dtype(dtype)
+	if dtype.type is not values_dtype:
+		values = map(dtype.type, values)
+	return Array._from_data(Array._make_buffer(dtype, values), (length,), dtype)
+
+
+@_instrumented("arange")
+def arange(
+	start: float,
+	stop: float,
+	step: float,
+	dtype: DType | type | str | None = None,
+) -> Array:
+	"""
+	Array of values from [start,stop), with difference of step in between each pair. Its dtype
+	is int if both start and step are, and float otherwise.
+	"""
 	# sanitize input
 	_check_range(start, stop)
 	_check_positive(step, "step")
 
-	base_list = []
-	idx = 0
-	while start + idx * step < stop:
-		base_list.append(start + step * idx)
-		idx += 1
-
-	return array(base_list)
-
-
-def linspace(start: float, stop: float, num: int) -> Array:
-	# evenly num-spaced values in the interval [start,stop)
-
+	values_dtype = int if isinstance(start, int) and isinstance(step, int) else float
+	if values_dtype is int:
+		values = range(start, math.ceil(stop), step)
+		length = len(values)
+	else:
+		# guess the length, and correct it for rounding errors
+		length = math.ceil((stop - start) / step)
+		while length > 0 and start + (length - 1) * step >= stop:
+			length -= 1
+		while start + length * step < stop:
+			length += 1
+		values = (start + step * idx for idx in range(length))
+
+	return _from_values(values, length, dtype or values_dtype, values_dtype)
+
+
+@_instrumented("linspace")
+def linspace(
+	start: float,
+	stop: float,
+	num: int,
+	dtype: DType | type | str = float,
+) -> Array:
+	"""
+	Evenly num-spaced values in the interval [start,stop).
+	"""
 	# sanitize input
 	_check_range(start, stop)
 	_check_positive(num, "num")
 
 	diff = (stop - start) / num
-	base_list = []
-	for idx in range(num):
-		base_list.append(start + diff * idx)
+	values = (start + diff * idx for idx in range(num))
+
+	return _from_values(values, num, dtype, float)
+
+
+@_instrumented("ascontiguousarray")
+def ascontiguousarray(array: Array) -> Array:
+	"""
+	Return the array itself if it is contiguous in memory, or a contiguous copy otherwise.
+	"""
+	return array.ascontiguousarray()
+
 
-	return array(base_list)
+# joining and splitting
+@_instrumented("concatenate")
+def concatenate(arrays, axis: int = 0) -> Array:
+	"""
+	Joins a sequence of arrays along an existing axis (first by default). They must have the same
+	shape except along axis, and their dtypes are promoted to a common one.
 
+	The output is allocated once, and each array is copied into it in contiguous blocks (one per
+	index of the axes before axis).
+	"""
+	arrays = [asarray(item) for item in arrays]
+	if not arrays:
+		raise ValueError("Need at least one array to concatenate")
+	ndim = arrays[0].ndim
+	if ndim == 0 or any(item.ndim != ndim for item in arrays):
+		raise ValueError("Arrays to concatenate must have the same (non-zero) number of dimensions")
+	(axis,) = Array._normalize_axes(axis, ndim)
+	shape = arrays[0].shape
+	if any(
+		item.shape[:axis] + item.shape[axis + 1 :] != shape[:axis] + shape[axis + 1 :]
+		for item in arrays
+	):
+		raise ValueError(f"Arrays to concatenate must have the same shape except along axis {axis}")
+
+	dtype = dtypes.result_type(*(item.dtype for item in arrays))
+	new_shape = shape[:axis] + (sum(item.shape[axis] for item in arrays),) + shape[axis + 1 :]
+	data = Array._allocate_buffer(dtype, math.prod(new_shape))
+	outer_size = math.prod(shape[:axis])
+	row_size = math.prod(new_shape[axis:])
+	position = 0
+	for item in arrays:
+		values = (item if item.dtype is dtype else item.astype(dtype)).ascontiguousarray()
+		values = values._flat_values()
+		block_size = math.prod(item.shape[axis:])
+		for outer_idx in range(outer_size if block_size else 0):
+			start = outer_idx * row_size + position
+			data[start : start + block_size] = values[
+				outer_idx * block_size : (outer_idx + 1) * block_size
+			]
+		position += block_size
+	return Array._from_data(data, new_shape, dtype)
+
+
+def _expand_dims(array: Array, axis: int) -> Array:
+	"""Helper method returning a view of array with a new axis of length 1 at position axis"""
+	shape = array.shape[:axis] + (1,) + array.shape[axis:]
+	strides = array.strides[:axis] + (0,) + array.strides[axis:]
+	return array._view(shape, strides, array.offset)
+
+
+@_instrumented("stack")
+def stack(arrays, axis: int = 0) -> Array:
+	"""
+	Joins a sequence of arrays of the same shape along a new axis (first by default). Numbers and
+	lists are accepted as well, and dtypes are promoted to a common one.
 
-# element-wise operations
-def exp(array: Array) -> Array:
+	The elements are block-copied into a single buffer, allocated once (see concatenate).
+	"""
+	arrays = list(arrays)
+	if not arrays:
+		raise ValueError("Need at least one array to stack")
+	if all(isinstance(item, (int, float)) for item in arrays):
+		# sequences of numbers (e.g. a batch of scalars) are converted all at once
+		Array._normalize_axes(axis, 1)
+		return Array(arrays)
+	arrays = [asarray(item) for item in arrays]
+	shape = arrays[0].shape
+	if any(item.shape != shape for item in arrays):
+		raise ValueError("All arrays to stack must have the same shape")
+	(axis,) = Array._normalize_axes(axis, len(shape) + 1)
+	return concatenate([_expand_dims(item, axis) for item in arrays], axis)
+
+
+def vstack(arrays) -> Array:
 	"""
-	Return a copy of the array with elements e^(elem).
+	Joins a sequence of arrays vertically (along the first axis), with 1-dimensional arrays taken
+	as rows.
 	"""
-	return array.exp()
+	arrays = [asarray(item) for item in arrays]
+	return concatenate([_expand_dims(item, 0) if item.ndim == 1 else item for item in arrays], 0)
 
 
-def log(array: Array) -> Array:
+def hstack(arrays) -> Array:
 	"""
-	Return a copy of the array with elements log_e(elem).
+	Joins a sequence of arrays horizontally (along the second axis, or the first one for
+	1-dimensional arrays).
 	"""
-	return array.log()
+	arrays = [asarray(item) for item in arrays]
+	return concatenate(arrays, 0 if arrays and arrays[0].ndim == 1 else 1)
 
 
-def sqrt(array: Array) -> Array:
+def unstack(array: Array, axis: int = 0) -> tuple[Array]:
+	"""
+	Splits array along axis (the first by default) into a tuple of views, the inverse of stack.
+	"""
+	(axis,) = Array._normalize_axes(axis, array.ndim)
+	shape = array.shape[:axis] + array.shape[axis + 1 :]
+	strides = array.strides[:axis] + array.strides[axis + 1 :]
+	stride = array.strides[axis]
+	return tuple(
+		array._view(shape, strides, array.offset + idx * stride) for idx in range(array.shape[axis])
+	)
+
+
+def array_split(array: Array, indices_or_sections: int | list[int], axis: int = 0) -> list[Array]:
+	"""
+	Splits array along axis into a list of views, either at the given indices, or into the given
+	number of sections (of sizes differing by at most 1, the larger ones first).
+	"""
+	(axis,) = Array._normalize_axes(axis, array.ndim)
+	length = array.shape[axis]
+	if isinstance(indices_or_sections, int):
+		if indices_or_sections <= 0:
+			raise ValueError("Number of sections must be larger than 0")
+		size, extra = divmod(length, indices_or_sections)
+		sizes = [size + 1] * extra + [size] * (indices_or_sections - extra)
+		bounds = [0, *itertools.accumulate(sizes)]
+	else:
+		# negative indices count from the end, and indices are clipped to the axis
+		indices = (idx + length if idx < 0 else idx for idx in indices_or_sections)
+		bounds = [0, *(min(max(idx, 0), length) for idx in indices), length]
+
+	stride = array.strides[axis]
+	views = []
+	for start, stop in itertools.pairwise(bounds):
+		stop = max(start, stop)
+		shape = array.shape[:axis] + (stop - start,) + array.shape[axis + 1 :]
+		views.append(array._view(shape, array.strides, array.offset + start * stride))
+	return views
+
+
+def split(array: Array, indices_or_sections: int | list[int], axis: int = 0) -> list[Array]:
+	"""
+	Splits array along axis into a list of views, see array_split, except that the number of
+	sections must divide the length of the axis evenly.
+	"""
+	if isinstance(indices_or_sections, int) and array.shape[axis] % max(indices_or_sections, 1):
+		raise ValueError("Array split does not result in an equal division")
+	return array_split(array, indices_or_sections, axis)
+
+
+def broadcast_to(array: Array, shape: int | tuple[int]) -> Array:
+	"""
+	Returns a read-only view of array broadcasted into shape, without copying (the broadcasted
+	dimensions revisit the same elements).
+	"""
+	array = asarray(array)
+	shape = _normalize_shape(shape)
+	if len(shape) < array.ndim or Array._broadcast_shapes(array.shape, shape) != shape:
+		raise ValueError(f"Array of shape {array.shape} cannot be broadcasted to shape {shape}")
+	base = array if array.base is None else array.base
+	return Array._from_data(
+		array.data.toreadonly(),
+		shape,
+		array.dtype,
+		array._broadcast_strides(shape),
+		array.offset,
+		base,
+	)
+
+
+@_instrumented("tile")
+def tile(array: Array, reps: int | tuple[int]) -> Array:
+	"""
+	Returns array repeated reps times along each axis (prepending axes of length 1 to whichever
+	of array and reps has less dimensions).
+
+	The repetitions are a broadcasted view of array, copied into a single buffer.
+	"""
+	array = asarray(array)
+	reps = _normalize_shape(reps)
+	ndim = max(array.ndim, len(reps))
+	reps = (1,) * (ndim - len(reps)) + reps
+	shape = (1,) * (ndim - array.ndim) + array.shape
+	strides = (0,) * (ndim - array.ndim) + array.strides
+	# each axis of array is preceded by a broadcasted axis of its repetitions
+	repeated = array._view(
+		tuple(itertools.chain.from_iterable(zip(reps, shape))),
+		tuple(itertools.chain.from_iterable(zip(itertools.repeat(0), strides))),
+		array.offset,
+	)
+	return repeated.copy().reshape(tuple(map(operator.mul, reps, shape)))
+
+
+@_instrumented("repeat")
+def repeat(array: Array, repeats: int | list[int], axis: int | None = None) -> Array:
+	"""
+	Returns array with each of its elements repeated along axis (or the flattened array if None),
+	either repeats times, or repeats[i] times the i-th one.
+
+	The output is allocated once, as a copy of a broadcasted view of array (or an index array).
+	"""
+	array, axis = _flattened_or(asarray(array), axis)
+	(axis,) = Array._normalize_axes(axis, array.ndim)
+	shape, strides = array.shape, array.strides
+	if isinstance(repeats, int):
+		if repeats < 0:
+			raise ValueError("Repeats must be non-negative")
+		new_shape = shape[:axis] + (shape[axis] * repeats,) + shape[axis + 1 :]
+		if math.prod(shape[axis + 1 :]) == 1 and repeats:
+			# single elements are repeated by writing each repetition as a strided slice
+			values = array.ascontiguousarray()._flat_values()
+			data = Array._allocate_buffer(array.dtype, array.size * repeats)
+			for idx in range(repeats):
+				data[idx::repeats] = values
+			return Array._from_data(data, new_shape, array.dtype)
+		# each element along axis is followed by a broadcasted axis of its repetitions
+		repeated = array._view(
+			shape[: axis + 1] + (repeats,) + shape[axis + 1 :],
+			strides[: axis + 1] + (0,) + strides[axis + 1 :],
+			array.offset,
+		)
+		return repeated.copy().reshape(new_shape)
+
+	repeats = list(repeats)
+	if len(repeats) != shape[axis] or any(count < 0 for count in repeats):
+		raise ValueError(f"Repeats must be {shape[axis]} non-negative ints, one per element")
+	indices = itertools.chain.from_iterable(
+		itertools.repeat(idx, count) for idx, count in enumerate(repeats)
+	)
+	return array[(slice(None),) * axis + (_index_array(list(indices)),)]
+
+
+# ordering
+def _flattened_or(array: Array, axis: int | None) -> tuple[Array, int]:
+	"""Helper method returning array flattened if axis is None, and the axis to work along"""
+	if axis is None:
+		return array.reshape((array.size,)), -1
+	return array, axis
+
+
+def sort(array: Array, axis: int | None = -1) -> Array:
+	"""
+	Returns a sorted copy of array along axis (the last one by default, or the flattened array if
+	None), see Array.sort.
+	"""
+	array, axis = _flattened_or(array, axis)
+	result = array.copy()
+	result.sort(axis)
+	return result
+
+
+def argsort(array: Array, axis: int | None = -1) -> Array:
+	"""
+	Returns the indices that sort array along axis, see Array.argsort.
+	"""
+	return array.argsort(axis)
+
+
+def partition(array: Array, kth: int, axis: int | None = -1) -> Array:
+	"""
+	Returns a copy of array partitioned around its kth element along axis (the last one by
+	default, or the flattened array if None), see Array.partition.
+	"""
+	array, axis = _flattened_or(array, axis)
+	result = array.copy()
+	result.partition(kth, axis)
+	return result
+
+
+def argpartition(array: Array, kth: int, axis: int | None = -1) -> Array:
+	"""
+	Returns the indices that partition array around its kth element along axis, see
+	Array.argpartition.
+	"""
+	return array.argpartition(kth, axis)
+
+
+def searchsorted(
+	array: Array,
+	values: Array | int | float,
+	side: str = "left",
+) -> Array | int:
+	"""
+	Returns the indices where values would be inserted into the sorted, 1-dimensional array to
+	keep it sorted, see Array.searchsorted.
+	"""
+	return array.searchsorted(values, side)
+
+
+def _index_array(indices: list[int], shape: tuple[int] | None = None) -> Array:
+	"""Helper method creating an int64 array of indices, 1-dimensional unless a shape is given"""
+	shape = (len(indices),) if shape is None else shape
+	return Array._from_data(Array._make_buffer(dtypes.int64, indices), shape, dtypes.int64)
+
+
+def _same(value1: int | float, value2: int | float) -> bool:
+	"""Helper method comparing values for unique, where NaNs are equal to each other"""
+	return value1 == value2 or (value1 != value1 and value2 != value2)
+
+
+@_instrumented("unique")
+def unique(
+	array: Array,
+	return_index: bool = False,
+	return_inverse: bool = False,
+	return_counts: bool = False,
+	axis: int | None = None,
+) -> Array | tuple[Array]:
+	"""
+	Returns the sorted unique elements of array (flattened), or its unique slices along axis if
+	given, same as numpy. NaNs are considered equal to each other.
+
+	Optionally, the indices of the first occurrence of each unique element, the indices of the
+	unique element of each element of array (inverse), and the number of occurrences of each
+	unique element are returned as well, in that order.
+	"""
+	if axis is None:
+		flat = array.reshape((array.size,))
+		keys = flat._flat_values()
+		if not (return_index or return_inverse or return_counts) and not flat._has_nan(keys):
+			# plain unique values are found without sorting the duplicates
+			values = sorted(set(keys))
+			data = Array._make_buffer(array.dtype, values)
+			return Array._from_data(data, (len(values),), array.dtype)
+		same = _same
+	else:
+		(axis,) = Array._normalize_axes(axis, array.ndim)
+		moved = array.transpose((axis, *range(axis), *range(axis + 1, array.ndim)))
+		# slices are compared as tuples of their elements
+		keys = [tuple(item._flat_values()) for item in unstack(moved)]
+		flat = None
+		same = operator.eq
+
+	# stable sort, so the first element of each group is its first occurrence
+	if flat is None:
+		order = sorted(range(len(keys)), key=keys.__getitem__)
+	else:
+		order = flat._sort_order(keys)
+	first_indices, counts = [], []
+	inverse = [0] * len(keys)
+	for idx in order:
+		if not first_indices or not same(keys[idx], keys[first_indices[-1]]):
+			first_indices.append(idx)
+			counts.append(0)
+		counts[-1] += 1
+		inverse[idx] = len(first_indices) - 1
+
+	index_array = _index_array(first_indices)
+	if axis is None:
+		result = flat[index_array]
+	else:
+		result = array[(slice(None),) * axis + (index_array,)]
+	extras = []
+	if return_index:
+		extras.append(index_array)
+	if return_inverse:
+		inverse_shape = array.shape if axis is None else (len(inverse),)
+		extras.append(_index_array(inverse, inverse_shape))
+	if return_counts:
+		extras.append(_index_array(counts))
+	return (result, *extras) if extras else result
+
+
+# linear algebra
+def matmul(x1: Array, x2: Array, out: Array | None = None) -> Array:
 	"""
-	Return a copy of the array with elements sqrt(elem).
+	Matrix product of two arrays, with numpy's matmul semantics for stacks of matrices and
+	1-dimensional arrays. Written into out if given.
 	"""
-	return array.sqrt()
+	return Array._matmul(x1, x2, out)
 
 
-def abs(array: Array) -> Array:
+def dot(a: Array | int | float, b: Array | int | float, out: Array | None = None) -> Array:
 	"""
-	Return a copy of the array with elements abs(elem).
+	Dot product of two arrays, with numpy's dot semantics. Written into out if given.
 	"""
-	return array.abs()
+	if not isinstance(a, Array):
+		return multiply(a, b, out=out)
+	return a.dot(b, out)
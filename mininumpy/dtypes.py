@@ -0,0 +1,226 @@
+# File with the data types of arrays, and the rules promoting them in operations.
+from __future__ import annotations  # for typehinting the DType class within itself
+
+from array import array as typed_array
+from itertools import islice
+
+# maximum number of values converted at once when creating buffers of integer dtypes
+_CONVERSION_CHUNK_SIZE = 1 << 16
+
+
+def _typecode(candidates: str, itemsize: int) -> str:
+	"""
+	Returns the first typecode (of the array module) among candidates with given itemsize.
+	"""
+	return next(code for code in candidates if typed_array(code).itemsize == itemsize)
+
+
+class DType:
+	"""
+	Data type of the elements of an array, stored with a fixed number of bytes.
+
+	Dtypes compare equal to their names, and the Python types int, float and bool compare equal
+	to the default dtypes int64, float64 and bool (same as numpy).
+	"""
+
+	name: str
+	kind: str  # "b" (bool), "i" (signed int), "u" (unsigned int) or "f" (float)
+	itemsize: int
+	typecode: str  # of the typed buffer (array module) storing the elements
+	format: str  # of the memoryview exposing them
+	type: type[int] | type[float] | type[bool]  # of the elements, as Python scalars
+
+	def __init__(self, name: str, kind: str, itemsize: int):
+		self.name = name
+		self.kind = kind
+		self.itemsize = itemsize
+		if kind == "b":
+			self.typecode, self.format, self.type = "B", "?", bool
+		elif kind == "f":
+			self.typecode = self.format = _typecode("fd", itemsize)
+			self.type = float
+		else:
+			candidates = "qlihb" if kind == "i" else "QLIHB"
+			self.typecode = self.format = _typecode(candidates, itemsize)
+			self.type = int
+		_DTYPES[name] = self
+
+	def __repr__(self) -> str:
+		return f"dtype('{self.name}')"
+
+	def __str__(self) -> str:
+		return self.name
+
+	def __eq__(self, other) -> bool:
+		try:
+			return self is dtype(other)
+		except (ValueError, TypeError):
+			return NotImplemented
+
+	def __hash__(self) -> int:
+		return hash(self.name)
+
+	def __reduce__(self):
+		# unpickled (e.g. in worker processes) as the same instance
+		return dtype, (self.name,)
+
+	@property
+	def bounds(self) -> tuple[int, int] | None:
+		"""
+		Minimum and maximum values of integer dtypes, or None for the rest.
+		"""
+		if self.kind == "i":
+			return -(1 << (8 * self.itemsize - 1)), (1 << (8 * self.itemsize - 1)) - 1
+		if self.kind == "u":
+			return 0, (1 << (8 * self.itemsize)) - 1
+		return None
+
+	def wrap(self, value: int) -> int:
+		"""
+		Wraps an integer around the range of the dtype (e.g. 128 is -128 as int8), same as the
+		overflows of fixed-width integers.
+		"""
+		low, high = self.bounds
+		return (value - low) % (high - low + 1) + low
+
+	def buffer(self, values) -> typed_array:
+		"""
+		Returns a typed buffer with values (an iterable of numbers) converted into the dtype.
+
+		Integers out of the range of integer dtypes are wrapped around it. Values are converted
+		in chunks, so only the chunks which overflow go through the (slower) wrapping.
+		"""
+		if self.kind not in "iu":
+			return typed_array(self.typecode, values)
+		buffer = typed_array(self.typecode)
+		values = iter(values)
+		while chunk := list(islice(values, _CONVERSION_CHUNK_SIZE)):
+			try:
+				buffer.extend(typed_array(self.typecode, chunk))
+			except OverflowError:
+				buffer.extend(typed_array(self.typecode, map(self.wrap, chunk)))
+		return buffer
+
+
+# every dtype, by name
+_DTYPES = {}
+
+bool_ = DType("bool", "b", 1)
+int8 = DType("int8", "i", 1)
+int16 = DType("int16", "i", 2)
+int32 = DType("int32", "i", 4)
+int64 = DType("int64", "i", 8)
+uint8 = DType("uint8", "u", 1)
+uint16 = DType("uint16", "u", 2)
+uint32 = DType("uint32", "u", 4)
+uint64 = DType("uint64", "u", 8)
+float32 = DType("float32", "f", 4)
+float64 = DType("float64", "f", 8)
+
+# Python types standing for the default dtypes
+_PYTHON_TYPES = {bool: bool_, int: int64, float: float64}
+
+
+def dtype(obj) -> DType:
+	"""
+	Returns the dtype given by obj: a dtype, its name, or one of the Python types int, float and
+	bool (standing for int64, float64 and bool). Dtypes of other libraries (e.g. numpy) are
+	accepted by name too.
+	"""
+	if isinstance(obj, DType):
+		return obj
+	if isinstance(obj, type) and obj in _PYTHON_TYPES:
+		return _PYTHON_TYPES[obj]
+	name = obj if isinstance(obj, str) else getattr(obj, "name", getattr(obj, "__name__", None))
+	if name == "bool_":
+		name = "bool"
+	if name not in _DTYPES:
+		raise ValueError(f"Unsupported dtype {obj!r}. Expected one of {list(_DTYPES)}")
+	return _DTYPES[name]
+
+
+def _from_kind(kind: str, itemsize: int) -> DType | None:
+	"""
+	Returns the dtype of given kind and itemsize, or None if there is none.
+	"""
+	return next(
+		(item for item in _DTYPES.values() if item.kind == kind and item.itemsize == itemsize),
+		None,
+	)
+
+
+def _signed(itemsize: int) -> DType:
+	"""
+	Returns the signed integer dtype of given itemsize, or float64 if it is too large.
+	"""
+	return {1: int8, 2: int16, 4: int32, 8: int64}.get(itemsize, float64)
+
+
+def promote_types(dtype1, dtype2) -> DType:
+	"""
+	Returns the smallest dtype to which both dtypes can be safely cast (same as numpy):
+
+	- bools promote to any other dtype.
+	- Integers of the same signedness, and floats, promote to the largest of both.
+	- Signed and unsigned integers promote to a signed integer large enough for both, or to
+	  float64 if there is none (int64 and uint64).
+	- Integers and floats promote to a float large enough for the integer (float32 for integers
+	  of up to 2 bytes, float64 otherwise).
+	"""
+	dtype1, dtype2 = dtype(dtype1), dtype(dtype2)
+	if dtype1 is dtype2 or dtype2.kind == "b":
+		return dtype1
+	if dtype1.kind == "b":
+		return dtype2
+	if dtype1.kind == dtype2.kind:
+		return dtype1 if dtype1.itemsize >= dtype2.itemsize else dtype2
+	if "f" in (dtype1.kind, dtype2.kind):
+		floating, integer = (dtype1, dtype2) if dtype1.kind == "f" else (dtype2, dtype1)
+		return floating if integer.itemsize <= 2 or floating is float64 else float64
+	signed, unsigned = (dtype1, dtype2) if dtype1.kind == "i" else (dtype2, dtype1)
+	if signed.itemsize > unsigned.itemsize:
+		return signed
+	return _signed(2 * unsigned.itemsize)
+
+
+# order of the kinds of dtypes, from the least to the most general
+_KIND_ORDER = {"b": 0, "u": 1, "i": 2, "f": 3}
+
+
+def result_type(*dtypes) -> DType:
+	"""
+	Returns the dtype of the result of an operation between operands of given dtypes.
+
+	The Python types int, float and bool stand for Python scalars, which are 'weak' (same as in
+	numpy): they do not change the dtype of the arrays they operate with, unless they are of a
+	more general kind (e.g. int8 array + 1 is int8, but int8 array + 1.5 is float64).
+	"""
+	strong = [dtype(item) for item in dtypes if isinstance(item, DType)]
+	weak = [_PYTHON_TYPES[item] for item in dtypes if not isinstance(item, DType)]
+	result = None
+	for item in strong:
+		result = item if result is None else promote_types(result, item)
+	for item in weak:
+		# Python ints are of the kind of unsigned dtypes too, and scalars of a more general kind
+		# give the default dtype of that kind
+		kind_order = _KIND_ORDER["u"] if item is int64 else _KIND_ORDER[item.kind]
+		if result is None or kind_order > _KIND_ORDER[result.kind]:
+			result = item
+	if result is None:
+		raise ValueError("At least one dtype is needed to compute a resulting dtype")
+	return result
+
+
+def can_cast(from_dtype, to_dtype) -> bool:
+	"""
+	Whether values of from_dtype can be stored into to_dtype without changing their kind to a
+	less general one (e.g. floats into ints, or signed into unsigned ints). Narrower dtypes of the
+	same kind are allowed, wrapping integers around (same as numpy's 'same_kind' casting).
+
+	The Python types int, float and bool stand for (weak) Python scalars, so ints can be stored
+	into any integer dtype.
+	"""
+	to_order = _KIND_ORDER[dtype(to_dtype).kind]
+	if from_dtype is int:
+		return to_order >= _KIND_ORDER["u"]
+	return _KIND_ORDER[dtype(from_dtype).kind] <= to_order
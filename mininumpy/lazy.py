@@ -0,0 +1,408 @@
+# File with the implementation of lazy arrays, which fuse elementwise expressions.
+from __future__ import annotations  # for typehinting the LazyArray class within itself
+
+from array import array as typed_array
+from itertools import chain, islice
+from math import exp, log, prod, sqrt
+
+from .array import Array
+from .dtypes import DType, float32, float64
+
+# Python source template for each fusable operation
+_BINARY_TEMPLATES = {
+	"add": "({} + {})",
+	"subtract": "({} - {})",
+	"multiply": "({} * {})",
+	"divide": "({} / {})",
+	"power": "({} ** {})",
+	"maximum": "max({}, {})",
+	"minimum": "min({}, {})",
+}
+_UNARY_TEMPLATES = {
+	"exp": "exp({})",
+	"log": "log({})",
+	"sqrt": "sqrt({})",
+	"absolute": "abs({})",
+}
+_FUNCTIONS = {"exp": exp, "log": log, "sqrt": sqrt, "abs": abs, "max": max, "min": min}
+
+
+def _round_float32(value: float) -> float:
+	"""
+	Rounds a float into float32 precision (overflowing into infinity), same as a float32 buffer.
+	"""
+	return typed_array(float32.typecode, (value,))[0]
+
+
+class LazyArray:
+	"""
+	Node of a lazily evaluated expression over arrays.
+
+	Operators and elementwise methods do not compute anything: they build an expression graph,
+	which is evaluated in a single fused pass (with a single output allocation) by compute(), or
+	by a trailing reduction (sum, prod, mean, max or min).
+
+	Expressions must start from a lazy array (see Array.lazy()), other arrays and scalars can then
+	be used as operands anywhere in them.
+	"""
+
+	op: str | None
+	operands: tuple[LazyArray | Array | int | float]
+	dtype: DType
+	shape: tuple[int]
+	ndim: int
+	size: int
+
+	def __init__(self, array: Array):
+		"""
+		Creates a lazy leaf wrapping given array.
+		"""
+		if not isinstance(array, Array):
+			raise ValueError(f"Cannot create lazy array from type {type(array)}")
+		self.op = None
+		self.operands = (array,)
+		self.dtype = array.dtype
+		self.shape = array.shape
+		self.ndim = array.ndim
+		self.size = array.size
+
+	@classmethod
+	def _node(
+		cls,
+		op: str,
+		operands: tuple[LazyArray | Array | int | float],
+		dtype: DType,
+		shape: tuple[int],
+	) -> LazyArray:
+		"""
+		Creates a node applying op to operands, without evaluating anything.
+		"""
+		new_node = cls.__new__(cls)
+
+		new_node.op = op
+		new_node.operands = operands
+		new_node.dtype = dtype
+		new_node.shape = shape
+		new_node.ndim = len(shape)
+		new_node.size = prod(shape)
+
+		return new_node
+
+	def __repr__(self) -> str:
+		return f"LazyArray({self._expression(_Leaves(), repr_only=True)}, shape={self.shape})"
+
+	# graph building
+	@staticmethod
+	def _shape_and_dtype(operand: LazyArray | Array | int | float) -> tuple:
+		if isinstance(operand, (LazyArray, Array)):
+			return operand.shape, operand.dtype
+		if isinstance(operand, (int, float)):
+			return (), type(operand)
+		raise ValueError(f"Unsopported operation for types {LazyArray} and {type(operand)}")
+
+	def _binary(
+		self,
+		op: str,
+		operand1: LazyArray | Array | int | float,
+		operand2: LazyArray | Array | int | float,
+		resulting_dtype: DType | None = None,
+	) -> LazyArray:
+		"""
+		Creates a node for binary operation op between both operands.
+
+		Unless a resulting dtype is given, it is the one of the eager ufunc of the same name for
+		the dtypes of both operands, so lazy and eager results always match.
+		"""
+		shape1, dtype1 = self._shape_and_dtype(operand1)
+		shape2, dtype2 = self._shape_and_dtype(operand2)
+		if resulting_dtype is None:
+			resulting_dtype = Array._ufuncs[op]._dtype_rule(dtype1, dtype2)
+		new_shape = Array._broadcast_shapes(shape1, shape2)
+		return self._node(op, (operand1, operand2), resulting_dtype, new_shape)
+
+	def _unary(
+		self,
+		op: str,
+		resulting_dtype: DType | None = None,
+		out: Array | None = None,
+	) -> LazyArray | Array:
+		"""
+		Creates a node for unary operation op. If out is given, the node is evaluated into it
+		right away.
+
+		Unless a resulting dtype is given, it is the one of the eager ufunc of the same name.
+		"""
+		if resulting_dtype is None:
+			resulting_dtype = Array._ufuncs[op]._dtype_rule(self.dtype)
+		node = self._node(op, (self,), resulting_dtype, self.shape)
+		return node if out is None else node.compute(out)
+
+	@staticmethod
+	def _from_ufunc(
+		ufunc,
+		operands: tuple[LazyArray | Array | int | float],
+		out: Array | None = None,
+	) -> LazyArray | Array:
+		"""
+		Creates the node applying ufunc to operands (at least one of them lazy). If out is given,
+		the node is evaluated into it right away.
+		"""
+		name = ufunc.__name__
+		if name not in _BINARY_TEMPLATES and name not in _UNARY_TEMPLATES:
+			raise ValueError(f"{ufunc} cannot be applied lazily")
+		lazy_operand = next(operand for operand in operands if isinstance(operand, LazyArray))
+		resulting_dtype = ufunc._dtype_rule(
+			*(lazy_operand._shape_and_dtype(operand)[1] for operand in operands)
+		)
+		if name in _UNARY_TEMPLATES:
+			return lazy_operand._unary(name, resulting_dtype, out)
+		node = lazy_operand._binary(name, *operands, resulting_dtype)
+		return node if out is None else node.compute(out)
+
+	def __add__(self, right_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("add", self, right_operand)
+
+	def __radd__(self, left_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("add", left_operand, self)
+
+	def __sub__(self, right_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("subtract", self, right_operand)
+
+	def __rsub__(self, left_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("subtract", left_operand, self)
+
+	def __mul__(self, right_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("multiply", self, right_operand)
+
+	def __rmul__(self, left_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("multiply", left_operand, self)
+
+	def __truediv__(self, right_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("divide", self, right_operand)
+
+	def __rtruediv__(self, left_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("divide", left_operand, self)
+
+	def __pow__(self, right_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("power", self, right_operand)
+
+	def __rpow__(self, left_operand: LazyArray | Array | int | float) -> LazyArray:
+		return self._binary("power", left_operand, self)
+
+	def maximum(self, operand: LazyArray | Array | int | float) -> LazyArray:
+		"""
+		Lazy elementwise maximum between the expression and operand.
+		"""
+		return self._binary("maximum", self, operand)
+
+	def minimum(self, operand: LazyArray | Array | int | float) -> LazyArray:
+		"""
+		Lazy elementwise minimum between the expression and operand.
+		"""
+		return self._binary("minimum", self, operand)
+
+	def exp(self, out: Array | None = None) -> LazyArray | Array:
+		return self._unary("exp", out=out)
+
+	def log(self, out: Array | None = None) -> LazyArray | Array:
+		return self._unary("log", out=out)
+
+	def sqrt(self, out: Array | None = None) -> LazyArray | Array:
+		return self._unary("sqrt", out=out)
+
+	def abs(self, out: Array | None = None) -> LazyArray | Array:
+		return self._unary("absolute", out=out)
+
+	# fused evaluation
+	def _expression(self, leaves: _Leaves, repr_only: bool = False) -> str:
+		"""
+		Returns the Python source of the expression, registering its leaves (arrays and scalars)
+		as arguments of the fused function.
+		"""
+		if self.op is None:
+			return leaves.name(self.operands[0], repr_only)
+
+		operands = [
+			operand._expression(leaves, repr_only)
+			if isinstance(operand, LazyArray)
+			else leaves.name(operand, repr_only)
+			for operand in self.operands
+		]
+		if self.op in _UNARY_TEMPLATES:
+			source = _UNARY_TEMPLATES[self.op].format(*operands)
+		else:
+			source = _BINARY_TEMPLATES[self.op].format(*operands)
+		return source if repr_only else leaves.cast(source, self.dtype)
+
+	def _fused_values(self, axes_order: tuple[int] | None = None, out: Array | None = None):
+		"""
+		Returns an iterable with the values of the expression, evaluated in a single pass over all
+		of its leaf arrays.
+
+		Values are produced in C order of the expression's shape (or of the shape of out, if
+		given, into which the expression is broadcasted), with its axes permuted by axes_order if
+		given.
+		"""
+		leaves = _Leaves()
+		source = self._expression(leaves)
+		arguments = ", ".join(leaves.array_names)
+		function = eval(f"lambda {arguments}: {source}", {**_FUNCTIONS, **leaves.constants})
+
+		target_shape = self.shape if out is None else out.shape
+		shape = target_shape
+		if axes_order is not None:
+			shape = tuple(target_shape[ax] for ax in axes_order)
+		iterables = []
+		for array in leaves.arrays:
+			if out is not None:
+				array = out._prepare_operand_for_out(array, out)
+			strides = array._broadcast_strides(target_shape)
+			if axes_order is None and array.shape == target_shape:
+				iterables.append(array._flat_values())
+				continue
+			if axes_order is not None:
+				strides = tuple(strides[ax] for ax in axes_order)
+			iterables.append(
+				chain.from_iterable(Array._strided_rows(array.data, shape, strides, array.offset))
+			)
+		return map(function, *iterables)
+
+	def compute(self, out: Array | None = None) -> Array:
+		"""
+		Evaluates the expression into a new array, in a single pass.
+
+		If out is given, the expression is evaluated (and broadcasted) into it instead.
+		"""
+		if out is not None:
+			out._check_out(self.shape, self.dtype)
+			out._assign_values(self._fused_values(out=out))
+			return out
+		data = Array._fill_buffer(self.dtype, self.size, self._fused_values())
+		return Array._from_data(data, self.shape, self.dtype)
+
+	def _reduce(
+		self,
+		kernel,
+		axis: int | tuple[int] | None,
+		keepdims: bool,
+		resulting_dtype: DType,
+	) -> Array | int | float:
+		"""
+		Evaluates the expression and reduces it along given axes in the same pass, without
+		materializing the expression.
+
+		Reduced axes are iterated innermost, so each reduced block is a consecutive run of the
+		fused values.
+		"""
+		axes = Array._normalize_axes(axis, self.ndim)
+		kept_axes = tuple(ax for ax in range(self.ndim) if ax not in axes)
+		values = self._fused_values(kept_axes + axes)
+
+		if axis is None and not keepdims:
+			return kernel(values)
+
+		block_size = prod(self.shape[ax] for ax in axes)
+		outer_size = prod(self.shape[ax] for ax in kept_axes)
+		results = [kernel(islice(values, block_size)) for _ in range(outer_size)]
+
+		new_shape = (
+			tuple(1 if ax in axes else dim for ax, dim in enumerate(self.shape))
+			if keepdims
+			else tuple(self.shape[ax] for ax in kept_axes)
+		)
+		data = Array._fill_buffer(resulting_dtype, outer_size, results)
+		return Array._from_data(data, new_shape, resulting_dtype)
+
+	def sum(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Fused evaluation of the expression and its sum along the given axes.
+		"""
+		return self._reduce(sum, axis, keepdims, Array._accumulation_dtype(self))
+
+	def prod(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Fused evaluation of the expression and its product along the given axes.
+		"""
+		return self._reduce(prod, axis, keepdims, Array._accumulation_dtype(self))
+
+	def mean(self, axis: int | tuple[int] | None = None, keepdims: bool = False) -> Array | float:
+		"""
+		Fused evaluation of the expression and its mean along the given axes.
+		"""
+		count = prod(self.shape[ax] for ax in Array._normalize_axes(axis, self.ndim))
+		return self._reduce(
+			lambda values: sum(values) / count if count else float("nan"),
+			axis,
+			keepdims,
+			self.dtype if self.dtype.kind == "f" else float64,
+		)
+
+	def max(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Fused evaluation of the expression and its maximum along the given axes.
+		"""
+		kernel = Array._extremum_kernel(max, "maximum", None)
+		return self._reduce(kernel, axis, keepdims, self.dtype)
+
+	def min(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Fused evaluation of the expression and its minimum along the given axes.
+		"""
+		kernel = Array._extremum_kernel(min, "minimum", None)
+		return self._reduce(kernel, axis, keepdims, self.dtype)
+
+
+class _Leaves:
+	"""
+	Registry of the leaves of an expression, while its source is being generated.
+
+	Each distinct array becomes an argument of the fused function, while scalars are bound as
+	constants.
+	"""
+
+	def __init__(self):
+		self.arrays = []
+		self.array_names = []
+		self.constants = {}
+		self.temporaries = 0
+
+	def cast(self, source: str, dtype: DType) -> str:
+		"""
+		Returns the source converting the values of source into dtype, same as storing them in an
+		array of that dtype: integers are wrapped around its range, and float32 values rounded.
+		"""
+		if dtype.kind in "iu":
+			# only values out of range go through the (slower) wrapping
+			low, high = dtype.bounds
+			temporary = f"t{self.temporaries}"
+			self.temporaries += 1
+			wrap = self.name(dtype.wrap)
+			return (
+				f"({temporary} if {low} <= ({temporary} := {source}) <= {high} "
+				f"else {wrap}({temporary}))"
+			)
+		if dtype is float32:
+			return f"{self.name(_round_float32)}({source})"
+		return source
+
+	def name(self, leaf: Array | int | float, repr_only: bool = False) -> str:
+		if repr_only:
+			return f"Array{leaf.shape}" if isinstance(leaf, Array) else repr(leaf)
+		if isinstance(leaf, Array):
+			for idx, array in enumerate(self.arrays):
+				if array is leaf:
+					return self.array_names[idx]
+			self.arrays.append(leaf)
+			self.array_names.append(f"a{len(self.arrays) - 1}")
+			return self.array_names[-1]
+		name = f"c{len(self.constants)}"
+		self.constants[name] = leaf
+		return name
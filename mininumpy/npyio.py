@@ -0,0 +1,173 @@
+# File with the binary save/load functions, using NumPy's .npy format.
+from __future__ import annotations  # for typehinting within the module
+
+import mmap
+import os
+import sys
+from array import array as typed_array
+from ast import literal_eval
+from math import prod
+
+from . import dtypes
+from .array import Array
+from .dtypes import DType, bool_
+
+_MAGIC = b"\x93NUMPY"
+# the header (including magic string and lengths) is padded to a multiple of this size, so the
+# data is aligned when memory-mapped
+_HEADER_ALIGNMENT = 64
+
+_MMAP_ACCESS = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+def _descr(dtype: DType) -> str:
+	"""
+	Returns the descr of dtype on disk, where multi-byte values are always little-endian.
+	"""
+	return f"{'|' if dtype.itemsize == 1 else '<'}{dtype.kind}{dtype.itemsize}"
+
+
+def _dtype_of_descr(descr: str) -> DType:
+	"""
+	Returns the dtype of the values of given descr, raising exception if it is not supported.
+	"""
+	dtype = None
+	if len(descr) > 2 and descr[0] in "<>|=" and descr[2:].isdigit():
+		dtype = dtypes._from_kind(descr[1], int(descr[2:]))
+	if dtype is None:
+		raise ValueError(f"Unsupported dtype {descr!r} in .npy file")
+	return dtype
+
+
+def _write_header(file, array: Array) -> None:
+	"""
+	Writes the .npy header (version 1.0, or 2.0 if it does not fit) describing array.
+	"""
+	header = (
+		f"{{'descr': '{_descr(array.dtype)}', 'fortran_order': False, 'shape': {array.shape!r}, }}"
+	).encode("latin1")
+	for version, length_size in ((1, 2), (2, 4)):
+		prefix_length = len(_MAGIC) + 2 + length_size
+		padding = -(prefix_length + len(header) + 1) % _HEADER_ALIGNMENT
+		header_length = len(header) + padding + 1
+		if header_length < 1 << (8 * length_size):
+			break
+
+	file.write(_MAGIC + bytes((version, 0)))
+	file.write(header_length.to_bytes(length_size, "little"))
+	file.write(header + b" " * padding + b"\n")
+
+
+def _read_header(file) -> tuple[str, bool, tuple[int], int]:
+	"""
+	Reads a .npy header, and returns its descr, fortran order flag, shape and the offset of the
+	data from the start of the file.
+	"""
+	prefix = file.read(len(_MAGIC) + 2)
+	if prefix[: len(_MAGIC)] != _MAGIC:
+		raise ValueError("File is not in .npy format (magic string not found)")
+	version = prefix[len(_MAGIC)]
+	if version not in (1, 2, 3):
+		raise ValueError(f"Unsupported .npy format version {version}")
+	length_size = 2 if version == 1 else 4
+	header_length = int.from_bytes(file.read(length_size), "little")
+	header = literal_eval(file.read(header_length).decode("utf8" if version == 3 else "latin1"))
+
+	if not isinstance(header, dict) or set(header) != {"descr", "fortran_order", "shape"}:
+		raise ValueError(f"Invalid .npy header {header}")
+	data_offset = len(prefix) + length_size + header_length
+	return header["descr"], header["fortran_order"], tuple(header["shape"]), data_offset
+
+
+def _needs_byteswap(descr: str) -> bool:
+	"""
+	Whether values of given descr must be byte-swapped to match the byte order of this machine.
+	"""
+	byteorder = {"<": "little", ">": "big"}.get(descr[0])
+	return byteorder is not None and byteorder != sys.byteorder
+
+
+def _from_layout(
+	data: memoryview,
+	shape: tuple[int],
+	dtype: DType,
+	fortran_order: bool,
+) -> Array:
+	"""
+	Creates an array over data, laid out in C or Fortran order.
+
+	Fortran ordered data is returned as the transposed view of a C ordered array, without copies.
+	"""
+	if fortran_order:
+		return Array._from_data(data, shape[::-1], dtype).transpose()
+	return Array._from_data(data, shape, dtype)
+
+
+def save(file, array: Array) -> None:
+	"""
+	Saves array into a binary file in NumPy's .npy format, readable by numpy.load as well.
+
+	file can be a path (to which the .npy extension is appended if missing) or a file object
+	opened in binary mode.
+	"""
+	if not isinstance(array, Array):
+		raise ValueError(f"Cannot save object of type {type(array)}")
+
+	if isinstance(file, (str, os.PathLike)):
+		path = os.fspath(file)
+		if not path.endswith(".npy"):
+			path += ".npy"
+		with open(path, "wb") as opened_file:
+			save(opened_file, array)
+		return
+
+	_write_header(file, array)
+	swap = sys.byteorder == "big" and array.dtype.itemsize > 1
+	if array._is_contiguous() and not swap:
+		file.write(array._flat_values())
+		return
+	# non contiguous arrays are written row by row, without materializing a contiguous copy
+	rows = array._strided_rows(array.data, array.shape, array.strides, array.offset)
+	for row in rows:
+		if isinstance(row, memoryview) and not swap:
+			file.write(row.tobytes())
+			continue
+		buffer = array._make_buffer(array.dtype, row)
+		if swap:
+			buffer.byteswap()
+		file.write(buffer)
+
+
+def load(file, mmap_mode: str | None = None) -> Array:
+	"""
+	Loads an array from a binary file in NumPy's .npy format.
+
+	file can be a path or a file object opened in binary mode. If mmap_mode is given ("r" for
+	read-only, "r+" for read-write, or "c" for copy-on-write), the file is memory-mapped instead
+	of read, so opening it is instant and its contents are only paged in when accessed.
+	"""
+	if mmap_mode is not None and mmap_mode not in _MMAP_ACCESS:
+		raise ValueError(f"Invalid mmap_mode {mmap_mode!r}. Expected one of {list(_MMAP_ACCESS)}")
+
+	if isinstance(file, (str, os.PathLike)):
+		with open(file, "rb" if mmap_mode in (None, "r", "c") else "r+b") as opened_file:
+			return load(opened_file, mmap_mode)
+
+	descr, fortran_order, shape, data_offset = _read_header(file)
+	dtype = _dtype_of_descr(descr)
+	size = prod(shape)
+
+	if mmap_mode is not None:
+		if _needs_byteswap(descr):
+			raise ValueError(f"Cannot memory-map data of dtype {descr!r}")
+		nbytes = size * dtype.itemsize
+		mapped_file = mmap.mmap(file.fileno(), 0, access=_MMAP_ACCESS[mmap_mode])
+		raw_data = memoryview(mapped_file)[data_offset : data_offset + nbytes]
+		return _from_layout(raw_data.cast(dtype.format), shape, dtype, fortran_order)
+
+	buffer = typed_array(dtype.typecode)
+	buffer.fromfile(file, size)
+	if _needs_byteswap(descr):
+		buffer.byteswap()
+	data = memoryview(buffer).cast("?") if dtype is bool_ else memoryview(buffer)
+	return _from_layout(data, shape, dtype, fortran_order)
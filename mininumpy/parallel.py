@@ -0,0 +1,402 @@
+# File with the multi-process backend for large elementwise operations and reductions.
+from __future__ import annotations  # for typehinting within the module
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from inspect import signature
+from itertools import chain, repeat
+from math import prod
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+from .array import Array
+from .dtypes import DType
+
+# default minimum number of elements of an operation for it to be split across workers. Below
+# it, the cost of copying the operands into shared memory outweighs the gain.
+DEFAULT_THRESHOLD = 1 << 18
+
+# how to combine the partial results of each chunk of a full reduction
+_FULL_REDUCTION_COMBINERS = {
+	"sum": sum,
+	"prod": prod,
+	"max": max,
+	"min": min,
+	"any": any,
+	"all": all,
+}
+
+
+class _SharedArray(NamedTuple):
+	"""
+	Picklable description of an array whose buffer lives in shared memory.
+	"""
+
+	name: str
+	dtype: DType
+	length: int
+	shape: tuple[int]
+	strides: tuple[int]
+	offset: int
+
+	@classmethod
+	def create(
+		cls,
+		array: Array | None,
+		shape: tuple[int] | None = None,
+		dtype: DType | None = None,
+	) -> tuple[SharedMemory, _SharedArray]:
+		"""
+		Copies the elements of array into a new block of shared memory, and returns it along with
+		the description of the array over it, broadcasted into shape if given.
+
+		Arrays spanning their whole buffer (or broadcasted views, smaller than the array) are
+		staged as the buffer itself, keeping their layout. Views over a part of a larger buffer
+		are made contiguous first, so the cost follows the size of the operand, not of its base.
+
+		If array is None, a zero-filled contiguous buffer of given shape and dtype is created.
+		"""
+		if array is None:
+			length = prod(shape)
+			shared_memory = SharedMemory(create=True, size=max(length * dtype.itemsize, 1))
+			return shared_memory, cls(
+				shared_memory.name, dtype, length, shape, Array._contiguous_strides(shape), 0
+			)
+
+		if array.size < len(array.data):
+			array = array.copy()
+		raw_data = array.data.cast("B")
+		shared_memory = SharedMemory(create=True, size=max(raw_data.nbytes, 1))
+		shared_memory.buf[: raw_data.nbytes] = raw_data
+		return shared_memory, cls(
+			shared_memory.name,
+			array.dtype,
+			len(array.data),
+			array.shape if shape is None else shape,
+			array.strides if shape is None else array._broadcast_strides(shape),
+			array.offset,
+		)
+
+	def attach(self) -> tuple[SharedMemory, memoryview]:
+		"""
+		Attaches to the shared memory block, and returns it along with a typed view of the data.
+		"""
+		shared_memory = SharedMemory(self.name, track=False)
+		data = shared_memory.buf[: self.length * self.dtype.itemsize].cast(self.dtype.format)
+		return shared_memory, data
+
+	def rows(self, data: memoryview, start: int, stop: int, axis: int = 0) -> Array:
+		"""
+		Returns the array described, restricted to indices [start, stop) along axis.
+		"""
+		shape = self.shape[:axis] + (stop - start,) + self.shape[axis + 1 :]
+		offset = self.offset + start * self.strides[axis]
+		return Array._from_data(data, shape, self.dtype, self.strides, offset)
+
+
+def _release(shared_memory: SharedMemory, data: memoryview) -> None:
+	"""
+	Releases the typed view of a shared memory block, and closes it.
+
+	If views derived from it are still alive (e.g. referenced by the traceback of an exception
+	being raised), the block is left to be closed by the garbage collector.
+	"""
+	data.release()
+	try:
+		shared_memory.close()
+	except BufferError:
+		pass
+
+
+def _init_worker() -> None:
+	"""
+	Makes sure operations inside the workers are never split again.
+	"""
+	Array._parallel_backend = None
+
+
+def _elementwise_chunk(
+	function,
+	operands: tuple[tuple[_SharedArray, memoryview] | int | float],
+	out: tuple[_SharedArray, memoryview],
+	start: int,
+	stop: int,
+) -> None:
+	"""
+	Applies function to rows [start, stop) (along the first axis) of the attached operands, which
+	are already laid out in the shape of out, and writes the result into the same rows of out.
+	"""
+	shared_out, out_data = out
+	row_size = prod(shared_out.shape[1:])
+	values = [
+		operand[0].rows(operand[1], start, stop)._flat_values()
+		if isinstance(operand, tuple)
+		else repeat(operand, (stop - start) * row_size)
+		for operand in operands
+	]
+	result = Array._make_buffer(shared_out.dtype, map(function, *values))
+	out_data[start * row_size : stop * row_size] = result
+
+
+def _elementwise_task(
+	function,
+	operands: tuple[_SharedArray | int | float],
+	out: _SharedArray,
+	start: int,
+	stop: int,
+) -> None:
+	"""
+	Worker task attaching to the shared buffers of an elementwise operation, and computing rows
+	[start, stop) of its result.
+	"""
+	attached = {}
+	try:
+		for operand in (*operands, out):
+			if isinstance(operand, _SharedArray):
+				attached[operand.name] = operand.attach()
+		_elementwise_chunk(
+			function,
+			tuple(
+				(operand, attached[operand.name][1])
+				if isinstance(operand, _SharedArray)
+				else operand
+				for operand in operands
+			),
+			(out, attached[out.name][1]),
+			start,
+			stop,
+		)
+	finally:
+		for shared_memory, data in attached.values():
+			_release(shared_memory, data)
+
+
+def _reduction_task(
+	name: str,
+	source: _SharedArray,
+	axis: int | tuple[int] | None,
+	split_axis: int,
+	start: int,
+	stop: int,
+	kwargs: dict,
+) -> tuple[type, list] | int | float:
+	"""
+	Computes reduction name over indices [start, stop) of source along split_axis.
+
+	Returns the dtype and values of the result, or the result itself if it is a scalar.
+	"""
+	shared_memory, data = source.attach()
+	try:
+		result = getattr(source.rows(data, start, stop, split_axis), name)(axis=axis, **kwargs)
+		if isinstance(result, Array):
+			return result.dtype, list(result._flat_values())
+		return result
+	finally:
+		_release(shared_memory, data)
+
+
+class _ProcessPoolBackend:
+	"""
+	Backend splitting large operations into chunks, executed by a pool of worker processes over
+	buffers in shared memory.
+
+	Elementwise and broadcasting operations are split along the first axis of their result, and
+	axis reductions along the first axis which is not reduced.
+	"""
+
+	num_workers: int
+	threshold: int
+
+	def __init__(self, num_workers: int, threshold: int):
+		self.num_workers = num_workers
+		self.threshold = threshold
+		self._executor = ProcessPoolExecutor(num_workers, initializer=_init_worker)
+
+	def shutdown(self) -> None:
+		self._executor.shutdown()
+
+	def _chunks(self, length: int) -> list[tuple[int, int]]:
+		"""
+		Splits range(length) into (at most) one contiguous chunk per worker.
+		"""
+		num_chunks = min(self.num_workers, length)
+		bounds = [length * idx // num_chunks for idx in range(num_chunks + 1)]
+		return list(zip(bounds[:-1], bounds[1:]))
+
+	def elementwise(
+		self,
+		function,
+		operands: tuple[Array | int | float],
+		shape: tuple[int],
+		resulting_dtype: DType,
+		out: Array | None = None,
+	) -> Array:
+		"""
+		Applies function elementwise over operands broadcasted into shape.
+
+		The result is written into out if given, or into a new array otherwise.
+		"""
+		result_shape = shape
+		if len(shape) == 0:
+			shape = (1,)
+		allocated = []
+		try:
+			shared_operands = []
+			for operand in operands:
+				if isinstance(operand, Array):
+					allocated.append(_SharedArray.create(operand, shape))
+					shared_operands.append(allocated[-1][1])
+				else:
+					shared_operands.append(operand)
+			allocated.append(_SharedArray.create(None, shape, dtype=resulting_dtype))
+			shared_out = allocated[-1][1]
+
+			futures = [
+				self._executor.submit(
+					_elementwise_task, function, tuple(shared_operands), shared_out, start, stop
+				)
+				for start, stop in self._chunks(shape[0])
+			]
+			for future in futures:
+				future.result()
+
+			shared_memory, data = shared_out.attach()
+			try:
+				if out is not None:
+					out._assign_values(data)
+					return out
+				new_data = Array._make_buffer(resulting_dtype, data)
+			finally:
+				_release(shared_memory, data)
+		finally:
+			for shared_memory, _ in allocated:
+				shared_memory.close()
+				shared_memory.unlink()
+
+		return Array._from_data(new_data, result_shape, resulting_dtype)
+
+	def reduce(self, array: Array, method, *args, **kwargs) -> Array | int | float:
+		"""
+		Computes reduction method (an undecorated reduction of Array) of array, splitting it into
+		chunks along the first non-reduced axis, or along the first axis for full reductions.
+
+		Falls back to the serial method for the cases which cannot be split cheaply.
+		"""
+		name = method.__name__
+		arguments = signature(method).bind(array, *args, **kwargs)
+		arguments.apply_defaults()
+		arguments = dict(arguments.arguments)
+		del arguments["self"]
+		axis = arguments.pop("axis")
+		keepdims = arguments.pop("keepdims")
+		out = arguments.pop("out")
+
+		axes = Array._normalize_axes(axis, array.ndim)
+		kept_axes = [ax for ax in range(array.ndim) if ax not in axes]
+		if kept_axes:
+			split_axis = kept_axes[0]
+		else:
+			# full reductions are combined from partial results of the same reduction
+			default_initial = signature(method).parameters.get("initial")
+			uses_initial = default_initial is not None and (
+				arguments["initial"] != default_initial.default
+			)
+			combinable = name in _FULL_REDUCTION_COMBINERS or name == "mean"
+			if array.ndim == 0 or keepdims or out is not None or uses_initial or not combinable:
+				return method(array, *args, **kwargs)
+			split_axis = 0
+
+		shared_memory, source = _SharedArray.create(array)
+		try:
+			chunk_name = "sum" if name == "mean" and not kept_axes else name
+			futures = [
+				self._executor.submit(
+					_reduction_task,
+					chunk_name,
+					source,
+					axis if kept_axes else None,
+					split_axis,
+					start,
+					stop,
+					arguments if kept_axes else {},
+				)
+				for start, stop in self._chunks(array.shape[split_axis])
+			]
+			partial_results = [future.result() for future in futures]
+		finally:
+			shared_memory.close()
+			shared_memory.unlink()
+
+		if not kept_axes:
+			if name == "mean":
+				return sum(partial_results) / array.size
+			return _FULL_REDUCTION_COMBINERS[name](partial_results)
+
+		resulting_dtype = partial_results[0][0]
+		new_shape = (
+			tuple(1 if ax in axes else dim for ax, dim in enumerate(array.shape))
+			if keepdims
+			else tuple(array.shape[ax] for ax in kept_axes)
+		)
+		values = chain.from_iterable(values for _, values in partial_results)
+		if out is not None:
+			if out.shape != new_shape:
+				raise ValueError(
+					f"Output array of shape {out.shape} does not match the reduction's shape "
+					f"{new_shape}"
+				)
+			out._check_out(new_shape, resulting_dtype)
+			out._assign_values(values)
+			return out
+		data = Array._make_buffer(resulting_dtype, values)
+		return Array._from_data(data, new_shape, resulting_dtype)
+
+
+def get_num_workers() -> int:
+	"""
+	Returns the number of worker processes used for large operations (1 if running serially).
+	"""
+	backend = Array._parallel_backend
+	return 1 if backend is None else backend.num_workers
+
+
+def set_num_workers(num_workers: int, threshold: int = DEFAULT_THRESHOLD) -> None:
+	"""
+	Sets the number of worker processes used for operations of at least threshold elements.
+
+	With num_workers <= 1 every operation runs serially in the current process.
+	"""
+	if threshold <= 0:
+		raise RuntimeError("Invalid value ( <=0 ) for threshold")
+	backend = Array._parallel_backend
+	if backend is not None:
+		if backend.num_workers == num_workers:
+			backend.threshold = threshold
+			return
+		backend.shutdown()
+	Array._parallel_backend = (
+		_ProcessPoolBackend(num_workers, threshold) if num_workers > 1 else None
+	)
+
+
+@contextmanager
+def num_workers(num_workers: int, threshold: int = DEFAULT_THRESHOLD):
+	"""
+	Context manager running large operations within it on num_workers worker processes.
+	"""
+	backend = Array._parallel_backend
+	previous = (
+		(1, DEFAULT_THRESHOLD) if backend is None else (backend.num_workers, backend.threshold)
+	)
+	set_num_workers(num_workers, threshold)
+	try:
+		yield
+	finally:
+		set_num_workers(*previous)
+
+
+@atexit.register
+def _shutdown() -> None:
+	if Array._parallel_backend is not None:
+		Array._parallel_backend.shutdown()
@@ -0,0 +1,194 @@
+# File with the pool recycling the buffers of garbage-collected arrays for new allocations.
+from __future__ import annotations  # for typehinting within the module
+
+from array import array as typed_array
+from collections import OrderedDict
+from typing import NamedTuple
+from weakref import WeakValueDictionary
+
+from .array import Array
+from .dtypes import _DTYPES
+
+# default maximum number of bytes (and of buffers) held by the pool, kept small: enough for the
+# temporaries of an iterative loop
+DEFAULT_MAX_BYTES = 16 << 20
+DEFAULT_MAX_BUFFERS = 16
+# default minimum size of the buffers recycled. Smaller ones are cheaper to allocate afresh than
+# to look up in the pool.
+DEFAULT_MIN_BYTES = 1 << 15
+
+_ITEMSIZES = {dtype.typecode: dtype.itemsize for dtype in _DTYPES.values()}
+
+
+class PoolStats(NamedTuple):
+	"""
+	Statistics of the buffer pool.
+	"""
+
+	hits: int  # allocations served with a recycled buffer
+	misses: int  # allocations which needed a fresh buffer
+	evictions: int  # buffers dropped to stay within the limits
+	bytes_held: int
+	buffers_held: int
+
+
+def _is_exported(buffer: typed_array) -> bool:
+	"""
+	Returns whether a memoryview (or any other export of the buffer protocol) of buffer is alive.
+	"""
+	try:
+		# typed arrays refuse to be resized while exported, even by an empty deletion
+		del buffer[len(buffer) :]
+	except BufferError:
+		return True
+	return False
+
+
+class _BufferPool:
+	"""
+	Pool of the typed buffers of garbage-collected arrays, bucketed by typecode and length, so
+	allocations of the same size (e.g. in iterative loops) reuse them instead of allocating.
+
+	The least recently released buffers are evicted first when the pool exceeds its limits.
+	"""
+
+	max_bytes: int
+	max_buffers: int
+	min_bytes: int
+
+	def __init__(self, max_bytes: int, max_buffers: int, min_bytes: int):
+		self.max_bytes = max_bytes
+		self.max_buffers = max_buffers
+		self.min_bytes = min_bytes
+		self.hits = self.misses = self.evictions = 0
+		self.bytes_held = 0
+		# buffers held, by (typecode, length)
+		self._buckets = {}
+		# ids of the buffers held (mapped to their bucket), from least to most recently released
+		self._lru = OrderedDict()
+		# buffers allocated by mininumpy, by id (typed arrays are unhashable). Only those are
+		# recycled, never the buffers of other objects wrapped by arrays.
+		self._owned = WeakValueDictionary()
+
+	def _take(self, buffer_id: int) -> typed_array:
+		"""
+		Removes the buffer of given id from the pool, and returns it.
+		"""
+		key = self._lru.pop(buffer_id)
+		bucket = self._buckets[key]
+		# buffers are found by identity, as typed arrays compare by value
+		buffer = bucket.pop(next(idx for idx, held in enumerate(bucket) if id(held) == buffer_id))
+		if not bucket:
+			del self._buckets[key]
+		# by the length it was released with, in case it was resized since
+		self.bytes_held -= key[1] * buffer.itemsize
+		return buffer
+
+	def _evict(self) -> None:
+		"""
+		Drops the least recently released buffers until the pool is within its limits.
+		"""
+		while self.bytes_held > self.max_bytes or len(self._lru) > self.max_buffers:
+			self._take(next(iter(self._lru)))
+			self.evictions += 1
+
+	def adopt(self, buffer: typed_array) -> None:
+		"""
+		Records buffer as allocated by mininumpy, if it is large enough to be recycled.
+		"""
+		if len(buffer) * buffer.itemsize >= self.min_bytes:
+			self._owned[id(buffer)] = buffer
+
+	def owns(self, buffer: typed_array) -> bool:
+		"""
+		Returns whether buffer was allocated by mininumpy (see adopt).
+		"""
+		return self._owned.get(id(buffer)) is buffer
+
+	def acquire(self, typecode: str, length: int) -> typed_array | None:
+		"""
+		Returns a recycled buffer of given typecode and length (with arbitrary contents), or None
+		if the pool has none.
+		"""
+		if length * _ITEMSIZES[typecode] < self.min_bytes:
+			return None
+		key = (typecode, length)
+		while key in self._buckets:
+			buffer = self._take(id(self._buckets[key][-1]))
+			# buffers still exported (e.g. through a memoryview obtained from an array, or by
+			# another array sharing it) are in use, so they are dropped instead, same as the ones
+			# resized since their release
+			if len(buffer) == length and not _is_exported(buffer):
+				self.hits += 1
+				return buffer
+		self.misses += 1
+		return None
+
+	def release(self, buffer: typed_array) -> None:
+		"""
+		Adds the buffer of a garbage-collected array to the pool, evicting the least recently
+		released buffers if the limits are exceeded.
+		"""
+		nbytes = len(buffer) * buffer.itemsize
+		if not self.min_bytes <= nbytes <= self.max_bytes or id(buffer) in self._lru:
+			return
+		key = (buffer.typecode, len(buffer))
+		self._buckets.setdefault(key, []).append(buffer)
+		self._lru[id(buffer)] = key
+		self.bytes_held += nbytes
+		self._evict()
+
+	def clear(self) -> None:
+		"""
+		Drops every buffer held.
+		"""
+		self._buckets.clear()
+		self._lru.clear()
+		self.bytes_held = 0
+
+	def stats(self) -> PoolStats:
+		return PoolStats(self.hits, self.misses, self.evictions, self.bytes_held, len(self._lru))
+
+
+def get_pool_stats() -> PoolStats:
+	"""
+	Returns the statistics (hits, misses, evictions, bytes and buffers held) of the buffer pool.
+	"""
+	pool = Array._buffer_pool
+	return PoolStats(0, 0, 0, 0, 0) if pool is None else pool.stats()
+
+
+def set_pool_limits(
+	max_bytes: int = DEFAULT_MAX_BYTES,
+	max_buffers: int = DEFAULT_MAX_BUFFERS,
+	min_bytes: int = DEFAULT_MIN_BYTES,
+) -> None:
+	"""
+	Sets the maximum number of bytes and of buffers held by the buffer pool, evicting the least
+	recently released buffers to fit, and the minimum size of the buffers it recycles. A maximum
+	of 0 disables the pool.
+	"""
+	if max_bytes < 0 or max_buffers < 0 or min_bytes < 0:
+		raise RuntimeError("Invalid value ( <0 ) for the limits of the buffer pool")
+	pool = Array._buffer_pool
+	if max_bytes == 0 or max_buffers == 0:
+		if pool is not None:
+			pool.clear()
+		Array._buffer_pool = None
+		return
+	if pool is None:
+		Array._buffer_pool = _BufferPool(max_bytes, max_buffers, min_bytes)
+		return
+	pool.max_bytes, pool.max_buffers, pool.min_bytes = max_bytes, max_buffers, min_bytes
+	pool._evict()
+
+
+def clear_pool() -> None:
+	"""
+	Releases every buffer held by the buffer pool, keeping its statistics.
+	"""
+	if Array._buffer_pool is not None:
+		Array._buffer_pool.clear()
+
+
+set_pool_limits()
@@ -0,0 +1,263 @@
+# File with the formatting of arrays as text, with NumPy-style print options.
+from __future__ import annotations  # for typehinting within the module
+
+import sys
+from contextlib import contextmanager
+from itertools import chain
+from math import inf
+from typing import NamedTuple, TextIO
+
+from .array import Array
+
+
+class PrintOptions(NamedTuple):
+	"""
+	Options controlling how arrays are formatted as text.
+	"""
+
+	threshold: int = 1000  # arrays with more elements are summarized
+	edgeitems: int = 3  # elements shown at each end of a summarized axis
+	precision: int = 8  # digits shown after the decimal point of floats
+	linewidth: int = 75  # characters per line before wrapping
+
+
+_print_options = PrintOptions()
+
+# placeholder for the elements left out of a summarized axis
+_ELLIPSIS = "..."
+
+
+def get_printoptions() -> PrintOptions:
+	"""
+	Returns the current print options.
+	"""
+	return _print_options
+
+
+def set_printoptions(
+	threshold: int | None = None,
+	edgeitems: int | None = None,
+	precision: int | None = None,
+	linewidth: int | None = None,
+) -> None:
+	"""
+	Sets the print options given (leaving the others unchanged).
+	"""
+	global _print_options
+	_print_options = _resolve_options(threshold, edgeitems, precision, linewidth)
+
+
+@contextmanager
+def printoptions(
+	threshold: int | None = None,
+	edgeitems: int | None = None,
+	precision: int | None = None,
+	linewidth: int | None = None,
+):
+	"""
+	Context manager setting the print options given within it.
+	"""
+	global _print_options
+	previous = _print_options
+	set_printoptions(threshold, edgeitems, precision, linewidth)
+	try:
+		yield
+	finally:
+		_print_options = previous
+
+
+def _resolve_options(
+	threshold: int | None,
+	edgeitems: int | None,
+	precision: int | None,
+	linewidth: int | None,
+) -> PrintOptions:
+	"""
+	Returns the current print options, with the ones given (not None) replaced.
+	"""
+	options = _print_options._replace(
+		**{
+			name: value
+			for name, value in zip(
+				PrintOptions._fields, (threshold, edgeitems, precision, linewidth)
+			)
+			if value is not None
+		}
+	)
+	if min(options.threshold, options.edgeitems, options.precision) < 0:
+		raise ValueError("threshold, edgeitems and precision must be non-negative")
+	if options.linewidth <= 0:
+		raise ValueError("Invalid value ( <=0 ) for linewidth")
+	return options
+
+
+def _formatter(array: Array, options: PrintOptions, summarize: bool):
+	"""
+	Returns the function formatting a single element of the array.
+
+	Floats are rounded to the precision, unless the smallest non-zero magnitude displayed is
+	below 10**-precision, or the largest is at least 1e16, in which case every float is written
+	in scientific notation (same as numpy).
+	"""
+	if array.dtype.kind != "f":
+		return str
+	precision = options.precision
+	smallest, largest = inf, 0.0
+	for value in _displayed_values(array, options, summarize):
+		magnitude = abs(value)
+		if magnitude and magnitude != inf and magnitude == magnitude:
+			smallest = min(smallest, magnitude)
+			largest = max(largest, magnitude)
+	if smallest >= 10**-precision and largest < 1e16:
+		return lambda value: repr(round(value, precision))
+
+	def scientific(value: float) -> str:
+		mantissa, _, exponent = f"{value:.{precision}e}".partition("e")
+		if not exponent:
+			return mantissa  # nan and inf
+		mantissa = mantissa.rstrip("0")
+		return f"{mantissa}0e{exponent}" if mantissa.endswith(".") else f"{mantissa}e{exponent}"
+
+	return scientific
+
+
+def _axis_indices(length: int, edgeitems: int, summarize: bool):
+	"""
+	Returns the indices shown along an axis of given length, with None standing for the elements
+	left out of a summarized axis.
+	"""
+	if summarize and length > 2 * edgeitems:
+		return chain(range(edgeitems), (None,), range(length - edgeitems, length))
+	return range(length)
+
+
+def _displayed_values(array: Array, options: PrintOptions, summarize: bool):
+	"""
+	Returns an iterable over the elements of the array which are displayed, reading only those
+	from the buffer.
+	"""
+	if not summarize or array.ndim == 0:
+		return array._flat_values()
+	# buffer positions of the displayed elements, one axis at a time
+	positions = [array.offset]
+	for dim, stride in zip(array.shape, array.strides):
+		positions = [
+			position + idx * stride
+			for position in positions
+			for idx in _axis_indices(dim, options.edgeitems, True)
+			if idx is not None
+		]
+	return map(array.data.__getitem__, positions)
+
+
+def _format_row(array: Array, start: int, options: PrintOptions, summarize: bool, format_value):
+	"""
+	Yields the lines of the innermost row of the array starting at buffer position start, wrapped
+	at the line width. Continuation lines are indented past the enclosing brackets.
+	"""
+	length, stride = array.shape[-1], array.strides[-1]
+	if summarize and length > 2 * options.edgeitems:
+		# only the displayed edge elements are read from the buffer
+		words = (
+			_ELLIPSIS if idx is None else format_value(array.data[start + idx * stride])
+			for idx in _axis_indices(length, options.edgeitems, True)
+		)
+	else:
+		words = map(format_value, Array._strided_row(array.data, start, length, stride))
+
+	# the enclosing brackets (or indentation) before the row are written by the enclosing axes
+	column = array.ndim - 1
+	line = "["
+	first = True
+	for word in words:
+		if not first:
+			# room is kept for the separator or closing bracket following the word
+			if column + len(line) + len(word) + 3 > options.linewidth:
+				yield line + ",\n"
+				column, line = 0, " " * array.ndim
+			else:
+				line += ", "
+		line += word
+		first = False
+	yield line + "]"
+
+
+def _format_axis(
+	array: Array,
+	axis: int,
+	start: int,
+	options: PrintOptions,
+	summarize: bool,
+	format_value,
+):
+	"""
+	Yields the text of the subarray at given axis starting at buffer position start.
+	"""
+	if axis == array.ndim - 1:
+		yield from _format_row(array, start, options, summarize, format_value)
+		return
+	separator = "," + "\n" * (array.ndim - axis - 1) + " " * (axis + 1)
+	stride = array.strides[axis]
+	yield "["
+	for position, idx in enumerate(_axis_indices(array.shape[axis], options.edgeitems, summarize)):
+		if position:
+			yield separator
+		if idx is None:
+			yield _ELLIPSIS
+		else:
+			yield from _format_axis(
+				array, axis + 1, start + idx * stride, options, summarize, format_value
+			)
+	yield "]"
+
+
+def _format_chunks(array: Array, options: PrintOptions):
+	"""
+	Yields the text of the array in chunks of at most a line, summarizing it if it has more
+	elements than the threshold.
+	"""
+	if array.size == 0:
+		yield "[]"
+		return
+	summarize = array.size > options.threshold
+	format_value = _formatter(array, options, summarize)
+	if array.ndim == 0:
+		yield format_value(array.data[array.offset])
+	else:
+		yield from _format_axis(array, 0, array.offset, options, summarize, format_value)
+
+
+def array2string(
+	array: Array,
+	threshold: int | None = None,
+	edgeitems: int | None = None,
+	precision: int | None = None,
+	linewidth: int | None = None,
+) -> str:
+	"""
+	Returns the text of the array, with the print options given overriding the current ones.
+	"""
+	options = _resolve_options(threshold, edgeitems, precision, linewidth)
+	return "".join(_format_chunks(array, options))
+
+
+def write_array(
+	array: Array,
+	file: TextIO | None = None,
+	threshold: int | None = sys.maxsize,
+	edgeitems: int | None = None,
+	precision: int | None = None,
+	linewidth: int | None = None,
+) -> None:
+	"""
+	Writes the text of the array to a file object a line at a time, without building it in
+	memory (to standard output by default). Unlike str(), the whole array is written unless a
+	threshold is given.
+	"""
+	if file is None:
+		file = sys.stdout
+	options = _resolve_options(threshold, edgeitems, precision, linewidth)
+	write = file.write
+	for chunk in _format_chunks(array, options):
+		write(chunk)
+	write("\n")
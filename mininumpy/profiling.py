@@ -0,0 +1,197 @@
+# File with the profiler of array operations, and the registry of hooks it is built upon.
+from __future__ import annotations  # for typehinting the Profile class within itself
+
+import json
+import os
+import threading
+from array import array as typed_array
+from collections import Counter
+from typing import NamedTuple
+
+from .array import Array
+
+
+def add_hook(hook) -> None:
+	"""
+	Registers hook to be called after every instrumented operation (constructors, ufuncs and
+	their methods, reductions, transpose, reshape, copy, dot and matmul) as
+	hook(name, arguments, result, start, duration), where arguments holds the values of both
+	positional and keyword arguments, and times are in nanoseconds of time.perf_counter_ns.
+
+	Operations are only timed while at least one hook is registered.
+	"""
+	if hook not in Array._hooks:
+		Array._hooks.append(hook)
+
+
+def remove_hook(hook) -> None:
+	"""
+	Unregisters hook, registered with add_hook.
+	"""
+	if hook not in Array._hooks:
+		raise ValueError(f"Hook {hook!r} is not registered")
+	Array._hooks.remove(hook)
+
+
+class Event(NamedTuple):
+	"""
+	Call of an operation recorded by a profile.
+	"""
+
+	name: str
+	start: int  # in nanoseconds
+	duration: int  # in nanoseconds
+	input_shapes: tuple[tuple[int]]
+	output_shape: tuple[int] | None  # None if the result is not an array
+	nbytes: int  # allocated for the result
+
+
+class OperationStats(NamedTuple):
+	"""
+	Aggregated statistics of every call of an operation.
+	"""
+
+	count: int
+	time: float  # in seconds
+	nbytes: int
+	shapes: Counter  # number of calls for each combination of input shapes
+
+
+def _allocated_bytes(arguments: tuple, result) -> int:
+	"""
+	Returns the bytes of the buffer allocated for result, or 0 if result is not an array, a view
+	of one of the arguments, or an array wrapping foreign memory (e.g. a memory-mapped file).
+	"""
+	if not isinstance(result, Array) or not isinstance(result.data.obj, typed_array):
+		return 0
+	if any(result._shares_buffer(argument) for argument in arguments):
+		return 0
+	return result.data.nbytes
+
+
+class Profile:
+	"""
+	Recorder of the operations executed within a `with` block, see profile.
+	"""
+
+	events: list[Event]
+
+	def __init__(self):
+		self.events = []
+
+	def __enter__(self) -> Profile:
+		add_hook(self._record)
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		remove_hook(self._record)
+
+	def _record(self, name: str, arguments: tuple, result, start: int, duration: int) -> None:
+		# only shapes are kept, so the profile does not keep the arrays alive
+		input_shapes = tuple(
+			argument.shape for argument in arguments if isinstance(argument, Array)
+		)
+		output_shape = result.shape if isinstance(result, Array) else None
+		nbytes = _allocated_bytes(arguments, result)
+		self.events.append(Event(name, start, duration, input_shapes, output_shape, nbytes))
+
+	def stats(self) -> dict[str, OperationStats]:
+		"""
+		Returns the statistics of the recorded events, by operation.
+		"""
+		grouped = {}
+		for event in self.events:
+			count, time, nbytes, shapes = grouped.get(event.name, (0, 0, 0, Counter()))
+			shapes[event.input_shapes] += 1
+			grouped[event.name] = (count + 1, time + event.duration, nbytes + event.nbytes, shapes)
+		return {
+			name: OperationStats(count, time / 1e9, nbytes, shapes)
+			for name, (count, time, nbytes, shapes) in grouped.items()
+		}
+
+	def report(self, sort_by: str = "time", file=None) -> str:
+		"""
+		Returns (and prints into file, if given) a table with the statistics of every operation,
+		sorted by "time", "count", "nbytes" or "name".
+		"""
+		keys = {
+			"time": lambda item: -item[1].time,
+			"count": lambda item: -item[1].count,
+			"nbytes": lambda item: -item[1].nbytes,
+			"name": lambda item: item[0],
+		}
+		if sort_by not in keys:
+			raise ValueError(f"Invalid sort_by {sort_by!r}. Expected one of {list(keys)}")
+		stats = sorted(self.stats().items(), key=keys[sort_by])
+		total_time = sum(operation.time for _, operation in stats) or 1
+
+		rows = [("operation", "calls", "time (s)", "%", "per call (us)", "bytes", "input shapes")]
+		for name, operation in stats:
+			(shapes, _), *others = operation.shapes.most_common()
+			rows.append(
+				(
+					name,
+					str(operation.count),
+					f"{operation.time:.6f}",
+					f"{100 * operation.time / total_time:.1f}",
+					f"{1e6 * operation.time / operation.count:.2f}",
+					str(operation.nbytes),
+					", ".join(map(str, shapes)) + (f" (+{len(others)} more)" if others else ""),
+				)
+			)
+		widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+		table = "\n".join(
+			"  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+			for row in rows
+		)
+		if file is not None:
+			print(table, file=file)
+		return table
+
+	def chrome_trace(self, file=None) -> dict:
+		"""
+		Returns the recorded events in Chrome's trace event format, which can be opened with
+		chrome://tracing or Perfetto. It is also written as JSON into file (a path or a text file
+		object), if given.
+		"""
+		pid, tid = os.getpid(), threading.get_ident()
+		trace = {
+			"traceEvents": [
+				{
+					"name": event.name,
+					"cat": "mininumpy",
+					"ph": "X",
+					"ts": event.start / 1e3,
+					"dur": event.duration / 1e3,
+					"pid": pid,
+					"tid": tid,
+					"args": {
+						"input_shapes": event.input_shapes,
+						"output_shape": event.output_shape,
+						"nbytes": event.nbytes,
+					},
+				}
+				for event in self.events
+			],
+			"displayTimeUnit": "ms",
+		}
+		if isinstance(file, (str, os.PathLike)):
+			with open(file, "w") as opened_file:
+				json.dump(trace, opened_file)
+		elif file is not None:
+			json.dump(trace, file)
+		return trace
+
+
+def profile() -> Profile:
+	"""
+	Returns a profile recording the count, wall time, input and output shapes and allocated bytes
+	of every operation executed within it, used as a context manager:
+
+		with mnp.profile() as p:
+			...
+		p.report(file=sys.stdout)
+
+	Only the outermost operation of nested calls (e.g. the ufunc called by dot) is recorded.
+	"""
+	return Profile()
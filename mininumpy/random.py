@@ -0,0 +1,284 @@
+# File with the random number generator filling typed buffers in bulk.
+from __future__ import annotations  # for typehinting the generator within itself
+
+import random
+import secrets
+from array import array as typed_array
+from bisect import bisect_right
+from hashlib import sha256
+from heapq import nlargest
+from itertools import accumulate, islice, repeat
+from math import cos, log, pi, prod, sin, sqrt
+from operator import add, mul, rshift, sub
+
+from .array import Array, _instrumented
+from .core import _index_array, _normalize_dtype, _normalize_shape, asarray
+from .dtypes import DType, float32, float64, int64, uint32, uint64
+
+
+def _stream_seed(seed: int, spawn_key: tuple[int]) -> int:
+	"""
+	Returns the seed of the stream of given spawn key, hashed so that the streams of different
+	keys (or seeds) are independent of each other.
+	"""
+	return int.from_bytes(sha256(repr((seed, spawn_key)).encode()).digest())
+
+
+class Generator:
+	"""
+	Seedable random number generator, whose draws are written into typed buffers in bulk.
+
+	The same seed gives the same draws in any process. Independent streams (e.g. one for each
+	worker of a parallel job) are created with spawn.
+	"""
+
+	seed: int
+	spawn_key: tuple[int]
+
+	def __init__(self, seed: int | None = None, spawn_key: tuple[int] = ()):
+		if seed is None:
+			seed = secrets.randbits(128)
+		if not isinstance(seed, int) or seed < 0:
+			raise ValueError(f"Invalid seed {seed}. Expected a non-negative int")
+		self.seed = seed
+		self.spawn_key = tuple(spawn_key)
+		self._children_spawned = 0
+		# the C implemented Mersenne Twister, seeded from the hash of the seed and spawn key
+		self._random = random.Random(_stream_seed(seed, self.spawn_key))
+
+	def __repr__(self) -> str:
+		return f"Generator(seed={self.seed}, spawn_key={self.spawn_key})"
+
+	def spawn(self, n_children: int) -> list[Generator]:
+		"""
+		Returns n_children new generators, whose streams are independent of this one, of each
+		other, and of the ones spawned by previous calls.
+		"""
+		first = self._children_spawned
+		self._children_spawned += n_children
+		return [
+			Generator(self.seed, self.spawn_key + (idx,))
+			for idx in range(first, self._children_spawned)
+		]
+
+	# helpers
+	def _bits(self, dtype: DType, count: int) -> typed_array:
+		"""
+		Returns a typed buffer of count elements of given dtype, with uniformly random bits.
+		"""
+		buffer = typed_array(dtype.typecode)
+		buffer.frombytes(self._random.randbytes(count * dtype.itemsize))
+		return buffer
+
+	def _floats(self, count: int, high: float = 1.0) -> typed_array:
+		"""
+		Returns a float64 buffer of count floats uniformly drawn from [0, high).
+
+		Each float is made of the 53 high bits of a random 64-bit word, drawn in bulk, scaled in
+		the same pass.
+		"""
+		bits = map(rshift, self._bits(uint64, count), repeat(11))
+		return typed_array(float64.typecode, map(mul, bits, repeat(high * 2.0**-53)))
+
+	@staticmethod
+	def _output(buffer: typed_array, size: int | tuple[int] | None, dtype: DType):
+		"""
+		Returns the draws of buffer as an array of the shape given by size, or as a single number
+		if size is None.
+		"""
+		if size is None:
+			return buffer[0]
+		return Array._from_data(memoryview(buffer), _normalize_shape(size), dtype)
+
+	@staticmethod
+	def _count(size: int | tuple[int] | None) -> int:
+		"""
+		Returns the number of draws needed for given size.
+		"""
+		return 1 if size is None else prod(_normalize_shape(size))
+
+	# distributions
+	@_instrumented("random.random")
+	def random(
+		self,
+		size: int | tuple[int] | None = None,
+		dtype: DType | type | str = float64,
+	) -> Array | float:
+		"""
+		Returns floats uniformly drawn from [0, 1), of float32 or float64 dtype.
+		"""
+		dtype = _normalize_dtype(dtype)
+		count = self._count(size)
+		if dtype is float64:
+			buffer = self._floats(count)
+		elif dtype is float32:
+			# from 24 random bits each, as float64 draws could round up to 1 as float32
+			bits = map(rshift, self._bits(uint32, count), repeat(8))
+			buffer = typed_array(dtype.typecode, map(mul, bits, repeat(2.0**-24)))
+		else:
+			raise ValueError(f"Unsupported dtype {dtype} for random, expected a float dtype")
+		return self._output(buffer, size, dtype)
+
+	@_instrumented("random.integers")
+	def integers(
+		self,
+		low: int,
+		high: int | None = None,
+		size: int | tuple[int] | None = None,
+		dtype: DType | type | str = int64,
+		endpoint: bool = False,
+	) -> Array | int:
+		"""
+		Returns integers uniformly drawn from [low, high), or [0, low) if high is None (including
+		high if endpoint is True).
+
+		Draws are the high bits of the product of random 64-bit words by the size of the range:
+		exact for ranges whose size is a power of two, and otherwise biased by less than
+		size / 2**64.
+		"""
+		if high is None:
+			low, high = 0, low
+		if endpoint:
+			high += 1
+		dtype = _normalize_dtype(dtype)
+		if dtype.kind not in "iu":
+			raise ValueError(f"Unsupported dtype {dtype} for integers, expected an integer dtype")
+		if low >= high:
+			raise ValueError(f"Invalid range, low ({low}) >= high ({high})")
+		min_value, max_value = dtype.bounds
+		if low < min_value or high - 1 > max_value:
+			raise ValueError(f"Range [{low}, {high}) out of the bounds of {dtype}")
+
+		count = self._count(size)
+		span = high - low
+		if span == max_value - min_value + 1:
+			# random bits are uniform over the whole range of the dtype
+			buffer = self._bits(dtype, count)
+		else:
+			values = map(rshift, map(mul, self._bits(uint64, count), repeat(span)), repeat(64))
+			if low:
+				values = map(add, values, repeat(low))
+			buffer = typed_array(dtype.typecode, values)
+		return self._output(buffer, size, dtype)
+
+	@_instrumented("random.uniform")
+	def uniform(
+		self,
+		low: float = 0.0,
+		high: float = 1.0,
+		size: int | tuple[int] | None = None,
+	) -> Array | float:
+		"""
+		Returns floats uniformly drawn from [low, high).
+		"""
+		buffer = self._floats(self._count(size), high - low)
+		if low:
+			buffer = typed_array(float64.typecode, map(add, buffer, repeat(low)))
+		return self._output(buffer, size, float64)
+
+	@_instrumented("random.normal")
+	def normal(
+		self,
+		loc: float = 0.0,
+		scale: float = 1.0,
+		size: int | tuple[int] | None = None,
+	) -> Array | float:
+		"""
+		Returns floats drawn from the normal distribution of mean loc and standard deviation
+		scale.
+
+		Draws are made in pairs with the Box-Muller transform, each pair of uniform draws giving
+		two independent normal ones.
+		"""
+		if scale < 0:
+			raise ValueError(f"Invalid scale ( <0 ): {scale}")
+		count = self._count(size)
+		n_pairs = (count + 1) // 2
+		# 1 - u is in (0, 1], so its logarithm is finite
+		logs = map(log, map(sub, repeat(1.0), self._floats(n_pairs)))
+		radii = typed_array(float64.typecode, map(sqrt, map(mul, logs, repeat(-2.0))))
+		angles = self._floats(n_pairs, 2 * pi)
+		buffer = typed_array(float64.typecode, map(mul, radii, map(cos, angles)))
+		buffer.extend(islice(map(mul, radii, map(sin, angles)), count - n_pairs))
+		if (loc, scale) != (0.0, 1.0):
+			buffer = typed_array(
+				float64.typecode, map(add, map(mul, buffer, repeat(scale)), repeat(loc))
+			)
+		return self._output(buffer, size, float64)
+
+	@_instrumented("random.choice")
+	def choice(
+		self,
+		a: int | Array | list,
+		size: int | tuple[int] | None = None,
+		replace: bool = True,
+		p: Array | list | None = None,
+	) -> Array | int | float:
+		"""
+		Returns elements drawn from a (along its first axis), or from range(a) if a is an int,
+		optionally with the probabilities p of each element, and without replacement if replace
+		is False.
+		"""
+		population = None if isinstance(a, int) else asarray(a)
+		if population is not None and population.ndim == 0:
+			raise ValueError("a must be an int or have at least 1 dimension")
+		n = a if population is None else population.shape[0]
+		count = self._count(size)
+		if count and n <= 0:
+			raise ValueError("Cannot draw from an empty population")
+		if not replace and count > n:
+			raise ValueError(f"Cannot draw {count} elements out of {n} without replacement")
+
+		if p is None:
+			if replace:
+				indices = self.integers(0, max(n, 1), count)._flat_values()
+			else:
+				indices = self._random.sample(range(n), count)
+		else:
+			weights = list(asarray(p)._flat_values())
+			if len(weights) != n:
+				raise ValueError(f"p must have as many elements as a ({n}), got {len(weights)}")
+			if min(weights, default=0) < 0 or abs(sum(weights) - 1) > 1e-8:
+				raise ValueError("p must be non-negative and sum to 1")
+			if replace:
+				# each draw falls within the cumulative weights of the element drawn
+				cumulative = list(accumulate(weights))
+				draws = self._floats(count, cumulative[-1])
+				indices = map(bisect_right, repeat(cumulative), draws, repeat(0), repeat(n - 1))
+			else:
+				if count > n - weights.count(0):
+					raise ValueError("Fewer elements with non-zero probability than size")
+				# the elements with the largest keys u ** (1 / w) form a weighted sample
+				keys = [
+					draw ** (1 / weight) if weight > 0 else -1.0
+					for draw, weight in zip(self._floats(n), weights)
+				]
+				indices = nlargest(count, range(n), key=keys.__getitem__)
+
+		indices = list(indices)
+		if size is None:
+			return indices[0] if population is None else population[indices[0]]
+		indices = _index_array(indices, _normalize_shape(size))
+		return indices if population is None else population[indices]
+
+	@_instrumented("random.permutation")
+	def permutation(self, x: int | Array | list) -> Array:
+		"""
+		Returns a random permutation of range(x) if x is an int, or a copy of x shuffled along
+		its first axis.
+		"""
+		array = None if isinstance(x, int) else asarray(x)
+		if array is not None and array.ndim == 0:
+			raise ValueError("x must be an int or have at least 1 dimension")
+		order = list(range(x if array is None else array.shape[0]))
+		self._random.shuffle(order)
+		order = _index_array(order)
+		return order if array is None else array[order]
+
+
+def default_rng(seed: int | Generator | None = None) -> Generator:
+	"""
+	Returns a new generator seeded with seed (or with fresh entropy if None), or seed itself if
+	it is already a generator.
+	"""
+	return seed if isinstance(seed, Generator) else Generator(seed)
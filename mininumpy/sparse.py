@@ -0,0 +1,446 @@
+# File with the sparse matrix types (COO and CSR), storing only their non-zero elements.
+from __future__ import annotations  # for typehinting the sparse classes within themselves
+
+from itertools import accumulate, chain, compress, pairwise, repeat
+from math import sumprod
+
+from . import dtypes
+from .array import Array
+from .core import asarray
+from .dtypes import DType, bool_, int32, int64
+
+
+def _index_dtype(shape: tuple[int, int]) -> DType:
+	"""
+	Returns the dtype of the indices of a sparse matrix of given shape: int32 whenever they fit.
+	"""
+	return int32 if max(shape, default=0) < 1 << 31 else int64
+
+
+def _from_values(values, dtype: DType) -> Array:
+	"""
+	Creates a 1-dimensional array of given dtype from an iterable of values.
+	"""
+	data = Array._make_buffer(dtype, map(bool, values) if dtype is bool_ else values)
+	return Array._from_data(data, (len(data),), dtype)
+
+
+def _as_vector(values: Array | list, name: str, dtype: DType | None = None) -> Array:
+	"""
+	Returns values as a contiguous 1-dimensional array (of dtype, if given), raising exception if
+	it has more dimensions.
+	"""
+	values = asarray(values)
+	if values.ndim != 1:
+		raise ValueError(f"{name} must be 1-dimensional, got shape {values.shape}")
+	if dtype is not None:
+		if values.size and values.dtype.kind not in "iu":
+			raise ValueError(f"{name} must be of an integer dtype, not {values.dtype}")
+		values = values.astype(dtype, copy=False)
+	return values.ascontiguousarray()
+
+
+def _check_shape(shape: tuple[int, int]) -> tuple[int, int]:
+	"""
+	Returns shape as a tuple, raising exception if it is not a valid 2-dimensional shape.
+	"""
+	shape = tuple(shape)
+	if len(shape) != 2 or not all(isinstance(dim, int) and dim >= 0 for dim in shape):
+		raise ValueError(f"Invalid shape {shape}. Expected 2 non-negative ints")
+	return shape
+
+
+def _check_bounds(indices: Array, dim: int, name: str) -> None:
+	"""
+	Raises exception if any index is out of the bounds of a dimension of length dim.
+	"""
+	values = indices._flat_values()
+	if indices.size and (min(values) < 0 or max(values) >= dim):
+		raise ValueError(f"{name} indices out of bounds for dimension of length {dim}")
+
+
+class _SparseMatrix:
+	"""
+	Base of the sparse matrix types, with the operations only acting on the stored elements.
+	"""
+
+	data: Array  # stored elements
+	shape: tuple[int, int]
+	ndim = 2
+
+	@property
+	def dtype(self) -> DType:
+		return self.data.dtype
+
+	@property
+	def nnz(self) -> int:
+		"""
+		Number of stored elements.
+		"""
+		return self.data.size
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		Number of bytes of the buffers of the stored elements and their indices.
+		"""
+		return sum(array.data.nbytes for array in self._arrays())
+
+	def __repr__(self) -> str:
+		return (
+			f"<{self.shape[0]}x{self.shape[1]} {type(self).__name__} matrix of dtype {self.dtype} "
+			f"with {self.nnz} stored elements>"
+		)
+
+	@property
+	def T(self) -> _SparseMatrix:
+		"""
+		Transpose of the matrix.
+		"""
+		return self.transpose()
+
+	# elementwise operations with scalars, which keep zeros as zeros
+	def _map_data(self, function, operand: int | float) -> _SparseMatrix:
+		"""
+		Returns a matrix of the same structure, whose stored elements are function(data, operand).
+		"""
+		if not isinstance(operand, (int, float)):
+			raise ValueError(f"Unsupported operation for types {type(self)} and {type(operand)}")
+		return self._with_data(function(self.data, operand))
+
+	def __mul__(self, operand: int | float) -> _SparseMatrix:
+		return self._map_data(Array.__mul__, operand)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, operand: int | float) -> _SparseMatrix:
+		return self._map_data(Array.__truediv__, operand)
+
+	def __pow__(self, operand: int | float) -> _SparseMatrix:
+		if isinstance(operand, (int, float)) and operand <= 0:
+			raise ValueError("Powers with non-positive exponents would make the matrix dense")
+		return self._map_data(Array.__pow__, operand)
+
+	def __add__(self, operand: int | float) -> _SparseMatrix:
+		if isinstance(operand, (int, float)) and operand != 0:
+			raise ValueError("Adding non-zero scalars would make the matrix dense")
+		return self._map_data(Array.__add__, operand)
+
+	__radd__ = __add__
+
+	def __sub__(self, operand: int | float) -> _SparseMatrix:
+		if isinstance(operand, (int, float)) and operand != 0:
+			raise ValueError("Subtracting non-zero scalars would make the matrix dense")
+		return self._map_data(Array.__sub__, operand)
+
+	def __neg__(self) -> _SparseMatrix:
+		return self._with_data(-self.data)
+
+	def __abs__(self) -> _SparseMatrix:
+		return self._with_data(abs(self.data))
+
+	def __matmul__(self, operand: Array) -> Array:
+		return self.dot(operand)
+
+	def _sums(self, totals: list[int | float]) -> Array:
+		"""
+		Returns the sums along an axis as an array, of the dtype of sums of the stored elements
+		(same as for dense arrays).
+		"""
+		return _from_values(totals, Array._accumulation_dtype(self))
+
+
+class COO(_SparseMatrix):
+	"""
+	Sparse matrix in coordinate format: the stored elements and their row and column indices,
+	in any order. Duplicated coordinates are summed together.
+
+	Cheap to build and transpose. Convert it into CSR (see tocsr) for products and row access.
+	"""
+
+	row: Array
+	col: Array
+
+	def __init__(self, data: Array | list, row: Array | list, col: Array | list, shape):
+		"""
+		Creates a matrix of given shape with data[k] at (row[k], col[k]).
+		"""
+		self.shape = _check_shape(shape)
+		index_dtype = _index_dtype(self.shape)
+		self.data = _as_vector(data, "data")
+		self.row = _as_vector(row, "row", index_dtype)
+		self.col = _as_vector(col, "col", index_dtype)
+		if not self.data.size == self.row.size == self.col.size:
+			raise ValueError("data, row and col must have the same length")
+		_check_bounds(self.row, self.shape[0], "Row")
+		_check_bounds(self.col, self.shape[1], "Column")
+
+	@classmethod
+	def _from_arrays(cls, data: Array, row: Array, col: Array, shape: tuple[int, int]) -> COO:
+		"""
+		Creates a matrix directly from its (valid) arrays, without any check or copy.
+		"""
+		new_matrix = cls.__new__(cls)
+		new_matrix.data, new_matrix.row, new_matrix.col = data, row, col
+		new_matrix.shape = shape
+		return new_matrix
+
+	def _arrays(self) -> tuple[Array]:
+		return self.data, self.row, self.col
+
+	def _with_data(self, data: Array) -> COO:
+		return self._from_arrays(data, self.row, self.col, self.shape)
+
+	@classmethod
+	def from_dense(cls, array: Array) -> COO:
+		"""
+		Creates a matrix with the non-zero elements of a 2-dimensional array.
+		"""
+		return CSR.from_dense(array).tocoo()
+
+	def to_dense(self) -> Array:
+		"""
+		Returns the matrix as a dense array.
+		"""
+		return self.tocsr().to_dense()
+
+	def tocoo(self) -> COO:
+		return self
+
+	def tocsr(self) -> CSR:
+		"""
+		Returns the matrix in CSR format, with the elements of each row sorted by column and
+		duplicated coordinates summed.
+		"""
+		n_rows, n_cols = self.shape
+		rows, cols = self.row._flat_values(), self.col._flat_values()
+		values = self.data._flat_values()
+		keys = [row * n_cols + col for row, col in zip(rows, cols)]
+		order = sorted(range(len(keys)), key=keys.__getitem__)
+
+		merged_keys, merged_values = [], []
+		for idx in order:
+			if merged_keys and merged_keys[-1] == keys[idx]:
+				merged_values[-1] += values[idx]
+			else:
+				merged_keys.append(keys[idx])
+				merged_values.append(values[idx])
+		counts = [0] * n_rows
+		for key in merged_keys:
+			counts[key // n_cols] += 1
+
+		index_dtype = _index_dtype(self.shape)
+		return CSR._from_arrays(
+			_from_values(merged_values, self.dtype),
+			_from_values((key % n_cols for key in merged_keys), index_dtype),
+			_from_values(chain((0,), accumulate(counts)), index_dtype),
+			self.shape,
+		)
+
+	def transpose(self) -> COO:
+		"""
+		Returns the transpose of the matrix, sharing its arrays.
+		"""
+		return self._from_arrays(self.data, self.col, self.row, self.shape[::-1])
+
+	def dot(self, operand: Array) -> Array:
+		"""
+		Product of the matrix with a dense vector or matrix, see CSR.dot.
+		"""
+		return self.tocsr().dot(operand)
+
+	def sum(self, axis: int | None = None) -> Array | int | float:
+		"""
+		Sum of the elements along the given axis (as a 1-dimensional array), or of all of them if
+		axis is None.
+		"""
+		if axis is None:
+			return sum(self.data._flat_values())
+		(axis,) = Array._normalize_axes(axis, 2)
+		# elements are summed into the index along the other axis
+		kept = self.col if axis == 0 else self.row
+		totals = [0] * self.shape[1 - axis]
+		for idx, value in zip(kept._flat_values(), self.data._flat_values()):
+			totals[idx] += value
+		return self._sums(totals)
+
+
+class CSR(_SparseMatrix):
+	"""
+	Sparse matrix in compressed sparse row format: the stored elements row after row, their
+	column indices, and the pointers indptr such that the elements of row i are
+	data[indptr[i]:indptr[i + 1]].
+
+	Efficient for products with dense vectors and matrices, and for sums along rows. Elements
+	are expected sorted by column within each row, without duplicates (as produced by from_dense
+	and COO.tocsr).
+	"""
+
+	indices: Array
+	indptr: Array
+
+	def __init__(self, data: Array | list, indices: Array | list, indptr: Array | list, shape):
+		"""
+		Creates a matrix of given shape from its stored elements, their column indices and the
+		pointers to the start of each row.
+		"""
+		self.shape = _check_shape(shape)
+		index_dtype = _index_dtype(self.shape)
+		self.data = _as_vector(data, "data")
+		self.indices = _as_vector(indices, "indices", index_dtype)
+		self.indptr = _as_vector(indptr, "indptr", index_dtype)
+		if self.data.size != self.indices.size:
+			raise ValueError("data and indices must have the same length")
+		pointers = self.indptr._flat_values()
+		if (
+			len(pointers) != self.shape[0] + 1
+			or pointers[0] != 0
+			or pointers[-1] != self.data.size
+			or any(start > stop for start, stop in pairwise(pointers))
+		):
+			raise ValueError("indptr must be non-decreasing, from 0 to the number of elements")
+		_check_bounds(self.indices, self.shape[1], "Column")
+
+	@classmethod
+	def _from_arrays(
+		cls, data: Array, indices: Array, indptr: Array, shape: tuple[int, int]
+	) -> CSR:
+		"""
+		Creates a matrix directly from its (valid) arrays, without any check or copy.
+		"""
+		new_matrix = cls.__new__(cls)
+		new_matrix.data, new_matrix.indices, new_matrix.indptr = data, indices, indptr
+		new_matrix.shape = shape
+		return new_matrix
+
+	def _arrays(self) -> tuple[Array]:
+		return self.data, self.indices, self.indptr
+
+	def _with_data(self, data: Array) -> CSR:
+		return self._from_arrays(data, self.indices, self.indptr, self.shape)
+
+	@classmethod
+	def from_dense(cls, array: Array) -> CSR:
+		"""
+		Creates a matrix with the non-zero elements of a 2-dimensional array.
+		"""
+		array = asarray(array)
+		if array.ndim != 2:
+			raise ValueError(f"Sparse matrices are 2-dimensional, got shape {array.shape}")
+		n_rows, n_cols = array.shape
+		flat_values = array.ascontiguousarray()._flat_values()
+		values, indices, indptr = [], [], [0]
+		for start in range(0, n_rows * n_cols, n_cols):
+			row = flat_values[start : start + n_cols]
+			columns = list(compress(range(n_cols), row))
+			indices += columns
+			values += map(row.__getitem__, columns)
+			indptr.append(len(indices))
+
+		index_dtype = _index_dtype(array.shape)
+		return cls._from_arrays(
+			_from_values(values, array.dtype),
+			_from_values(indices, index_dtype),
+			_from_values(indptr, index_dtype),
+			array.shape,
+		)
+
+	def _row_ranges(self):
+		"""
+		Returns an iterable over the (start, stop) ranges of the elements of each row.
+		"""
+		return pairwise(self.indptr._flat_values())
+
+	def to_dense(self) -> Array:
+		"""
+		Returns the matrix as a dense array.
+		"""
+		dense = Array.array_from_shape(self.shape, self.dtype)
+		n_cols = self.shape[1]
+		indices, values = self.indices._flat_values(), self.data._flat_values()
+		for row, (start, stop) in enumerate(self._row_ranges()):
+			for idx in range(start, stop):
+				dense.data[row * n_cols + indices[idx]] = values[idx]
+		return dense
+
+	def tocoo(self) -> COO:
+		"""
+		Returns the matrix in COO format, sharing its stored elements and column indices.
+		"""
+		rows = chain.from_iterable(
+			repeat(row, stop - start) for row, (start, stop) in enumerate(self._row_ranges())
+		)
+		return COO._from_arrays(
+			self.data, _from_values(rows, self.indices.dtype), self.indices, self.shape
+		)
+
+	def tocsr(self) -> CSR:
+		return self
+
+	def transpose(self) -> CSR:
+		"""
+		Returns the transpose of the matrix, in CSR format.
+		"""
+		return self.tocoo().transpose().tocsr()
+
+	def dot(self, operand: Array) -> Array:
+		"""
+		Product of the matrix with a dense vector (of shape (m,), giving one of shape (n,)) or
+		matrix (of shape (m, k), giving one of shape (n, k)).
+
+		Each element of the result only touches the stored elements of its row.
+		"""
+		operand = asarray(operand)
+		if operand.ndim not in (1, 2) or operand.shape[0] != self.shape[1]:
+			raise ValueError(
+				f"Mismatch in core dimension for product of shapes {self.shape} and {operand.shape}"
+			)
+		resulting_dtype = dtypes.result_type(self.dtype, operand.dtype)
+		if resulting_dtype is bool_:
+			resulting_dtype = int64
+
+		indices, values = self.indices._flat_values(), self.data._flat_values()
+		# columns of the operand, as sequences indexed by the column indices of the elements
+		if operand.ndim == 1:
+			columns = [list(operand._flat_values())]
+		else:
+			columns = [list(column._flat_values()) for column in operand.T]
+		results = [
+			sumprod(values[start:stop], map(column.__getitem__, indices[start:stop]))
+			for start, stop in self._row_ranges()
+			for column in columns
+		]
+		new_shape = self.shape[:1] + operand.shape[1:]
+		data = Array._make_buffer(resulting_dtype, results)
+		return Array._from_data(data, new_shape, resulting_dtype)
+
+	def sum(self, axis: int | None = None) -> Array | int | float:
+		"""
+		Sum of the elements along the given axis (as a 1-dimensional array), or of all of them if
+		axis is None.
+		"""
+		values = self.data._flat_values()
+		if axis is None:
+			return sum(values)
+		(axis,) = Array._normalize_axes(axis, 2)
+		if axis == 1:
+			totals = [sum(values[start:stop]) for start, stop in self._row_ranges()]
+		else:
+			totals = [0] * self.shape[1]
+			for idx, value in zip(self.indices._flat_values(), values):
+				totals[idx] += value
+		return self._sums(totals)
+
+
+def eye(n: int, dtype: DType | type | str = int) -> CSR:
+	"""
+	Returns the sparse (n, n) identity matrix, storing only its n ones.
+	"""
+	dtype = dtypes.dtype(dtype)
+	index_dtype = _index_dtype((n, n))
+	return CSR._from_arrays(
+		_from_values(repeat(1, n), dtype),
+		_from_values(range(n), index_dtype),
+		_from_values(range(n + 1), index_dtype),
+		(n, n),
+	)
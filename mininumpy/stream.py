@@ -0,0 +1,266 @@
+# File with the streaming API, which processes arrays too large for memory in chunks of rows.
+from __future__ import annotations  # for typehinting the Stream class within itself
+
+import os
+from itertools import chain, islice
+from math import prod
+
+from .array import Array
+from .dtypes import result_type
+from .npyio import load
+from .ufunc import (
+	Ufunc,
+	absolute,
+	add,
+	divide,
+	exp,
+	log,
+	maximum,
+	minimum,
+	multiply,
+	power,
+	sqrt,
+	subtract,
+)
+
+# default number of rows (along the first axis) of each chunk
+DEFAULT_CHUNK_ROWS = 1024
+
+# how to combine the partial results of the reductions of consecutive chunks
+_COMBINERS = {"sum": add, "mean": add, "max": maximum, "min": minimum}
+
+
+def _array_chunks(array: Array, chunk_rows: int):
+	"""
+	Yields consecutive views of up to chunk_rows rows of array. Arrays without rows are yielded as
+	a single (empty) chunk.
+	"""
+	if array.ndim == 0:
+		raise ValueError("Cannot stream the rows of a 0-dimensional array")
+	if array.shape[0] == 0:
+		yield array
+		return
+	for start in range(0, array.shape[0], chunk_rows):
+		yield array[start : start + chunk_rows]
+
+
+def _stack_rows(rows: list[Array | list | int | float]) -> Array:
+	"""
+	Creates a chunk from a list of rows, each being an array, a (nested) list or a number.
+
+	If rows have different dtypes, they are promoted to a common one (see dtypes.result_type).
+	"""
+	rows = [row if isinstance(row, Array) else Array(row) for row in rows]
+	row_shape = rows[0].shape
+	if any(row.shape != row_shape for row in rows):
+		raise ValueError("Inconsistent shape between rows of the stream")
+	dtype = result_type(*(row.dtype for row in rows))
+	values = chain.from_iterable(row._flat_values() for row in rows)
+	shape = (len(rows), *row_shape)
+	return Array._from_data(Array._fill_buffer(dtype, prod(shape), values), shape, dtype)
+
+
+def _source_chunks(source, chunk_rows: int):
+	"""
+	Yields the chunks of a stream's source.
+
+	Paths and binary files (in .npy format) are memory-mapped, so only the pages of the rows being
+	processed are read from disk. Other iterables are consumed row by row.
+	"""
+	if isinstance(source, (str, os.PathLike)) or hasattr(source, "fileno"):
+		source = load(source, mmap_mode="r")
+	if isinstance(source, Array):
+		yield from _array_chunks(source, chunk_rows)
+		return
+	rows = iter(source)
+	while batch := list(islice(rows, chunk_rows)):
+		yield _stack_rows(batch)
+
+
+class Stream:
+	"""
+	Lazily evaluated sequence of chunks of rows, read from a source which may not fit in memory.
+
+	Elementwise operations (operators, exp, log, sqrt, abs and map) are applied chunk by chunk
+	when the stream is consumed, and reductions whose axes include the first one (sum, mean, max
+	and min) fold the results of every chunk, so only one chunk is held in memory at a time.
+
+	Streams over generators can only be consumed once.
+	"""
+
+	chunk_rows: int
+
+	def __init__(self, source, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+		"""
+		Creates a stream reading chunks of chunk_rows rows from source, which can be a path to (or
+		a binary file in) .npy format, an array, or an iterable of rows (arrays, lists or numbers).
+		"""
+		if chunk_rows <= 0:
+			raise RuntimeError("Invalid value ( <=0 ) for chunk_rows")
+		self.chunk_rows = chunk_rows
+		self._chunks = lambda: _source_chunks(source, chunk_rows)
+
+	@classmethod
+	def _derived(cls, chunk_rows: int, chunks) -> Stream:
+		"""
+		Creates a stream whose chunks are produced by calling chunks.
+		"""
+		new_stream = cls.__new__(cls)
+		new_stream.chunk_rows = chunk_rows
+		new_stream._chunks = chunks
+		return new_stream
+
+	def __iter__(self):
+		"""
+		Iterates over the (evaluated) chunks of the stream.
+		"""
+		return self._chunks()
+
+	# elementwise operations
+	def map(self, function) -> Stream:
+		"""
+		Lazily applies function (from array to array) to every chunk of the stream.
+		"""
+		return self._derived(self.chunk_rows, lambda: map(function, self._chunks()))
+
+	def _binary(self, ufunc: Ufunc, left_operand, right_operand) -> Stream:
+		"""
+		Lazily applies binary ufunc between the chunks of both operands.
+
+		Streams are combined chunk by chunk, while arrays and scalars are broadcasted against
+		every chunk.
+		"""
+
+		def chunks():
+			operands = [
+				operand._chunks() if isinstance(operand, Stream) else None
+				for operand in (left_operand, right_operand)
+			]
+			if operands[0] is not None and operands[1] is not None:
+				pairs = zip(*operands, strict=True)
+			elif operands[0] is not None:
+				pairs = ((chunk, right_operand) for chunk in operands[0])
+			else:
+				pairs = ((left_operand, chunk) for chunk in operands[1])
+			for left, right in pairs:
+				yield ufunc(left, right)
+
+		return self._derived(self.chunk_rows, chunks)
+
+	def __add__(self, right_operand: Stream | Array | int | float) -> Stream:
+		return self._binary(add, self, right_operand)
+
+	def __radd__(self, left_operand: Array | int | float) -> Stream:
+		return self._binary(add, left_operand, self)
+
+	def __sub__(self, right_operand: Stream | Array | int | float) -> Stream:
+		return self._binary(subtract, self, right_operand)
+
+	def __rsub__(self, left_operand: Array | int | float) -> Stream:
+		return self._binary(subtract, left_operand, self)
+
+	def __mul__(self, right_operand: Stream | Array | int | float) -> Stream:
+		return self._binary(multiply, self, right_operand)
+
+	def __rmul__(self, left_operand: Array | int | float) -> Stream:
+		return self._binary(multiply, left_operand, self)
+
+	def __truediv__(self, right_operand: Stream | Array | int | float) -> Stream:
+		return self._binary(divide, self, right_operand)
+
+	def __rtruediv__(self, left_operand: Array | int | float) -> Stream:
+		return self._binary(divide, left_operand, self)
+
+	def __pow__(self, right_operand: Stream | Array | int | float) -> Stream:
+		return self._binary(power, self, right_operand)
+
+	def __rpow__(self, left_operand: Array | int | float) -> Stream:
+		return self._binary(power, left_operand, self)
+
+	def exp(self) -> Stream:
+		return self.map(exp)
+
+	def log(self) -> Stream:
+		return self.map(log)
+
+	def sqrt(self) -> Stream:
+		return self.map(sqrt)
+
+	def abs(self) -> Stream:
+		return self.map(absolute)
+
+	# reductions
+	def _fold(
+		self,
+		name: str,
+		axis: int | tuple[int] | None,
+		keepdims: bool,
+	) -> Array | int | float:
+		"""
+		Computes reduction name of every chunk, and combines the partial results as they come.
+		"""
+		combiner = _COMBINERS[name]
+		result = None
+		total_size = 0
+		for chunk in self._chunks():
+			if 0 not in Array._normalize_axes(axis, chunk.ndim):
+				raise ValueError("Streams can only be reduced along axes including the first one")
+			partial_result = getattr(chunk, "sum" if name == "mean" else name)(axis, keepdims)
+			total_size += chunk.size
+			if result is None:
+				result = partial_result
+			elif not isinstance(result, Array):
+				result = combiner(result, partial_result)
+			else:
+				# accumulate in place, unless the result gets promoted to another dtype
+				in_place = combiner._dtype_rule(result.dtype, partial_result.dtype) is result.dtype
+				result = combiner(result, partial_result, out=result if in_place else None)
+		if result is None:
+			raise ValueError(f"Cannot compute {name} of an empty stream")
+
+		if name == "mean":
+			count = total_size // (result.size if isinstance(result, Array) else 1)
+			return result / (count if count else float("nan"))
+		return result
+
+	def sum(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Sum of the elements along the given axes (which must include the first one), or of all of
+		them if axis is None.
+		"""
+		return self._fold("sum", axis, keepdims)
+
+	def mean(self, axis: int | tuple[int] | None = None, keepdims: bool = False) -> Array | float:
+		"""
+		Mean of the elements along the given axes (which must include the first one), or of all
+		of them if axis is None.
+		"""
+		return self._fold("mean", axis, keepdims)
+
+	def max(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Maximum of the elements along the given axes (which must include the first one), or of
+		all of them if axis is None.
+		"""
+		return self._fold("max", axis, keepdims)
+
+	def min(
+		self, axis: int | tuple[int] | None = None, keepdims: bool = False
+	) -> Array | int | float:
+		"""
+		Minimum of the elements along the given axes (which must include the first one), or of
+		all of them if axis is None.
+		"""
+		return self._fold("min", axis, keepdims)
+
+
+def stream(source, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Stream:
+	"""
+	Returns a stream over the rows of source (a .npy file, an array or an iterable of rows),
+	processed in chunks of chunk_rows rows.
+	"""
+	return Stream(source, chunk_rows)
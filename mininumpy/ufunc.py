@@ -0,0 +1,302 @@
+# File with the universal functions (ufuncs), elementwise kernels with broadcasting and reductions.
+from __future__ import annotations  # for typehinting the Ufunc class within itself
+
+import builtins
+import math
+import operator
+from functools import reduce
+from itertools import accumulate, chain, compress, repeat
+
+from .array import Array, _instrumented
+from .dtypes import DType, bool_, float64, int64, result_type
+from .lazy import LazyArray
+
+
+# rules giving the dtype of the result of a ufunc from the dtypes of its operands (see
+# dtypes.result_type). Arithmetic on bools gives ints, same as in Python.
+def _arithmetic_dtype(*dtypes: DType | type) -> DType:
+	resulting_dtype = result_type(*dtypes)
+	return int64 if resulting_dtype is bool_ else resulting_dtype
+
+
+def _float_dtype(*dtypes: DType | type) -> DType:
+	resulting_dtype = result_type(*dtypes)
+	return resulting_dtype if resulting_dtype.kind == "f" else float64
+
+
+def _bool_dtype(*dtypes: DType | type) -> DType:
+	return bool_
+
+
+def _same_dtype(dtype: DType | type) -> DType:
+	return _arithmetic_dtype(dtype)
+
+
+# fast folds (of values, starting from start) for the reductions of some ufuncs
+def _sum(values, start: int | float) -> int | float:
+	return sum(values, start)
+
+
+def _prod(values, start: int | float) -> int | float:
+	return math.prod(values, start=start)
+
+
+def _max(values, start: int | float) -> int | float:
+	return builtins.max(start, builtins.max(values, default=start))
+
+
+def _min(values, start: int | float) -> int | float:
+	return builtins.min(start, builtins.min(values, default=start))
+
+
+class Ufunc:
+	"""
+	Universal function, applying a scalar kernel elementwise over arrays and scalars.
+
+	A kernel registered as a ufunc gets broadcasting of its operands, dtype promotion, out= and
+	where= arguments, and (for binary kernels) reduce, accumulate and outer.
+	"""
+
+	__name__: str
+	nin: int
+	identity: int | float | None
+
+	def __init__(
+		self,
+		name: str,
+		kernel,
+		nin: int,
+		dtype_rule,
+		doc: str,
+		identity: int | float | None = None,
+		fold=None,
+	):
+		"""
+		Creates the ufunc name applying kernel (a picklable function of nin scalars, so it can
+		be sent to worker processes) elementwise, with results of the dtype given by dtype_rule
+		from the dtypes of the operands.
+
+		Reductions start from identity (if any), and use fold (a function of the values and the
+		starting value) instead of calling the kernel for every element, if given.
+		"""
+		self.__name__ = name
+		self.__doc__ = doc
+		self.kernel = kernel
+		self.nin = nin
+		self.identity = identity
+		self._dtype_rule = dtype_rule
+		self._fold = fold
+		Array._ufuncs[name] = self
+
+	def __repr__(self) -> str:
+		return f"<ufunc '{self.__name__}'>"
+
+	@staticmethod
+	def _as_operand(operand: Array | list | int | float) -> Array | int | float:
+		"""
+		Returns operand as a valid operand of a ufunc, converting lists into arrays.
+		"""
+		if isinstance(operand, list):
+			return Array(operand)
+		Array._sanitize_operand(operand)
+		return operand
+
+	@staticmethod
+	def _values(operand: Array | int | float, shape: tuple[int]):
+		"""
+		Returns an iterable over the values of operand broadcasted into shape, in C order.
+		"""
+		if isinstance(operand, Array):
+			return operand._broadcast_values(shape)
+		return repeat(operand, math.prod(shape))
+
+	@_instrumented(lambda self, *args, **kwargs: self.__name__)
+	def __call__(
+		self,
+		*operands: Array | list | int | float,
+		out: Array | None = None,
+		where: Array | list | bool = True,
+	) -> Array | int | float:
+		"""
+		Applies the kernel elementwise over the operands, broadcasted together.
+
+		The result is written into out if given, or into a new array otherwise. If where is given
+		(a boolean mask broadcastable to the result), only the elements where it is True are
+		computed, the rest keep the values of out (or are zero in a new array).
+		"""
+		if len(operands) != self.nin:
+			raise ValueError(f"{self} takes {self.nin} operands, but {len(operands)} were given")
+		if any(isinstance(operand, LazyArray) for operand in operands):
+			if where is not True:
+				raise ValueError("where= is not supported for lazy arrays")
+			return LazyArray._from_ufunc(self, operands, out)
+		operands = tuple(self._as_operand(operand) for operand in operands)
+		resulting_dtype = self._dtype_rule(*map(Array._dtype_of, operands))
+		shape = ()
+		for operand in operands:
+			shape = Array._broadcast_shapes(shape, Array._shape_of(operand))
+
+		backend = Array._parallel_backend
+		if out is None and where is True:
+			if not any(isinstance(operand, Array) for operand in operands):
+				return self.kernel(*operands)
+			if backend is not None and math.prod(shape) >= backend.threshold:
+				return backend.elementwise(self.kernel, operands, shape, resulting_dtype)
+			values = (self._values(operand, shape) for operand in operands)
+			data = Array._fill_buffer(resulting_dtype, math.prod(shape), map(self.kernel, *values))
+			return Array._from_data(data, shape, resulting_dtype)
+
+		if where is not True:
+			where = self._as_operand(where)
+			if result_type(Array._dtype_of(where)) is not bool_:
+				dtype = result_type(Array._dtype_of(where))
+				raise ValueError(f"where= must be a boolean mask, not of dtype {dtype}")
+		if out is None:
+			out_shape = Array._broadcast_shapes(shape, Array._shape_of(where))
+			out = Array.array_from_shape(out_shape, resulting_dtype)
+		out._check_out(shape, resulting_dtype)
+		if where is True and backend is not None and out.size >= backend.threshold:
+			return backend.elementwise(self.kernel, operands, out.shape, resulting_dtype, out)
+
+		operands = tuple(out._prepare_operand_for_out(operand, out) for operand in operands)
+		values = [self._values(operand, out.shape) for operand in operands]
+		if where is True:
+			out._assign_values(map(self.kernel, *values))
+			return out
+
+		out._check_out(Array._shape_of(where), bool_)
+		mask = list(self._values(where, out.shape))
+		results = map(self.kernel, *(compress(operand_values, mask) for operand_values in values))
+		out._assign_values(
+			next(results) if selected else previous
+			for selected, previous in zip(mask, out._flat_values())
+		)
+		return out
+
+	# methods of binary ufuncs
+	def _check_binary(self, method: str) -> None:
+		if self.nin != 2:
+			raise ValueError(f"{method} is only supported for binary ufuncs, not {self}")
+
+	@_instrumented(lambda self, *args, **kwargs: f"{self.__name__}.reduce")
+	def reduce(
+		self,
+		array: Array | list,
+		axis: int | tuple[int] | None = 0,
+		keepdims: bool = False,
+		initial: int | float | None = None,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Reduces array along the given axes (all of them if axis is None) by repeatedly applying
+		the ufunc, starting from initial (or the ufunc's identity) if given.
+		"""
+		self._check_binary("reduce")
+		array = self._as_operand(array)
+		if not isinstance(array, Array):
+			raise ValueError(f"Cannot reduce operand of type {type(array)}")
+		start = self.identity if initial is None else initial
+		no_value = object()
+
+		def kernel(values):
+			values = iter(values)
+			first = start if start is not None else next(values, no_value)
+			if first is no_value:
+				raise ValueError(
+					f"Zero-size array to reduction operation {self.__name__} has no identity"
+				)
+			if self._fold is not None:
+				return self._fold(values, first)
+			return reduce(self.kernel, values, first)
+
+		resulting_dtype = self._dtype_rule(array.dtype, array.dtype)
+		return array._reduce(kernel, axis, keepdims, resulting_dtype, out)
+
+	@_instrumented(lambda self, *args, **kwargs: f"{self.__name__}.accumulate")
+	def accumulate(self, array: Array | list, axis: int = 0, out: Array | None = None) -> Array:
+		"""
+		Accumulates the results of applying the ufunc along the given axis, so each element of
+		the result is the reduction of all the elements up to it.
+		"""
+		self._check_binary("accumulate")
+		array = self._as_operand(array)
+		if not isinstance(array, Array) or array.ndim == 0:
+			raise ValueError("Cannot accumulate a 0-dimensional operand")
+		(axis,) = Array._normalize_axes(axis, array.ndim)
+		resulting_dtype = self._dtype_rule(array.dtype, array.dtype)
+		if out is None:
+			out = Array.array_from_shape(array.shape, resulting_dtype)
+		elif out.shape != array.shape:
+			raise ValueError(
+				f"Output array of shape {out.shape} does not match the input's shape {array.shape}"
+			)
+		out._check_out(array.shape, resulting_dtype)
+		array = out._prepare_operand_for_out(array, out)
+
+		# walk both arrays with the accumulated axis innermost
+		order = tuple(ax for ax in range(array.ndim) if ax != axis) + (axis,)
+		source = array.transpose(order)
+		*outer_shape, length = source.shape
+		*outer_strides, stride = source.strides
+		rows = (
+			Array._strided_row(source.data, start, length, stride)
+			for start in Array._strided_offsets(outer_shape, outer_strides, source.offset)
+		)
+		out.transpose(order)._assign_values(
+			chain.from_iterable(accumulate(row, self.kernel) for row in rows)
+		)
+		return out
+
+	@_instrumented(lambda self, *args, **kwargs: f"{self.__name__}.outer")
+	def outer(
+		self,
+		operand1: Array | list | int | float,
+		operand2: Array | list | int | float,
+		out: Array | None = None,
+	) -> Array | int | float:
+		"""
+		Applies the ufunc to every pair of elements of both operands, into a result of shape
+		operand1.shape + operand2.shape.
+		"""
+		self._check_binary("outer")
+		operand1 = self._as_operand(operand1)
+		operand2 = self._as_operand(operand2)
+		if isinstance(operand1, Array):
+			# trailing axes of length 1 (stride 0), to broadcast against operand2
+			extra_dims = len(Array._shape_of(operand2))
+			operand1 = operand1._view(
+				operand1.shape + (1,) * extra_dims,
+				operand1.strides + (0,) * extra_dims,
+				operand1.offset,
+			)
+		return self(operand1, operand2, out=out)
+
+
+add = Ufunc("add", operator.add, 2, _arithmetic_dtype, "Elementwise x1 + x2.", 0, _sum)
+subtract = Ufunc("subtract", operator.sub, 2, _arithmetic_dtype, "Elementwise x1 - x2.")
+multiply = Ufunc("multiply", operator.mul, 2, _arithmetic_dtype, "Elementwise x1 * x2.", 1, _prod)
+divide = Ufunc("divide", operator.truediv, 2, _float_dtype, "Elementwise x1 / x2.")
+floor_divide = Ufunc(
+	"floor_divide", operator.floordiv, 2, _arithmetic_dtype, "Elementwise x1 // x2."
+)
+remainder = Ufunc("remainder", operator.mod, 2, _arithmetic_dtype, "Elementwise x1 % x2.")
+power = Ufunc("power", pow, 2, _arithmetic_dtype, "Elementwise x1 ** x2.")
+maximum = Ufunc("maximum", builtins.max, 2, _arithmetic_dtype, "Elementwise maximum.", fold=_max)
+minimum = Ufunc("minimum", builtins.min, 2, _arithmetic_dtype, "Elementwise minimum.", fold=_min)
+
+less = Ufunc("less", operator.lt, 2, _bool_dtype, "Elementwise x1 < x2.")
+less_equal = Ufunc("less_equal", operator.le, 2, _bool_dtype, "Elementwise x1 <= x2.")
+greater = Ufunc("greater", operator.gt, 2, _bool_dtype, "Elementwise x1 > x2.")
+greater_equal = Ufunc("greater_equal", operator.ge, 2, _bool_dtype, "Elementwise x1 >= x2.")
+equal = Ufunc("equal", operator.eq, 2, _bool_dtype, "Elementwise x1 == x2.")
+not_equal = Ufunc("not_equal", operator.ne, 2, _bool_dtype, "Elementwise x1 != x2.")
+
+exp = Ufunc("exp", math.exp, 1, _float_dtype, "Elementwise e^x.")
+log = Ufunc("log", math.log, 1, _float_dtype, "Elementwise natural logarithm of x.")
+sqrt = Ufunc("sqrt", math.sqrt, 1, _float_dtype, "Elementwise square root of x.")
+absolute = Ufunc("absolute", builtins.abs, 1, _same_dtype, "Elementwise absolute value of x.")
+negative = Ufunc("negative", operator.neg, 1, _same_dtype, "Elementwise -x.")
+
+# aliases, same as in numpy
+true_divide = divide
+abs = absolute
@@ -0,0 +1,67 @@
+# test stacking arrays into batches, and running functions over them with vmap
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+lst_2d = [[1, 2, 3], [4, 5, 6]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert mnp_array.shape == np_array.shape
+	assert mnp_array.copy().data.tolist() == np_array.flatten().tolist()
+
+
+def test_stack():
+	items = [mnp.array(lst_2d), mnp.array(lst_2d) / 2, mnp.array(lst_2d).T.T]
+	np_items = [np.array(lst_2d), np.array(lst_2d) / 2, np.array(lst_2d)]
+	for axis in (0, 1, 2, -1):
+		_check_equality(mnp.stack(items, axis), np.stack(np_items, axis))
+	_check_equality(mnp.stack([1, 2.5, True]), np.stack([1, 2.5, True]))
+	_check_equality(mnp.stack([lst_2d, mnp.array(lst_2d)]), np.stack([lst_2d, lst_2d]))
+
+	stacked = mnp.stack(items)
+	for item, unstacked in zip(items, mnp.unstack(stacked)):
+		assert unstacked._shares_buffer(stacked) and (unstacked == item).all()
+	for idx, column in enumerate(mnp.unstack(stacked, axis=-1)):
+		_check_equality(column, np.stack(np_items)[..., idx])
+
+	for invalid in ([], [mnp.array([1, 2]), mnp.array([1, 2, 3])]):
+		try:
+			mnp.stack(invalid)
+			raise AssertionError(f"stacking {invalid} should fail")
+		except ValueError:
+			pass
+
+
+def test_vmap():
+	def center(x, w):
+		return (x - x.mean(axis=-1, keepdims=True)) * w
+
+	rows = [mnp.array(row) for row in lst_2d * 5]
+	weights = mnp.array([1, 2, 3])
+	batched_center = mnp.vmap(center, in_axes=(0, None))
+	for result, row in zip(batched_center(rows, weights), rows):
+		assert (result == center(row, weights)).all()
+
+	# arrays are batched along in_axes, and give batched results
+	matrix = mnp.array(lst_2d)
+	np_matrix = np.array(lst_2d)
+	np_centered = (np_matrix - np_matrix.mean(axis=-1, keepdims=True)) * [1, 2, 3]
+	_check_equality(batched_center(matrix, weights), np_centered)
+	column_center = mnp.vmap(lambda x: x - x.mean(axis=-1, keepdims=True), in_axes=1)
+	_check_equality(column_center(matrix), (np_matrix - np_matrix.mean(axis=0)).T)
+
+	# items of lower dimension than unbatched arguments, and tuples of results
+	scaled, shifted = zip(
+		*mnp.vmap(lambda x, w: (x * w, x + w), in_axes=(0, None))([1, 2], weights)
+	)
+	_check_equality(scaled[1], np.array([2, 4, 6]))
+	_check_equality(shifted[0], np.array([2, 3, 4]))
+
+	try:
+		mnp.vmap(lambda x: x.sum())(rows)
+		raise AssertionError("results without the batch axis should fail")
+	except ValueError:
+		pass
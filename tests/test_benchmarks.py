@@ -0,0 +1,61 @@
+# test the comparison of benchmark results against a baseline
+import json
+
+from benchmarks.runner import MEMORY_NOISE, compare, main
+
+
+def _result(time: float, peak_memory: int) -> dict:
+	return {"name": "elementwise.add", "size": 1000, "time": time, "peak_memory": peak_memory}
+
+
+def test_compare():
+	baseline = {"a[10]": _result(1.0, 100_000), "b[10]": _result(1.0, 100)}
+
+	# within the threshold, or without a baseline, nothing is flagged
+	results = {"a[10]": _result(1.4, 140_000), "c[10]": _result(9.0, 10**9)}
+	assert compare(results, baseline, 1.5) == {}
+	assert results["a[10]"]["baseline_ratio"] == 1.4
+	assert results["a[10]"]["memory_ratio"] == 1.4
+	assert "baseline_ratio" not in results["c[10]"]
+
+	# slowdowns and peak memory growths past the threshold are flagged separately
+	results = {"a[10]": _result(2.0, 100_000), "b[10]": _result(1.0, 100 + 2 * MEMORY_NOISE)}
+	regressions = compare(results, baseline, 1.5)
+	assert regressions == {"a[10]": ["time 2x"], "b[10]": ["peak memory 21.5x"]}
+
+	# unless the growth in bytes is within the noise of small allocations
+	results = {"b[10]": _result(1.0, 100 + MEMORY_NOISE)}
+	assert compare(results, baseline, 1.5) == {}
+
+	# baselines without peak memory only compare times
+	assert compare({"a[10]": _result(3.0, 10**9)}, {"a[10]": {"time": 1.0}}, 1.5) == {
+		"a[10]": ["time 3x"]
+	}
+
+
+def test_baseline_file(tmp_path, capsys):
+	path = tmp_path / "baseline.json"
+	args = ["elementwise.add", "--sizes", "1e4", "--min-time", "0", "--repeat", "1", "--no-numpy"]
+	args += ["--baseline", str(path)]
+
+	# a run against its own saved baseline passes
+	assert main(args + ["--save-baseline"]) == 0
+	baseline = json.loads(path.read_text())
+	assert set(baseline) == {"elementwise.add[10000]"}
+	assert baseline["elementwise.add[10000]"]["peak_memory"] > MEMORY_NOISE
+	baseline["elementwise.add[10000]"]["time"] *= 1000
+	path.write_text(json.dumps(baseline))
+	assert main(args) == 0
+
+	# a faster baseline is a time regression
+	baseline["elementwise.add[10000]"]["time"] /= 10**6
+	path.write_text(json.dumps(baseline))
+	assert main(args) == 1
+	assert "time" in capsys.readouterr().err
+
+	# a smaller peak memory in the baseline is a memory regression
+	baseline["elementwise.add[10000]"].update(time=1000.0, peak_memory=0)
+	path.write_text(json.dumps(baseline))
+	assert main(args) == 1
+	err = capsys.readouterr().err
+	assert "peak memory" in err and "time" not in err
@@ -0,0 +1,75 @@
+# test dtypes, their promotion rules and casts against numpy
+import pickle
+
+import numpy as np
+
+import mininumpy as mnp
+
+_NAMES = [
+	"bool",
+	"int8",
+	"int16",
+	"int32",
+	"int64",
+	"uint8",
+	"uint16",
+	"uint32",
+	"uint64",
+	"float32",
+	"float64",
+]
+
+
+def _values(array: mnp.Array) -> list:
+	return array.copy().data.tolist()
+
+
+def test_dtypes():
+	for name in _NAMES:
+		dtype = mnp.dtype(name)
+		assert dtype == name and dtype.itemsize == np.dtype(name).itemsize
+		assert mnp.zeros(3, dtype).data.nbytes == np.zeros(3, name).nbytes
+		assert pickle.loads(pickle.dumps(dtype)) is dtype
+	assert mnp.dtype(int) is mnp.int64 and mnp.dtype(np.float32) is mnp.float32
+	assert mnp.array([True]).dtype == bool and mnp.array([1.5]).dtype == float
+
+	# promotion, with python scalars being weak
+	for name1 in _NAMES:
+		for name2 in _NAMES:
+			assert mnp.promote_types(name1, name2) == np.promote_types(name1, name2).name
+			mnp_array = mnp.ones(2, name1) + mnp.ones(2, name2)
+			if "bool" not in (name1, name2):
+				np_array = np.ones(2, name1) + np.ones(2, name2)
+				assert mnp_array.dtype == np_array.dtype.name
+	for name in _NAMES[1:]:
+		for scalar in (1, 1.5):
+			np_result = np.ones(2, name) * scalar
+			assert (mnp.ones(2, name) * scalar).dtype == np_result.dtype.name
+		assert (mnp.ones(2, name) / 2).dtype == (np.ones(2, name) / 2).dtype.name
+		assert mnp.ones((2, 3), name).sum(axis=0).dtype == np.ones((2, 3), name).sum(axis=0).dtype
+
+	# integers wrap around the range of their dtype
+	lst = [-200, -129, -1, 0, 127, 128, 300]
+	for name in ["int8", "uint8", "int16", "uint32"]:
+		mnp_array = mnp.array(lst).astype(name)
+		np_array = np.array(lst).astype(name)
+		assert _values(mnp_array) == np_array.tolist()
+		assert _values(mnp_array * 3) == (np_array * 3).tolist()
+	assert _values(mnp.fromiter([2**63], "uint64")) == [2**63]
+
+	# casts
+	floats = mnp.array([[1.5, 0.0], [2.7, 3.0]])
+	for name in _NAMES:
+		np_array = np.array([[1.5, 0.0], [2.7, 3.0]]).astype(name)
+		assert _values(floats.astype(name)) == np_array.flatten().tolist()
+	assert floats.astype(float, copy=False) is floats
+	assert mnp.asarray([1, 2], dtype="float32").dtype == "float32"
+	assert mnp.can_cast(mnp.int8, "int64") and not mnp.can_cast(float, int)
+	ints = mnp.zeros(2, "int16")
+	ints += 70000
+	assert _values(ints) == [4464, 4464]
+	try:
+		ints += 1.5
+		raise AssertionError("floats should not be cast into ints")
+	except ValueError:
+		pass
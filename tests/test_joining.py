@@ -0,0 +1,88 @@
+# test joining, splitting and repeating arrays against numpy
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert mnp_array.shape == np_array.shape
+	assert mnp_array.copy().data.tolist() == np_array.flatten().tolist()
+
+
+def test_join():
+	mnp_array = mnp.arange(0, 24, 1).reshape((2, 3, 4))
+	np_array = np.arange(24).reshape(2, 3, 4)
+	for axis in (0, 1, 2, -1):
+		_check_equality(
+			mnp.concatenate([mnp_array, mnp_array[:, ::-1] / 2, mnp_array], axis),
+			np.concatenate([np_array, np_array[:, ::-1] / 2, np_array], axis),
+		)
+		_check_equality(
+			mnp.stack([mnp_array, mnp_array], axis), np.stack([np_array, np_array], axis)
+		)
+	_check_equality(
+		mnp.concatenate([mnp_array[:, :1], mnp_array, mnp_array[:, :0]], 1),
+		np.concatenate([np_array[:, :1], np_array, np_array[:, :0]], 1),
+	)
+
+	vector = mnp.array([1, 2, 3])
+	np_vector = np.array([1, 2, 3])
+	_check_equality(mnp.vstack([vector, vector * 2]), np.vstack([np_vector, np_vector * 2]))
+	_check_equality(mnp.hstack([vector, vector * 2]), np.hstack([np_vector, np_vector * 2]))
+	_check_equality(mnp.vstack([mnp_array, mnp_array]), np.vstack([np_array, np_array]))
+	_check_equality(mnp.hstack([mnp_array, mnp_array]), np.hstack([np_array, np_array]))
+
+	for invalid in ([], [mnp_array, vector], [mnp_array, mnp_array[:1, :2]]):
+		try:
+			mnp.concatenate(invalid, 2)
+			raise AssertionError(f"concatenating {invalid} should fail")
+		except ValueError:
+			pass
+
+
+def test_split():
+	mnp_array = mnp.arange(0, 24, 1).reshape((2, 3, 4))
+	np_array = np.arange(24).reshape(2, 3, 4)
+	for indices_or_sections in (3, [1, 2], [-1], [3, 1, 5]):
+		mnp_parts = mnp.array_split(mnp_array, indices_or_sections, 2)
+		np_parts = np.array_split(np_array, indices_or_sections, 2)
+		assert len(mnp_parts) == len(np_parts)
+		for mnp_part, np_part in zip(mnp_parts, np_parts):
+			_check_equality(mnp_part, np_part)
+			assert mnp_part._shares_buffer(mnp_array)
+	for mnp_part, np_part in zip(mnp.split(mnp_array, 3, axis=1), np.split(np_array, 3, axis=1)):
+		_check_equality(mnp_part, np_part)
+	try:
+		mnp.split(mnp_array, 5, axis=2)
+		raise AssertionError("uneven splits should fail")
+	except ValueError:
+		pass
+
+
+def test_repeat():
+	mnp_array = mnp.arange(0, 24, 1).reshape((2, 3, 4))
+	np_array = np.arange(24).reshape(2, 3, 4)
+	for reps in (2, (2, 1), (1, 2, 2, 1), (3, 1, 1)):
+		_check_equality(mnp.tile(mnp_array, reps), np.tile(np_array, reps))
+	_check_equality(mnp.tile(mnp.array([1, 2]), (2, 2)), np.tile([1, 2], (2, 2)))
+	for repeats, axis in ((2, None), (2, 0), (3, 2), (3, -1), (0, 1), ([1, 0, 2], 1)):
+		_check_equality(
+			mnp.repeat(mnp_array[:, ::-1], repeats, axis),
+			np.repeat(np_array[:, ::-1], repeats, axis),
+		)
+
+	# broadcasted views are read-only
+	broadcasted = mnp.broadcast_to(mnp.array([1, 2, 3]), (2, 3))
+	_check_equality(broadcasted, np.broadcast_to([1, 2, 3], (2, 3)))
+	try:
+		broadcasted[0, 0] = 5
+		raise AssertionError("broadcasted views should be read-only")
+	except TypeError:
+		pass
+	try:
+		mnp.broadcast_to(mnp.array([1, 2, 3]), (3, 2))
+		raise AssertionError("incompatible shapes should fail")
+	except ValueError:
+		pass
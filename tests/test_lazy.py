@@ -0,0 +1,83 @@
+# test lazy expressions against their eager evaluation and numpy
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+lst_2d = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+lst_1d = [1.0, -2.0, 0.5]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert np.allclose(mnp_array.copy().data.tolist(), np_array.flatten().tolist())
+
+
+def test_fused_expression():
+	a_mnp, b_mnp = mnp.array(lst_2d), mnp.array(lst_1d)
+	a_np, b_np = np.array(lst_2d), np.array(lst_1d)
+
+	expression = mnp.sqrt(a_mnp.lazy() * a_mnp + b_mnp * 2 + 4)
+	assert expression.shape == (2, 3)
+	_check_equality(expression.compute(), np.sqrt(a_np * a_np + b_np * 2 + 4))
+	_check_equality(mnp.exp(1 / a_mnp.T.lazy()).compute(), np.exp(1 / a_np.T))
+
+
+def test_fused_reduction():
+	a_mnp, b_mnp = mnp.array(lst_2d), mnp.array(lst_1d)
+	a_np, b_np = np.array(lst_2d), np.array(lst_1d)
+
+	expression = (a_mnp.lazy() - b_mnp) ** 2
+	assert np.isclose(expression.sum(), ((a_np - b_np) ** 2).sum())
+	_check_equality(expression.sum(axis=0), ((a_np - b_np) ** 2).sum(axis=0))
+	_check_equality(expression.max(axis=-1), ((a_np - b_np) ** 2).max(axis=-1))
+	_check_equality(
+		expression.mean(axis=1, keepdims=True), ((a_np - b_np) ** 2).mean(axis=1, keepdims=True)
+	)
+
+
+def test_dtypes():
+	# lazy nodes resolve their dtypes the same way as the eager ufuncs
+	for dtype in (mnp.float32, mnp.float64, mnp.int8, mnp.int64, mnp.bool_):
+		array = mnp.array([[1, 2, 0], [1, 0, 1]]).astype(dtype)
+		lazy = array.lazy()
+		for lazy_result, eager_result in (
+			(lazy.exp(), mnp.exp(array)),
+			(lazy.sqrt(), mnp.sqrt(array)),
+			((lazy + 1).log(), mnp.log(array + 1)),
+			(lazy / 2, array / 2),
+			(2 / (lazy + 1), 2 / (array + 1)),
+			(lazy.abs(), abs(array)),
+			(lazy * array, array * array),
+			(lazy.maximum(1), mnp.maximum(array, 1)),
+		):
+			assert lazy_result.dtype == eager_result.dtype
+			assert lazy_result.compute().dtype == eager_result.dtype
+
+
+def test_narrow_dtypes():
+	# intermediate values are converted into their node's dtype, same as eager results
+	for dtype in ("int8", "int16", "uint8", "float32"):
+		np_array = np.array([[100, 100], [-3, 7]]).astype(dtype)
+		array = mnp.array(np_array.tolist()).astype(dtype)
+		lazy = array.lazy()
+		with np.errstate(over="ignore"):
+			for lazy_result, eager_result, np_result in (
+				(lazy + array, array + array, np_array + np_array),
+				((lazy * array) / 2, (array * array) / 2, (np_array * np_array) / 2),
+				((lazy * 3 - array).maximum(0), mnp.maximum(array * 3 - array, 0), None),
+			):
+				values = lazy_result.compute().data.tolist()
+				assert values == eager_result.copy().data.tolist()
+				if np_result is not None:
+					_check_equality(lazy_result.compute(), np_result)
+			assert (lazy + array).sum() == (array + array).sum() == (np_array + np_array).sum()
+			assert (lazy * array).max(axis=0).copy().data.tolist() == (
+				(np_array * np_array).max(axis=0).tolist()
+			)
+
+	# float32 intermediates are rounded (or overflow) before the next operation
+	array = mnp.array([0.1, 3e19, 1e20]).astype(mnp.float32)
+	lazy_result = (array.lazy() * array / 3 * 1e-10).compute()
+	assert lazy_result.data.tolist() == (array * array / 3 * 1e-10).data.tolist()
+	assert lazy_result.data.tolist()[2] == np.inf
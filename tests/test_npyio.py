@@ -0,0 +1,50 @@
+# test binary save/load against numpy's .npy files
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+lst_3d = [[[1, 2], [3, 4], [5, 6]], [[7, 8], [9, 10], [11, 12]]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert mnp_array.shape == np_array.shape
+	assert mnp_array.copy().data.tolist() == np_array.flatten().tolist()
+
+
+def test_save_load(tmp_path):
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+
+	# round trip, and files readable by numpy
+	for mnp_array, np_array in [
+		(lst_3d_mnp, lst_3d_np),
+		(lst_3d_mnp / 2, lst_3d_np / 2),
+		(lst_3d_mnp[:, ::2, 1], lst_3d_np[:, ::2, 1]),
+		(lst_3d_mnp.transpose(), lst_3d_np.transpose()),
+		(mnp.array([]), np.array([])),
+	]:
+		mnp.save(tmp_path / "array", mnp_array)
+		_check_equality(mnp.load(tmp_path / "array.npy"), np_array)
+		_check_equality(mnp.load(tmp_path / "array.npy", mmap_mode="r"), np_array)
+		np.testing.assert_array_equal(np.load(tmp_path / "array.npy"), np_array)
+
+	# files written by numpy, including fortran order and foreign dtypes
+	for np_array in [
+		lst_3d_np,
+		np.asfortranarray(lst_3d_np / 3),
+		lst_3d_np.astype(np.int32),
+		lst_3d_np.astype(np.float32),
+		lst_3d_np > 6,
+	]:
+		np.save(tmp_path / "numpy.npy", np_array)
+		_check_equality(mnp.load(tmp_path / "numpy.npy"), np_array)
+
+	# memory-mapped writes go to the file
+	mnp.save(tmp_path / "array.npy", lst_3d_mnp)
+	mapped = mnp.load(tmp_path / "array.npy", mmap_mode="r+")
+	mapped[0] += 10
+	del mapped
+	lst_3d_np[0] += 10
+	_check_equality(mnp.load(tmp_path / "array.npy"), lst_3d_np)
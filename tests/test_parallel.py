@@ -0,0 +1,58 @@
+# test operations split across worker processes against numpy
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+from mininumpy.parallel import _SharedArray
+
+lst_3d = [[[1, 2], [3, 4], [5, 6]], [[7, 8], [9, 10], [11, 12]]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert np.allclose(mnp_array.copy().data.tolist(), np_array.flatten().tolist())
+
+
+def test_parallel_operations():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+
+	with mnp.num_workers(2, threshold=4):
+		assert mnp.get_num_workers() == 2
+		_check_equality(lst_3d_mnp.T * lst_3d_mnp[0, :, :1], lst_3d_np.T * lst_3d_np[0, :, :1])
+		_check_equality(mnp.sqrt(lst_3d_mnp), np.sqrt(lst_3d_np))
+		_check_equality(lst_3d_mnp.sum(axis=(0, 2)), lst_3d_np.sum(axis=(0, 2)))
+		_check_equality(lst_3d_mnp.argmax(axis=-1), lst_3d_np.argmax(axis=-1))
+		assert lst_3d_mnp.max() == lst_3d_np.max()
+		assert lst_3d_mnp.mean() == lst_3d_np.mean()
+
+		out_mnp = mnp.zeros((2, 3, 2))
+		lst_3d_mnp.abs(out=out_mnp)
+		_check_equality(out_mnp, lst_3d_np)
+	assert mnp.get_num_workers() == 1
+
+
+def test_staging_views():
+	big_mnp = mnp.arange(0, 10_000, 1).reshape((100, 100))
+	big_np = np.arange(10_000).reshape((100, 100))
+
+	# only the elements of views over part of a buffer are copied into shared memory
+	view = big_mnp[10:20:3, ::-7]
+	shared_memory, shared = _SharedArray.create(view)
+	try:
+		assert shared.length == view.size
+		data = shared_memory.buf[: shared.length * 8].cast(shared.dtype.format)
+		view_copy = Array._from_data(
+			data, shared.shape, shared.dtype, shared.strides, shared.offset
+		)
+		_check_equality(view_copy, big_np[10:20:3, ::-7])
+		del view_copy, data
+	finally:
+		shared_memory.close()
+		shared_memory.unlink()
+
+	with mnp.num_workers(2, threshold=4):
+		_check_equality(view * big_mnp[:4, :15], big_np[10:20:3, ::-7] * big_np[:4, :15])
+		_check_equality(view.sum(axis=1), big_np[10:20:3, ::-7].sum(axis=1))
+		broadcasted = mnp.broadcast_to(mnp.array([1, 2, 3]), (50, 3))
+		_check_equality(broadcasted + 1, np.broadcast_to([1, 2, 3], (50, 3)) + 1)
@@ -0,0 +1,95 @@
+# test the recycling of buffers by the buffer pool
+from array import array
+
+import numpy as np
+
+import mininumpy as mnp
+
+
+def test_pool():
+	mnp.set_pool_limits(max_bytes=0)
+	mnp.set_pool_limits(max_bytes=1 << 20, max_buffers=2, min_bytes=0)
+	try:
+		# buffers of garbage-collected arrays are reused by allocations of the same size
+		a = mnp.ones((4, 5))
+		del a
+		b = mnp.zeros((4, 5))
+		assert mnp.get_pool_stats()[:2] == (1, 1)
+		assert b.sum() == 0
+		assert mnp.empty((4, 5)).shape == (4, 5)
+
+		# buffers still referenced (by views, memoryviews or other arrays) are never reused
+		c = mnp.full((4, 5), 3)
+		view = c[1:]
+		raw = memoryview(mnp.arange(0, 20, 1))
+		del c
+		d = mnp.zeros((20,))
+		assert view.sum() == 45 and raw[-1] == 19 and d.sum() == 0
+		del view, raw
+		assert mnp.zeros((4, 5)).sum() == 0
+		assert (
+			mnp.arange(0, 6, 1).reshape((2, 3)).T.copy() == mnp.array([[0, 3], [1, 4], [2, 5]])
+		).all()
+
+		# least recently released buffers are evicted past the limits
+		arrays = [mnp.zeros((n,)) for n in range(1, 5)]
+		while arrays:
+			del arrays[0]
+		stats = mnp.get_pool_stats()
+		assert stats.buffers_held == 2 and stats.evictions >= 2
+		assert stats.bytes_held == 8 * (3 + 4)
+		mnp.clear_pool()
+		assert mnp.get_pool_stats().bytes_held == 0
+	finally:
+		mnp.set_pool_limits()
+
+
+def test_ufunc_loop():
+	mnp.set_pool_limits(max_bytes=0)
+	mnp.set_pool_limits()
+	try:
+		# the temporaries of each iteration are recycled by the next one
+		a = mnp.arange(0, 10_000, 1).astype(float)
+		b = mnp.ones((10_000,), float)
+		np_a, np_b = np.arange(10_000.0), np.ones(10_000)
+		before = None
+		for _ in range(5):
+			before = before or mnp.get_pool_stats()
+			c = a + b
+			d = c * 2.0
+			e = mnp.sqrt(d)
+			np_e = np.sqrt((np_a + np_b) * 2.0)
+			assert np.allclose(e.data.tolist(), np_e)
+		# past the first iteration (and the first result of the second one, allocated while the
+		# previous temporaries are alive), every temporary reuses a buffer
+		hits, misses = mnp.get_pool_stats()[:2]
+		assert (hits - before.hits, misses - before.misses) == (11, 4)
+
+		# the results of lazy expressions, type conversions and matmul are recycled as well
+		hits = mnp.get_pool_stats().hits
+		del c, d, e
+		assert (a.lazy() + b).compute().data.tolist() == (np_a + np_b).tolist()
+		assert mnp.arange(0, 10_000, 1).astype(float).size == 10_000
+		assert (a.reshape((100, 100)) @ b.reshape((100, 100))).size == 10_000
+		assert mnp.get_pool_stats().hits >= hits + 3
+	finally:
+		mnp.set_pool_limits()
+
+
+def test_foreign_buffers():
+	mnp.set_pool_limits(max_bytes=0)
+	mnp.set_pool_limits(max_bytes=1 << 20, max_buffers=4, min_bytes=0)
+	try:
+		# buffers given to frombuffer belong to the caller, and are never recycled
+		buffer = array("d", [7.0]) * 8192
+		a = mnp.frombuffer(buffer, float)
+		del a
+		assert mnp.get_pool_stats().buffers_held == 0
+		buffer.extend([1.0] * 10)
+		del buffer
+		b = mnp.empty((8192,), float)
+		assert len(b.data) == b.size == 8192
+		del b
+		assert mnp.get_pool_stats().buffers_held == 1
+	finally:
+		mnp.set_pool_limits()
@@ -0,0 +1,79 @@
+# test formatting arrays as text against numpy, ignoring the alignment padding numpy adds
+import io
+import math
+import sys
+
+import numpy as np
+
+import mininumpy as mnp
+
+
+def _strip(text: str) -> str:
+	return "".join(text.split())
+
+
+def test_str():
+	for shape in ((), (0,), (5,), (2, 3, 4), (4, 300), (3, 5, 200)):
+		np_array = np.arange(math.prod(shape)).reshape(shape)
+		mnp_array = mnp.array(np_array.tolist()) if shape else mnp.array(0)
+		assert _strip(str(mnp_array)) == _strip(np.array2string(np_array, separator=","))
+		assert repr(mnp_array) == str(mnp_array)
+		for line in str(mnp_array).splitlines():
+			assert len(line) <= 75
+	# views and broadcasted arrays
+	mnp_array = mnp.arange(0, 2400, 1).reshape((20, 120))
+	np_array = np.arange(2400).reshape((20, 120))
+	assert _strip(str(mnp_array[::-3, 1::2].T)) == _strip(
+		np.array2string(np_array[::-3, 1::2].T, separator=",")
+	)
+	assert str(mnp.broadcast_to(mnp.array([True, False]), (3, 2))) == (
+		"[[True, False],\n [True, False],\n [True, False]]"
+	)
+	assert str(mnp.array([1 / 3, 2.0, float("nan")])) == "[0.33333333, 2.0, nan]"
+
+
+def test_print_options():
+	mnp_array = mnp.arange(0, 24, 1).reshape((2, 3, 4))
+	np_array = np.arange(24).reshape((2, 3, 4))
+	with mnp.printoptions(threshold=5, edgeitems=1):
+		assert mnp.get_printoptions().threshold == 5
+		with np.printoptions(threshold=5, edgeitems=1):
+			assert _strip(str(mnp_array)) == _strip(np.array2string(np_array, separator=","))
+		assert str(mnp_array / 7) == (
+			"[[[0.0, ..., 0.42857143],\n  ...,\n  [1.14285714, ..., 1.57142857]],\n\n"
+			" [[1.71428571, ..., 2.14285714],\n  ...,\n  [2.85714286, ..., 3.28571429]]]"
+		)
+	assert mnp.get_printoptions() == mnp.PrintOptions()
+	assert mnp.array2string(mnp.array([1 / 3]), precision=2) == "[0.33]"
+	for line in mnp.array2string(mnp.arange(0, 100, 1), linewidth=20).splitlines():
+		assert len(line) <= 20
+	try:
+		mnp.set_printoptions(edgeitems=-1)
+		raise AssertionError("negative print options should fail")
+	except ValueError:
+		pass
+
+
+def test_write_array():
+	mnp_array = mnp.arange(0, 5000, 1).reshape((50, 100))
+	np_array = np.arange(5000).reshape((50, 100))
+	file = io.StringIO()
+	mnp.write_array(mnp_array, file)
+	assert _strip(file.getvalue()) == _strip(
+		np.array2string(np_array, separator=",", threshold=sys.maxsize)
+	)
+	file = io.StringIO()
+	mnp.write_array(mnp_array, file, threshold=1000)
+	assert file.getvalue() == str(mnp_array) + "\n"
+
+
+def test_scientific():
+	# floats too small for the precision, or too large, switch to scientific notation
+	assert str(mnp.array([1e-10, 1.0])) == "[1.0e-10, 1.0e+00]"
+	assert str(mnp.array([1e20, -2.5, float("nan"), 0.0])) == "[1.0e+20, -2.5e+00, nan, 0.0e+00]"
+	assert mnp.array2string(mnp.array([1e-3, 0.5]), precision=2) == "[1.0e-03, 5.0e-01]"
+	assert str(mnp.array([0.0, 0.5, float("inf")])) == "[0.0, 0.5, inf]"
+	# only the displayed elements decide
+	with mnp.printoptions(threshold=3, edgeitems=1):
+		values = mnp.array([1.0, 1e-12, 1e20, 2.0])
+		assert str(values) == "[1.0, ..., 2.0]"
@@ -0,0 +1,48 @@
+# test the profiler and the hooks of array operations
+import io
+import json
+
+import pytest
+
+import mininumpy as mnp
+
+
+def test_profile():
+	with mnp.profile() as profile:
+		a = mnp.zeros((4, 5), dtype=float)
+		b = a + 1
+		b.T.copy().sum(axis=0)
+		mnp.dot(b, b.T)
+		mnp.add(a, b, out=a)
+
+	# nested operations (the multiply of dot, the full of zeros) are not recorded
+	assert [event.name for event in profile.events] == [
+		"zeros", "add", "transpose", "copy", "sum", "transpose", "dot", "add"
+	]  # fmt: skip
+	stats = profile.stats()
+	assert stats["add"].count == 2
+	assert stats["add"].nbytes == 4 * 5 * 8  # writing into out allocates nothing
+	assert stats["transpose"].nbytes == 0
+	assert stats["sum"].shapes == {((5, 4),): 1}
+	assert profile.events[0].output_shape == (4, 5)
+	assert profile.report(sort_by="name").splitlines()[1].startswith("add ")
+	with pytest.raises(ValueError):
+		profile.report(sort_by="unknown")
+
+	file = io.StringIO()
+	profile.chrome_trace(file)
+	trace_events = json.loads(file.getvalue())["traceEvents"]
+	assert [event["name"] for event in trace_events] == [event.name for event in profile.events]
+	assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace_events)
+
+	# nothing is recorded outside of the profile, nor by custom hooks once removed
+	calls = []
+	hook = lambda name, *args: calls.append(name)  # noqa: E731
+	mnp.add_hook(hook)
+	mnp.arange(0, 10, 1).max()
+	mnp.remove_hook(hook)
+	mnp.arange(0, 10, 1)
+	assert calls == ["arange", "max"]
+	assert len(profile.events) == 8
+	with pytest.raises(ValueError):
+		mnp.remove_hook(hook)
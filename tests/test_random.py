@@ -0,0 +1,96 @@
+# test the random number generator: reproducibility, ranges, shapes and moments of its draws
+import pickle
+
+import numpy as np
+
+import mininumpy as mnp
+
+
+def _values(array) -> list:
+	return array.copy().data.tolist()
+
+
+def test_streams():
+	rng = mnp.random.default_rng(42)
+	assert mnp.random.default_rng(rng) is rng
+	draws = _values(rng.random(100))
+	assert draws == _values(mnp.random.default_rng(42).random(100))
+	assert draws != _values(mnp.random.default_rng(43).random(100))
+
+	# spawned streams are reproducible, and independent of each other and of their parent
+	children = rng.spawn(2) + rng.spawn(1)
+	assert [child.spawn_key for child in children] == [(0,), (1,), (2,)]
+	child_draws = [_values(child.integers(0, 1 << 32, 50)) for child in children]
+	assert len({tuple(values) for values in child_draws}) == 3
+	assert child_draws[1] == _values(mnp.random.Generator(42, (1,)).integers(0, 1 << 32, 50))
+
+	# generators carry on with the same draws after pickling (e.g. into worker processes)
+	copy = pickle.loads(pickle.dumps(rng))
+	assert _values(copy.normal(size=10)) == _values(rng.normal(size=10))
+
+
+def test_distributions():
+	rng = mnp.random.default_rng(0)
+	size = 100_000
+	assert isinstance(rng.random(), float) and isinstance(rng.integers(5), int)
+
+	for dtype in (mnp.float64, mnp.float32):
+		values = rng.random((10, size // 10), dtype)
+		assert values.shape == (10, size // 10) and values.dtype == dtype
+		assert 0 <= values.min() and values.max() < 1
+	values = _values(rng.uniform(-2, 3, size))
+	assert -2 <= min(values) and max(values) < 3
+	assert np.isclose(np.mean(values), 0.5, atol=0.05)
+	values = _values(rng.normal(1, 2, size + 1))
+	assert len(values) == size + 1
+	assert np.isclose(np.mean(values), 1, atol=0.05) and np.isclose(np.std(values), 2, atol=0.05)
+
+	for low, high, dtype in ((-3, 4, mnp.int8), (0, 256, mnp.uint8), (10, 1 << 40, mnp.int64)):
+		values = rng.integers(low, high, size, dtype)
+		assert values.dtype == dtype and low <= values.min() and values.max() < high
+	counts = np.bincount(_values(rng.integers(1, 6, size, endpoint=True)))
+	assert counts[0] == 0 and np.allclose(counts[1:] / size, 1 / 6, atol=0.01)
+
+	for invalid in (
+		lambda: rng.random(dtype=mnp.int64),
+		lambda: rng.integers(5, 5),
+		lambda: rng.integers(0, 300, dtype=mnp.uint8),
+		lambda: rng.normal(scale=-1),
+		lambda: mnp.random.Generator(-1),
+	):
+		try:
+			invalid()
+			raise AssertionError("invalid draws should fail")
+		except ValueError:
+			pass
+
+
+def test_choice_permutation():
+	rng = mnp.random.default_rng(1)
+	population = mnp.array([[1, 2], [3, 4], [5, 6]])
+	assert rng.choice(population, (4, 5)).shape == (4, 5, 2)
+	draws = _values(rng.choice(mnp.array([1.5, 2.5, 3.5, 4.5]), 10_000, p=[0.5, 0, 0.25, 0.25]))
+	assert 2.5 not in draws and np.isclose(draws.count(1.5) / 10_000, 0.5, atol=0.03)
+
+	sample = _values(rng.choice(10, 10, replace=False))
+	assert sorted(sample) == list(range(10))
+	for _ in range(20):
+		sample = _values(rng.choice(5, 2, replace=False, p=[0.2, 0, 0.3, 0, 0.5]))
+		assert len(set(sample)) == 2 and set(sample) <= {0, 2, 4}
+
+	assert sorted(_values(rng.permutation(100))) == list(range(100))
+	shuffled = rng.permutation(population)
+	assert sorted(_values(shuffled)) == _values(population)
+	assert sorted(shuffled.copy().data.tolist()[::2]) == [1, 3, 5]
+
+	for invalid in (
+		lambda: rng.choice(3, 4, replace=False),
+		lambda: rng.choice(3, p=[0.5, 0.5]),
+		lambda: rng.choice(3, 2, replace=False, p=[1, 0, 0]),
+		lambda: rng.permutation(mnp.array(5)),
+	):
+		try:
+			invalid()
+			raise AssertionError("invalid choices should fail")
+		except ValueError:
+			pass
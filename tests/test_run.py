@@ -1,5 +1,8 @@
 # test my functions against numpy
+import tracemalloc
+
 import numpy as np
+import pytest
 from numpy import ndarray
 
 import mininumpy as mnp
@@ -12,7 +15,7 @@ single_number = 7
 
 
 def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
-	assert mnp_array.data == np_array.flatten().tolist()
+	assert mnp_array.copy().data.tolist() == np_array.flatten().tolist()
 
 
 def test_3d_list():
@@ -37,3 +40,291 @@ def test_normal_list():
 	single_number_mnp = mnp.array(single_number)
 	single_number_np = np.array(single_number)
 	_check_equality(single_number_mnp, single_number_np)
+
+
+def test_typed_buffer():
+	int_array = mnp.array(lst_2d)
+	float_array = int_array / 2
+	assert (int_array.data.format, int_array.data.itemsize) == ("q", 8)
+	assert (float_array.data.format, float_array.data.itemsize) == ("d", 8)
+	_check_equality(float_array, np.array(lst_2d) / 2)
+	_check_equality(int_array.copy(), np.array(lst_2d))
+
+
+def test_views():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+
+	transposed = lst_3d_mnp.transpose((1, 2, 0))
+	assert transposed.data is lst_3d_mnp.data
+	_check_equality(transposed, lst_3d_np.transpose((1, 2, 0)))
+	_check_equality(lst_3d_mnp.T, lst_3d_np.T)
+	for permutation in ((0,), (1, 0), (0, 1, 2, 3)):
+		with pytest.raises(ValueError):
+			lst_3d_mnp.transpose(permutation)
+
+	sliced = lst_3d_mnp[1, ::-2, 1:]
+	assert sliced.data is lst_3d_mnp.data
+	_check_equality(sliced, lst_3d_np[1, ::-2, 1:])
+	assert lst_3d_mnp[1, 2, 0] == lst_3d_np[1, 2, 0]
+
+	reshaped = lst_3d_mnp.reshape((3, 4))
+	assert reshaped.data is lst_3d_mnp.data
+	_check_equality(reshaped, lst_3d_np.reshape((3, 4)))
+	_check_equality(transposed.reshape((12,)), lst_3d_np.transpose((1, 2, 0)).reshape((12,)))
+	_check_equality(transposed + 1, lst_3d_np.transpose((1, 2, 0)) + 1)
+	_check_equality(mnp.ascontiguousarray(sliced), lst_3d_np[1, ::-2, 1:])
+
+
+def test_broadcasting():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+
+	_check_equality(lst_3d_mnp + 1, lst_3d_np + 1)
+	_check_equality(2.5 * lst_3d_mnp, 2.5 * lst_3d_np)
+	_check_equality(1 - lst_3d_mnp, 1 - lst_3d_np)
+	_check_equality(lst_3d_mnp * lst_3d_mnp, lst_3d_np * lst_3d_np)
+	for other in [[10, 20], [[10], [20], [30]], [[[10]], [[20]]]]:
+		_check_equality(lst_3d_mnp + mnp.array(other), lst_3d_np + np.array(other))
+		_check_equality(mnp.array(other) / lst_3d_mnp, np.array(other) / lst_3d_np)
+	_check_equality(lst_3d_mnp.T - lst_3d_mnp[1], lst_3d_np.T - lst_3d_np[1])
+
+
+def test_reductions():
+	negative_np = -np.array(lst_3d)
+	negative_mnp = mnp.array(negative_np.tolist())
+
+	for axis in [0, -1, (0, 2), (1, 2)]:
+		for keepdims in [False, True]:
+			for reduction in ["sum", "prod", "mean", "max", "min", "any", "all"]:
+				_check_equality(
+					getattr(negative_mnp, reduction)(axis=axis, keepdims=keepdims),
+					getattr(negative_np, reduction)(axis=axis, keepdims=keepdims),
+				)
+	for axis in [0, 1, -1]:
+		_check_equality(negative_mnp.T.argmax(axis), negative_np.T.argmax(axis))
+		_check_equality(negative_mnp.T.argmin(axis), negative_np.T.argmin(axis))
+
+	assert negative_mnp.sum() == negative_np.sum()
+	assert negative_mnp.max() == negative_np.max()
+	assert negative_mnp.argmin() == negative_np.argmin()
+
+	# the first NaN of each block is its argmax and argmin
+	nan_np = np.array([[1.0, np.nan, 5.0, np.nan], [-2.0, 4.0, 0.5, 3.0], [7.0, 2.0, 9.0, np.nan]])
+	nan_mnp = mnp.array(nan_np.tolist())
+	for axis in [None, 0, 1]:
+		_check_equality(mnp.asarray(nan_mnp.argmax(axis)), nan_np.argmax(axis))
+		_check_equality(mnp.asarray(nan_mnp.argmin(axis)), nan_np.argmin(axis))
+
+
+def test_in_place_and_out():
+	lst_2d_mnp = mnp.array(lst_2d)
+	lst_2d_np = np.array(lst_2d)
+	data = lst_2d_mnp.data
+
+	lst_2d_mnp += lst_2d_mnp.T
+	lst_2d_np += lst_2d_np.T
+	lst_2d_mnp[:, ::2] *= 3
+	lst_2d_np[:, ::2] *= 3
+	assert lst_2d_mnp.data is data
+	_check_equality(lst_2d_mnp, lst_2d_np)
+
+	out_mnp = mnp.zeros((2, 3)) * 1.0
+	mnp.sqrt(mnp.array([1, 4, 9]), out=out_mnp)
+	_check_equality(out_mnp, np.sqrt(np.broadcast_to(np.array([1, 4, 9]), (2, 3))))
+	mnp.add(out_mnp, 1, out=out_mnp)
+	_check_equality(out_mnp, np.sqrt(np.broadcast_to(np.array([1, 4, 9]), (2, 3))) + 1)
+
+	sum_mnp = mnp.zeros((3,))
+	assert lst_2d_mnp.sum(axis=0, out=sum_mnp) is sum_mnp
+	_check_equality(sum_mnp, lst_2d_np.sum(axis=0))
+
+	with pytest.raises(ValueError):
+		lst_2d_mnp /= 2
+	with pytest.raises(ValueError):
+		mnp.add(lst_2d_mnp, 1, out=sum_mnp)
+
+
+def test_matmul():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+	lst_2d_mnp = mnp.array(lst_2d) / 2
+	lst_2d_np = np.array(lst_2d) / 2
+
+	_check_equality(lst_2d_mnp @ lst_2d_mnp.T, lst_2d_np @ lst_2d_np.T)
+	_check_equality(lst_3d_mnp @ lst_3d_mnp[0].T, lst_3d_np @ lst_3d_np[0].T)
+	_check_equality(mnp.matmul(lst_2d_mnp[0], lst_2d_mnp), np.matmul(lst_2d_np[0], lst_2d_np))
+	_check_equality(mnp.dot(lst_3d_mnp, lst_3d_mnp[0, 0]), np.dot(lst_3d_np, lst_3d_np[0, 0]))
+	_check_equality(
+		mnp.dot(lst_3d_mnp, lst_3d_mnp.transpose((1, 0, 2))),
+		np.dot(lst_3d_np, lst_3d_np.transpose((1, 0, 2))),
+	)
+	assert mnp.dot(lst_2d_mnp[1], lst_2d_mnp[2]) == np.dot(lst_2d_np[1], lst_2d_np[2])
+
+	with pytest.raises(ValueError):
+		lst_3d_mnp @ lst_3d_mnp
+	with pytest.raises(ValueError):
+		mnp.dot(lst_3d_mnp, lst_3d_mnp.T)
+
+
+def test_constructors():
+	_check_equality(mnp.zeros((2, 3)), np.zeros((2, 3), dtype=int))
+	_check_equality(mnp.ones(4, dtype=float), np.ones(4))
+	_check_equality(mnp.full((2, 2), 2.5), np.full((2, 2), 2.5))
+	_check_equality(mnp.full((3,), True), np.full((3,), True))
+	_check_equality(mnp.eye(3), np.eye(3, dtype=int))
+	_check_equality(mnp.eye(2, dtype=bool), np.eye(2, dtype=bool))
+	_check_equality(mnp.arange(1, 10, 3), np.arange(1, 10, 3))
+	_check_equality(mnp.arange(0, 1, 0.1), np.arange(0, 1, 0.1))
+	_check_equality(mnp.linspace(0, 1, 4), np.linspace(0, 1, 4, endpoint=False))
+
+	lst_3d_mnp = mnp.array(lst_3d)
+	assert mnp.zeros_like(lst_3d_mnp).shape == (2, 3, 2)
+	assert mnp.ones_like(lst_3d_mnp, dtype=float).dtype == float
+	assert mnp.empty((0, 3)).size == 0
+	with pytest.raises(ValueError):
+		mnp.zeros((2, -1))
+	with pytest.raises(ValueError):
+		mnp.ones((2,), dtype=str)
+
+	# buffers are allocated once, without intermediate copies
+	for constructor in (mnp.zeros, mnp.ones, mnp.empty):
+		tracemalloc.start()
+		try:
+			array = constructor((512, 1024), dtype=float)
+			peak = tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+		assert peak < 1.1 * array.data.nbytes
+		del array
+
+
+def test_ingestion():
+	_check_equality(mnp.array([[1, 2.5], [True, 4]]), np.array([[1, 2.5], [True, 4]]))
+	assert mnp.array([[True], [False]]).dtype == bool
+	assert mnp.array([[[], []]]).shape == (1, 2, 0)
+	with pytest.raises(ValueError):
+		mnp.array([[1, 2], [3]])
+	with pytest.raises(ValueError):
+		mnp.array([[1, 2], 3])
+	with pytest.raises(ValueError):
+		mnp.array([1, "2"])
+
+	# subclasses of int and float are accepted as such
+	class Count(int):
+		pass
+
+	_check_equality(
+		mnp.array([[np.float64(1.5), 2], [Count(3), True]]), np.array([[1.5, 2], [3, 1]])
+	)
+	assert mnp.array([Count(1), Count(2)]).dtype == int
+	assert mnp.array(np.float64(3.0)).shape == () and mnp.asarray(np.float64(3.0)).dtype == float
+
+	_check_equality(mnp.fromiter((x * x for x in range(5)), float), np.arange(5.0) ** 2)
+	_check_equality(mnp.fromiter(iter(range(10)), int, count=3), np.arange(3))
+	with pytest.raises(ValueError):
+		mnp.fromiter(range(2), int, count=3)
+
+	np_array = np.arange(12, dtype=np.float64)
+	from_buffer = mnp.frombuffer(np_array.tobytes(), float, (3, 4))
+	_check_equality(from_buffer, np_array.reshape(3, 4))
+	_check_equality(mnp.frombuffer(bytearray(np_array), float, offset=80), np_array[10:])
+
+
+def test_interop():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+
+	# numpy wraps arrays through the buffer protocol, sharing their memory
+	as_numpy = np.asarray(lst_3d_mnp)
+	np.testing.assert_array_equal(as_numpy, lst_3d_np)
+	as_numpy[0, 0, 0] = 100
+	assert lst_3d_mnp[0, 0, 0] == 100
+	np.testing.assert_array_equal(np.asarray(lst_3d_mnp[:, ::-2]), as_numpy[:, ::-2])
+	np.testing.assert_array_equal(np.asarray(mnp.zeros((0, 3))), np.zeros((0, 3)))
+	assert memoryview(lst_3d_mnp).shape == (2, 3, 2)
+	assert bytes(lst_3d_mnp / 2) == (as_numpy / 2).tobytes()
+
+	# and the other way around, with the strides of numpy's views
+	np_array = np.arange(12.0).reshape(3, 4)
+	for np_view in [np_array, np_array[:, ::2], np_array[::-1].T, np_array[1]]:
+		mnp_view = mnp.asarray(np_view)
+		_check_equality(mnp_view, np_view)
+		assert mnp_view.shape == np_view.shape
+	mnp.asarray(np_array)[0, 0] = -1.0
+	assert np_array[0, 0] == -1.0
+	_check_equality(mnp.asarray(np_array.astype(np.int32)), np_array.astype(int))
+	_check_equality(mnp.asarray(np_array, dtype=int), np_array.astype(int))
+
+	# buffers of non-native byte order are converted
+	for typestr in (">i4", "<i4", ">f8", ">u2", "|u1"):
+		np_foreign = np.arange(-3, 9).reshape(3, 4).astype(typestr)
+		for np_view in [np_foreign, np_foreign[:, ::2]]:
+			mnp_view = mnp.asarray(np_view)
+			_check_equality(mnp_view, np_view)
+			assert mnp_view.shape == np_view.shape and mnp_view.dtype == np_view.dtype.newbyteorder(
+				"="
+			)
+
+
+def test_indexing():
+	np_array = np.arange(60).reshape(3, 4, 5)
+	mnp_array = mnp.asarray(np_array.copy())
+
+	# basic indexing returns views, advanced indexing gathers copies
+	view = mnp_array[None, ..., 1:4:2]
+	assert view.data is mnp_array.data
+	_check_equality(view, np_array[None, ..., 1:4:2])
+	idx = mnp.array([[0, 2], [1, 1]])
+	_check_equality(mnp_array[1, idx], np_array[1, [[0, 2], [1, 1]]])
+	_check_equality(mnp_array[[0, 2], :, [1, -1]], np_array[[0, 2], :, [1, -1]])
+	_check_equality(mnp_array[:, [0, 2], [1, 4]], np_array[:, [0, 2], [1, 4]])
+	_check_equality(mnp_array[mnp_array > 30], np_array[np_array > 30])
+	_check_equality(mnp_array[:, mnp_array[0] >= 7], np_array[:, np_array[0] >= 7])
+	assert mnp_array[mnp.array(1), 2, -1] == np_array[1, 2, -1]
+
+	# assignments broadcast values into the selection
+	mnp_array[mnp_array > 50] = 0
+	np_array[np_array > 50] = 0
+	mnp_array[[2, 0], ..., None] = mnp.array([[[1], [2], [3], [4], [5]]])
+	np_array[[2, 0], ..., None] = np.array([[[1], [2], [3], [4], [5]]])
+	_check_equality(mnp_array, np_array)
+
+	# lists are converted into arrays, and values cast into the array's dtype
+	mnp_array[:, 1, 0] = [9, 8, 7]
+	np_array[:, 1, 0] = [9, 8, 7]
+	mnp_array[0, 0] = 1.0
+	np_array[0, 0] = 1.0
+	mnp_array[[1, 2], 2, 0] = mnp.array([2.7, -3.9])
+	np_array[[1, 2], 2, 0] = np.array([2.7, -3.9])
+	mnp_array[2, 3, :2] = [True, False]
+	np_array[2, 3, :2] = [True, False]
+	_check_equality(mnp_array, np_array)
+	assert mnp_array.dtype is mnp.int64
+
+	with pytest.raises(IndexError):
+		mnp_array[0, 0, 0, 0]
+	with pytest.raises(IndexError):
+		mnp_array[[0, 3]]
+	with pytest.raises(IndexError):
+		mnp_array[mnp.array([True, False])]
+
+
+def test_truth_value():
+	np_array = np.arange(6).reshape(2, 3)
+	mnp_array = mnp.asarray(np_array.copy())
+
+	# size-1 arrays are as true as their element, the truth value of any other is ambiguous
+	assert bool(mnp_array[1:, 2:] == 5) and not mnp.array([[0]])
+	assert bool(mnp_array[0, :1] == np_array[0, :1]) == bool(np_array[0, :1] == np_array[0, :1])
+	for array in (mnp_array == mnp_array, mnp.array([])):
+		with pytest.raises(ValueError):
+			bool(array)
+	with pytest.raises(ValueError):
+		if mnp_array > 2:
+			pass
+
+	# membership compares the value with every element
+	assert 4 in mnp_array and 4 in np_array
+	assert 7 not in mnp_array and 7 not in np_array
+	assert ([3, 4, 5] in mnp_array) == ([3, 4, 5] in np_array)
@@ -0,0 +1,85 @@
+# test sorting, partitioning, searchsorted and unique against numpy
+import random
+
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+lst_3d = [[[3, 1, 2], [1, 1, 0]], [[3, 1, 2], [0, 5, 5]]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	# NaNs compare equal to each other
+	assert mnp_array.shape == np_array.shape
+	np.testing.assert_array_equal(mnp_array.copy().data.tolist(), np_array.flatten())
+
+
+def test_sort():
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+	for mnp_array, np_array in [
+		(lst_3d_mnp, lst_3d_np),
+		(lst_3d_mnp.transpose((2, 0, 1)), lst_3d_np.transpose((2, 0, 1))),
+		(lst_3d_mnp[:, ::-1, 1:] / 2, lst_3d_np[:, ::-1, 1:] / 2),
+	]:
+		for axis in (0, 1, -1, None):
+			_check_equality(mnp.sort(mnp_array, axis), np.sort(np_array, axis))
+			_check_equality(mnp.argsort(mnp_array, axis), np.argsort(np_array, axis, stable=True))
+
+	# in place, with NaNs last
+	floats = [3.0, float("nan"), 1.0, float("nan"), -2.0]
+	mnp_floats = mnp.array(floats)
+	mnp_floats.sort()
+	_check_equality(mnp_floats, np.sort(floats))
+	_check_equality(mnp.argsort(mnp.array(floats)), np.argsort(floats, stable=True))
+
+
+def test_partition():
+	values = [random.random() for _ in range(1000)] + [0.5] * 10
+	sorted_values = sorted(values)
+	mnp_values = mnp.array(values)
+	# both selections through a heap and through a full sort
+	for kth in (0, 3, 500, 995, -1):
+		partitioned = mnp.partition(mnp_values, kth).copy().data.tolist()
+		assert partitioned[kth] == sorted_values[kth]
+		assert max(partitioned[:kth] or [0]) <= partitioned[kth] <= min(partitioned[kth:])
+		indices = mnp.argpartition(mnp_values, kth).copy().data.tolist()
+		assert sorted(indices) == list(range(len(values)))
+		assert values[indices[kth]] == sorted_values[kth]
+
+	# along other axes, and in place
+	lst_3d_mnp = mnp.array(lst_3d)
+	for axis in (0, 1, 2):
+		for kth in range(lst_3d_mnp.shape[axis]):
+			np_sorted = np.sort(lst_3d, axis)
+			key = (slice(None),) * axis + (kth,)
+			_check_equality(mnp.partition(lst_3d_mnp, kth, axis)[key], np_sorted[key])
+	lst_3d_mnp.partition(1, axis=1)
+	_check_equality(lst_3d_mnp, np.sort(lst_3d, 1))
+
+
+def test_searchsorted_unique():
+	sorted_mnp = mnp.array([1, 2, 2, 3, 5])
+	sorted_np = np.array([1, 2, 2, 3, 5])
+	for side in ("left", "right"):
+		assert mnp.searchsorted(sorted_mnp, 2, side) == np.searchsorted(sorted_np, 2, side)
+		_check_equality(
+			mnp.searchsorted(sorted_mnp, mnp.array([[0, 4], [2, 9]]), side),
+			np.searchsorted(sorted_np, [[0, 4], [2, 9]], side),
+		)
+
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+	_check_equality(mnp.unique(lst_3d_mnp), np.unique(lst_3d_np))
+	for axis in (None, 0, 1, 2):
+		results = mnp.unique(lst_3d_mnp, True, True, True, axis=axis)
+		for mnp_result, np_result in zip(results, np.unique(lst_3d_np, True, True, True, axis)):
+			_check_equality(mnp_result, np_result)
+	floats = [1.0, float("nan"), 1.0, float("nan")]
+	_check_equality(mnp.unique(mnp.array(floats)), np.unique(floats))
+	for mnp_result, np_result in zip(
+		mnp.unique(mnp.array(floats), return_counts=True), np.unique(floats, return_counts=True)
+	):
+		_check_equality(mnp_result, np_result)
@@ -0,0 +1,79 @@
+# test sparse matrices against dense numpy arrays
+import numpy as np
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy import sparse
+from mininumpy.array import Array
+
+lst_sparse = [[0, 2, 0, 0], [1, 0, 0, 0], [0, 0, 0, 0], [0, 0, 3, -4], [0, 5, 0, 0]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert mnp_array.shape == np_array.shape
+	assert mnp_array.copy().data.tolist() == np_array.flatten().tolist()
+
+
+def test_conversions():
+	np_dense = np.array(lst_sparse)
+	for matrix in (sparse.CSR.from_dense(mnp.array(lst_sparse)), sparse.COO.from_dense(lst_sparse)):
+		assert matrix.shape == (5, 4) and matrix.nnz == 5
+		_check_equality(matrix.to_dense(), np_dense)
+		_check_equality(matrix.tocsr().to_dense(), np_dense)
+		_check_equality(matrix.tocoo().to_dense(), np_dense)
+		_check_equality(matrix.T.to_dense(), np_dense.T)
+
+	# coordinates in any order, with duplicates summed
+	coo = sparse.COO([1.5, 2, 3, 4], [3, 0, 3, 1], [2, 1, 2, 0], (4, 3))
+	np_dense = np.zeros((4, 3))
+	np_dense[3, 2], np_dense[0, 1], np_dense[1, 0] = 4.5, 2, 4
+	_check_equality(coo.to_dense(), np_dense)
+	csr = coo.tocsr()
+	assert csr.nnz == 3 and csr.indptr.copy().data.tolist() == [0, 1, 2, 2, 3]
+	_check_equality(sparse.CSR(csr.data, csr.indices, csr.indptr, (4, 3)).to_dense(), np_dense)
+
+	# memory proportional to the stored elements
+	identity = sparse.eye(1000)
+	_check_equality(sparse.eye(4, float).to_dense(), np.eye(4))
+	assert identity.nbytes < 20_000 < mnp.eye(1000).data.nbytes
+
+	for invalid in (
+		lambda: sparse.COO([1], [5], [0], (5, 4)),
+		lambda: sparse.COO([1, 2], [0], [0], (5, 4)),
+		lambda: sparse.CSR([1], [0], [0, 2], (1, 4)),
+		lambda: sparse.CSR.from_dense(mnp.array([1, 2])),
+	):
+		try:
+			invalid()
+			raise AssertionError("invalid sparse matrix should fail")
+		except ValueError:
+			pass
+
+
+def test_operations():
+	np_dense = np.array(lst_sparse)
+	vector = [1.5, -1, 2, 3]
+	matrix = [[1, 2], [3, 4], [5, 6], [7, 8]]
+	for sparse_matrix in (sparse.CSR.from_dense(lst_sparse), sparse.COO.from_dense(lst_sparse)):
+		# elementwise operations with scalars
+		_check_equality((sparse_matrix * 3).to_dense(), np_dense * 3)
+		_check_equality((2 * sparse_matrix).to_dense(), 2 * np_dense)
+		_check_equality((sparse_matrix / 2).to_dense(), np_dense / 2)
+		_check_equality((sparse_matrix**2).to_dense(), np_dense**2)
+		_check_equality((-abs(sparse_matrix) + 0).to_dense(), -abs(np_dense))
+		for dense_operation in (lambda: sparse_matrix + 1, lambda: sparse_matrix**0):
+			try:
+				dense_operation()
+				raise AssertionError("operations densifying the matrix should fail")
+			except ValueError:
+				pass
+
+		# products with dense vectors and matrices
+		_check_equality(sparse_matrix @ mnp.array(vector), np_dense @ vector)
+		_check_equality(sparse_matrix.dot(mnp.array(matrix)), np_dense @ matrix)
+		_check_equality(sparse_matrix.T @ mnp.arange(0, 5, 1), np_dense.T @ np.arange(5))
+
+		# sums
+		assert sparse_matrix.sum() == np_dense.sum()
+		for axis in (0, 1, -1):
+			_check_equality(sparse_matrix.sum(axis), np_dense.sum(axis))
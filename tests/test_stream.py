@@ -0,0 +1,38 @@
+# test chunked streaming reductions against numpy
+import numpy as np
+import pytest
+
+import mininumpy as mnp
+
+lst_3d = [[[1, 2], [3, 4], [5, 6]], [[7, 8], [9, 10], [11, 12]], [[13, 14], [15, 16], [17, 18]]]
+
+
+def test_stream_reductions(tmp_path):
+	lst_3d_mnp = mnp.array(lst_3d)
+	lst_3d_np = np.array(lst_3d)
+	mnp.save(tmp_path / "array.npy", lst_3d_mnp)
+
+	for source in [lst_3d_mnp, tmp_path / "array.npy", lst_3d, lambda: iter(lst_3d_mnp[:, 0])]:
+		# generators can only be consumed once, so one is created per reduction
+		def stream():
+			return mnp.stream(source() if callable(source) else source, chunk_rows=2)
+
+		lst_np = lst_3d_np[:, 0] if callable(source) else lst_3d_np
+		assert stream().sum() == lst_np.sum()
+		assert stream().mean(axis=0).data.tolist() == lst_np.mean(axis=0).flatten().tolist()
+		assert stream().max(axis=0).data.tolist() == lst_np.max(axis=0).flatten().tolist()
+		assert stream().min(axis=0, keepdims=True).shape == (1, *lst_np.shape[1:])
+
+	# elementwise operations are applied chunk by chunk, before the fold
+	stream = mnp.stream(tmp_path / "array.npy", chunk_rows=2)
+	result = ((stream * 2 + stream) / 4).sqrt().sum(axis=0)
+	expected = np.sqrt((lst_3d_np * 2 + lst_3d_np) / 4).sum(axis=0)
+	assert np.allclose(result.data.tolist(), expected.flatten().tolist())
+	assert stream.map(lambda chunk: chunk - 1).max() == lst_3d_np.max() - 1
+
+	# mixed rows are promoted, and the streamed axis must be reduced
+	assert mnp.stream([1, 2.5, 3], chunk_rows=2).sum() == 6.5
+	with pytest.raises(ValueError):
+		mnp.stream(lst_3d_mnp).sum(axis=1)
+	with pytest.raises(ValueError):
+		mnp.stream([]).max()
@@ -0,0 +1,61 @@
+# test ufuncs and their methods against numpy
+import numpy as np
+import pytest
+from numpy import ndarray
+
+import mininumpy as mnp
+from mininumpy.array import Array
+
+lst_2d = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+
+
+def _check_equality(mnp_array: Array, np_array: ndarray) -> None:
+	assert mnp_array.shape == np_array.shape
+	assert np.allclose(mnp_array.copy().data.tolist(), np_array.flatten().tolist())
+
+
+def test_ufunc_call():
+	lst_2d_mnp = mnp.array(lst_2d)
+	lst_2d_np = np.array(lst_2d)
+
+	_check_equality(mnp.maximum(lst_2d_mnp, [6, 0, 6, 0]), np.maximum(lst_2d_np, [6, 0, 6, 0]))
+	_check_equality(lst_2d_mnp // 5 + 7 % lst_2d_mnp, lst_2d_np // 5 + 7 % lst_2d_np)
+	_check_equality(-abs(lst_2d_mnp - 6), -abs(lst_2d_np - 6))
+	assert mnp.less(lst_2d_mnp, 7).dtype == bool
+	assert mnp.add(2, 3) == 5
+
+	# where= only computes the selected elements, the rest of out is kept
+	out_mnp = mnp.ones((3, 4))
+	out_np = np.ones((3, 4), dtype=int)
+	mnp.multiply(lst_2d_mnp, 10, out=out_mnp, where=lst_2d_mnp > 6)
+	np.multiply(lst_2d_np, 10, out=out_np, where=lst_2d_np > 6)
+	_check_equality(out_mnp, out_np)
+	with pytest.raises(ValueError):
+		mnp.add(lst_2d_mnp, 1.5, out=out_mnp)
+
+	# arrays defer to lazy operands
+	lazy_sum = lst_2d_mnp + lst_2d_mnp.lazy()
+	assert isinstance(lazy_sum, mnp.LazyArray)
+	_check_equality(mnp.sqrt(lazy_sum).compute(), np.sqrt(lst_2d_np * 2))
+
+
+def test_ufunc_methods():
+	lst_2d_mnp = mnp.array(lst_2d)
+	lst_2d_np = np.array(lst_2d)
+
+	_check_equality(mnp.add.reduce(lst_2d_mnp), np.add.reduce(lst_2d_np))
+	_check_equality(
+		mnp.multiply.reduce(lst_2d_mnp, axis=1, keepdims=True),
+		np.multiply.reduce(lst_2d_np, axis=1, keepdims=True),
+	)
+	assert mnp.minimum.reduce(lst_2d_mnp, axis=None) == 1
+	_check_equality(mnp.add.accumulate(lst_2d_mnp, axis=1), np.add.accumulate(lst_2d_np, axis=1))
+	_check_equality(mnp.divide.accumulate(lst_2d_mnp), np.divide.accumulate(lst_2d_np))
+	_check_equality(
+		mnp.subtract.outer(lst_2d_mnp[0], lst_2d_mnp[:, 1]),
+		np.subtract.outer(lst_2d_np[0], lst_2d_np[:, 1]),
+	)
+	with pytest.raises(ValueError):
+		mnp.maximum.reduce(mnp.zeros((0, 2)))
+	with pytest.raises(ValueError):
+		mnp.exp.reduce(lst_2d_mnp)